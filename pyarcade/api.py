@@ -1,7 +1,7 @@
 from flask import request, flash
 from flask_sqlalchemy import SQLAlchemy
 from flask_restful import Api, Resource
-from flask import Flask, render_template, redirect, url_for
+from flask import Flask, Response, render_template, redirect, url_for
 from flask_bootstrap import Bootstrap
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, BooleanField
@@ -10,14 +10,34 @@ from flask_login import LoginManager, UserMixin, login_user, login_required, \
     logout_user, current_user
 from typing import List
 from pyarcade.input_system import InputSystem
+from pyarcade.games.mastermind import get_user_stats
+from pyarcade.games.card import Suit, parse_card, parse_suit
+from pyarcade.tables import TableService
+from pyarcade.matchmaking import Matchmaker, DEFAULT_RATING
+from pyarcade.scores import PlaySessions, ScoreClaim, ScoreVerifier, PENDING
+from pyarcade.leaderboard import Leaderboard, ScoreRecord, LEADERBOARD_SIZE, \
+    ALL_TIME, PERIODS, utc_now, window_start
+from pyarcade.percentiles import ScoreHistograms
+from pyarcade.replay import Recorder
+from collections import OrderedDict
+from concurrent import futures
+from datetime import datetime
+import json
+import os
 import pickle
+import threading
 
-input_system = InputSystem()
+table_service = TableService()
+matchmaker = Matchmaker(table_service)
+matchmaking_requests = {}  # username to the future of their queued request
 app = Flask(__name__)
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'd9eae96b0e36281c7de5759e5d1aa7740426000710b2db47'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'mysql+pymysql://root@db:3306/pyarcadedb'
+app.config['SCORE_HISTOGRAMS_PATH'] = os.path.join(app.instance_path, 'score_histograms.json')
+# Log the games of play sessions are recorded to, to replay with pyarcade-replay.
+app.config['RECORDINGS_PATH'] = os.path.join(app.instance_path, 'recordings.log')
 
 bootstrap = Bootstrap(app)
 db = SQLAlchemy(app)
@@ -187,6 +207,8 @@ class HighScore(db.Model):
     game_name = db.Column(db.String(32), nullable=False)
     score = db.Column(db.Integer, nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('Users.id'), nullable=False)
+    # UTC time the score was earned, to show the best scores of a day or week.
+    created_at = db.Column(db.DateTime, nullable=False, default=utc_now, index=True)
 
 
 class HighScoreListResource(Resource):
@@ -203,34 +225,167 @@ class HighScoreListResource(Resource):
             "id": high_score.id,
             "game_name": high_score.game_name,
             "score": high_score.score,
-            "user_id": high_score.user_id
+            "user_id": high_score.user_id,
+            "created_at": high_score.created_at.isoformat()
         } for high_score in HighScore.query.all()]
 
     def post(self) -> dict:
-        """Add a high score.
+        """Submit a high score with the seeded game that earned it:
+        {"game": "minesweeper", "score": ..., "user_id": ..., "seed": ...,
+        "inputs": [...], "seconds": ...}. The seed is the one the server gave
+        the user's play session, and the game must have ended there with the
+        score; it is timed by the server, so "seconds" is optional. The game
+        is replayed in the background and the score is only added if the
+        game earned it.
 
         Returns:
-            dict: high score that is created
+            dict: id to look up the verification by, with status 202
         """
-        new_high_score = HighScore(
-            game_name=request.json["game_name"],
-            score=request.json["score"],
-            user_id=request.json["user_id"
-            ])
-        db.session.add(new_high_score)
+        try:
+            claim = ScoreClaim(game=request.json["game"], user_id=int(request.json["user_id"]),
+                               score=int(request.json["score"]), seed=int(request.json["seed"]),
+                               inputs=tuple(str(user_input) for user_input in request.json["inputs"]),
+                               seconds=float(request.json.get("seconds", 0)))
+            claim = play_sessions.check_claim(claim)
+            verification_id = score_verifier.submit(claim)
+        except (KeyError, TypeError, ValueError) as error:
+            return {"error": "Invalid score: {}".format(error)}, 400
+        if verification_id is None:
+            return {"error": "Too many scores are being verified"}, 503
+        return {"status": PENDING, "verification_id": verification_id}, 202
+
+
+def store_high_score(claim: ScoreClaim) -> int:
+    """Add a verified high score.
+
+    Args:
+        claim (ScoreClaim): verified score
+
+    Returns:
+        int: id of the high score
+    """
+    record = ScoreRecord(claim.game, claim.user_id, claim.score, utc_now())
+    with app.app_context():
+        high_score = HighScore(game_name=InputSystem.get_supported_games()[claim.game],
+                               score=claim.score, user_id=claim.user_id, created_at=record.created_at)
+        db.session.add(high_score)
         db.session.commit()
+        high_score_id = high_score.id
+    leaderboard.add([record])
+    score_histograms.add_records([record], high_score_id)
+    return high_score_id
+
+
+# Time given to the high scores written before the time they were earned was
+# kept, which puts them on the all-time leaderboards only.
+LEGACY_CREATED_AT = datetime(1970, 1, 1)
+
+
+def upgrade_high_scores(engine=None):
+    """Add the created_at column to a HighScores table made before it was
+    kept, since db.create_all() does not change existing tables. The high
+    scores already there are given LEGACY_CREATED_AT.
+
+    Args:
+        engine (Engine, optional): database to upgrade. Defaults to None
+        (the app's).
+    """
+    engine = engine or db.engine
+    table = HighScore.__table__
+    columns = {column['name'] for column in db.inspect(engine).get_columns(table.name)}
+    if 'created_at' in columns:
+        return
+    with engine.begin() as connection:
+        connection.execute(db.text("ALTER TABLE {} ADD COLUMN created_at DATETIME NOT NULL DEFAULT '{}'".format(
+            table.name, LEGACY_CREATED_AT.isoformat(' '))))
+    for index in table.indexes:
+        if 'created_at' in index.columns:
+            index.create(engine)
+
+
+def seed_score_histograms():
+    """Load the saved score histograms, add the high scores written since
+    they were saved, and keep saving them in the background.
+    """
+    path = app.config['SCORE_HISTOGRAMS_PATH']
+    score_histograms.load(path)
+    subdirs = {name: subdir for subdir, name in InputSystem.get_supported_games().items()}
+    # Count each score once rather than reading every row.
+    counts = db.session.query(HighScore.game_name, HighScore.score,
+                              db.func.count(HighScore.id), db.func.max(HighScore.id)) \
+        .filter(HighScore.id > score_histograms.last_id) \
+        .group_by(HighScore.game_name, HighScore.score)
+    for game_name, score, count, high_score_id in counts:
+        if game_name in subdirs:
+            score_histograms.add(subdirs[game_name], score, count, high_score_id)
+    score_histograms.start_saving(path)
+
+
+score_verifier = ScoreVerifier(store_high_score)
+play_sessions = PlaySessions()
+recorder = Recorder()
+leaderboard = Leaderboard()
+score_histograms = ScoreHistograms()
+
+
+class HighScoreVerificationResource(Resource):
+    """Respond to REST API requests GET at
+    /high_scores/verifications/<int:verification_id>.
+    """
+
+    def get(self, verification_id: int) -> dict:
+        """Get the status of a submitted high score.
+
+        Args:
+            verification_id (int): id returned when the score was submitted
+
+        Returns:
+            dict: pending, accepted with the high score's id, or rejected
+            with the reason
+        """
+        status = score_verifier.get_status(verification_id)
+        if not status:
+            return {"error": "No such verification"}, 404
+        return status
+
+
+class HighScorePercentileResource(Resource):
+    """Respond to REST API requests GET at /high_scores/<game>/percentile.
+    """
+
+    def get(self, game: str) -> dict:
+        """Estimate how a score compares with the game's high scores, e.g. for
+        "you beat 93% of players", given as ?score=...
+
+        Args:
+            game (str): subdirectory of the game
+
+        Returns:
+            dict: percentage of high scores lower than the score, the place
+            it would take and the number of high scores
+        """
+        if game not in InputSystem.get_supported_games():
+            return {"error": "No such game"}, 404
+        try:
+            score = int(request.args["score"])
+        except (KeyError, ValueError):
+            return {"error": "score must be an integer"}, 400
+        histogram = score_histograms.get_histogram(game)
         return {
-            "id": new_high_score.id,
-            "game_name": new_high_score.game_name,
-            "score": new_high_score.score,
-            "user_id": new_high_score.user_id
+            "game": game,
+            "score": score,
+            "percentile": round(histogram.percentile(score), 1),
+            "rank": histogram.rank(score),
+            "total": histogram.total
         }
 
 
 class HighScoreResource(Resource):
     """Respond to REST API requests GET, PATCH, and DELETE at the specific URL
-    /high_scores/<int:high_score_id>.
+    /high_scores/<int:high_score_id>. Only the user a high score belongs to
+    can change or delete it.
     """
+    method_decorators = {'patch': [login_required], 'delete': [login_required]}
 
     def get(self, high_score_id: int) -> dict:
         """Get a high score specified by high_score_id.
@@ -245,11 +400,13 @@ class HighScoreResource(Resource):
         return {
             "game_name": high_score.game_name,
             "score": high_score.score,
-            "user_id": high_score.user_id
+            "user_id": high_score.user_id,
+            "created_at": high_score.created_at.isoformat()
         }
 
     def patch(self, high_score_id: int) -> dict:
-        """Update an existing high score.
+        """Update an existing high score of the current user. A score can only
+        be lowered; a higher one has to be claimed and verified.
 
         Args:
             high_score_id (int): ID of the high score to update
@@ -258,8 +415,18 @@ class HighScoreResource(Resource):
            dict: information associated with the updated high score
         """
         high_score = HighScore.query.get_or_404(high_score_id)
-        high_score.score = request.json['score']
+        if high_score.user_id != current_user.id:
+            return {"error": "Not your high score"}, 403
+        try:
+            score = int(request.json['score'])
+        except (KeyError, TypeError, ValueError) as error:
+            return {"error": "Invalid score: {}".format(error)}, 400
+        if score > high_score.score:
+            return {"error": "Higher scores have to be verified"}, 403
+        old_score = high_score.score
+        high_score.score = score
         db.session.commit()
+        high_score_changed(high_score, old_score)
         return {
             "game_name": high_score.game_name,
             "score": high_score.score,
@@ -267,7 +434,7 @@ class HighScoreResource(Resource):
         }
 
     def delete(self, high_score_id: int):
-        """Delete an existing high score.
+        """Delete an existing high score of the current user.
 
         Args:
             high_score_id (int): ID of the high score to delete
@@ -276,8 +443,11 @@ class HighScoreResource(Resource):
            dict: information associated with the deleted high score
         """
         high_score = HighScore.query.get_or_404(high_score_id)
+        if high_score.user_id != current_user.id:
+            return {"error": "Not your high score"}, 403
         db.session.delete(high_score)
         db.session.commit()
+        high_score_changed(high_score, high_score.score, deleted=True)
         return {
                    "game_name": high_score.game_name,
                    "score": high_score.score,
@@ -285,10 +455,33 @@ class HighScoreResource(Resource):
                }, 204
 
 
+def high_score_changed(high_score: HighScore, old_score: int, deleted: bool = False):
+    """Have the leaderboards of a game loaded again after one of its high
+    scores changed, and move the score in the game's histogram.
+
+    Args:
+        high_score (HighScore): high score that changed
+        old_score (int): score before the change
+        deleted (bool, optional): whether the high score was deleted.
+        Defaults to False.
+    """
+    for subdir, name in InputSystem.get_supported_games().items():
+        if name == high_score.game_name:
+            leaderboard.forget(subdir)
+            if high_score.id > score_histograms.last_id:
+                return  # the histograms will count it when they are seeded
+            score_histograms.remove(subdir, old_score)
+            if not deleted:
+                score_histograms.add(subdir, high_score.score)
+
+
 # General high score requests can be made at /high_scores.
 api.add_resource(HighScoreListResource, '/high_scores')
 # Specific high score requests can be made using a high score ID.
 api.add_resource(HighScoreResource, '/high_scores/<int:high_score_id>')
+# Submitted high scores are checked on at /high_scores/verifications.
+api.add_resource(HighScoreVerificationResource, '/high_scores/verifications/<int:verification_id>')
+api.add_resource(HighScorePercentileResource, '/high_scores/<game>/percentile')
 
 
 class Friend(db.Model):
@@ -445,6 +638,246 @@ api.add_resource(FavoritesListResource, '/favorites')
 api.add_resource(FavoritesResource, '/favorites/<int:user_id>')
 
 
+class TableListResource(Resource):
+    """Respond to REST API requests POST at the generic URL /tables, which
+    opens multiplayer Crazy Eights tables.
+    """
+    decorators = [login_required]
+
+    def post(self) -> dict:
+        """Open a table and seat the current user at it.
+
+        Returns:
+            dict: id of the table and seat of the user
+        """
+        try:
+            num_players = int(request.json.get("num_players", 2))
+        except (AttributeError, TypeError, ValueError):
+            return {"error": "Invalid number of players"}, 400
+        if num_players < 2 or num_players > 7:
+            return {"error": "Tables seat 2 to 7 players"}, 400
+        table = table_service.create_table(num_players)
+        return {"table_id": table.table_id, "seat": table.join(current_user.username)}
+
+
+class TableResource(Resource):
+    """Respond to REST API requests GET, POST, and DELETE at the specific URL
+    /tables/<int:table_id>.
+    """
+    decorators = [login_required]
+
+    def get(self, table_id: int) -> dict:
+        """Get the state of a table as seen from the current user's seat.
+
+        Args:
+            table_id (int): ID of the table
+
+        Returns:
+            dict: state of the table
+        """
+        table = table_service.get_table(table_id)
+        if not table:
+            return {"error": "No such table"}, 404
+        return table.state(table_seat(table))
+
+    def post(self, table_id: int) -> dict:
+        """Seat the current user at a table.
+
+        Args:
+            table_id (int): ID of the table to join
+
+        Returns:
+            dict: seat of the user
+        """
+        table = table_service.get_table(table_id)
+        if not table:
+            return {"error": "No such table"}, 404
+        seat = table.join(current_user.username)
+        if not seat:
+            return {"error": "Table is full"}, 409
+        return {"table_id": table_id, "seat": seat}
+
+    def delete(self, table_id: int) -> dict:
+        """Close a table the current user is seated at, ending its game and
+        event streams.
+
+        Args:
+            table_id (int): ID of the table to close
+
+        Returns:
+            dict: id of the closed table
+        """
+        table = table_service.get_table(table_id)
+        if not table:
+            return {"error": "No such table"}, 404
+        if not table_seat(table):
+            return {"error": "Not seated at this table"}, 403
+        table_service.close_table(table_id)
+        return {"table_id": table_id}
+
+
+class TableMoveResource(Resource):
+    """Respond to REST API requests POST at /tables/<int:table_id>/moves.
+    Moves are applied in order by the table, and their results are pushed to
+    everyone watching it.
+    """
+    decorators = [login_required]
+
+    def post(self, table_id: int) -> dict:
+        """Make the current user's move: {"card": "draw"} to draw, or e.g.
+        {"card": "eight,spades", "suit": "hearts"} to play a card.
+
+        Args:
+            table_id (int): ID of the table
+
+        Returns:
+            dict: the move as pushed to the table
+        """
+        table = table_service.get_table(table_id)
+        if not table:
+            return {"error": "No such table"}, 404
+        seat = table_seat(table)
+        if not seat:
+            return {"error": "Not seated at this table"}, 403
+
+        card = None
+        set_suit = Suit.SPADES
+        try:
+            card_input = request.json.get("card", "draw")
+            if card_input.lower() != "draw":
+                card = parse_card(card_input)
+                if not card:
+                    return {"error": "Invalid card"}, 400
+            if "suit" in request.json:
+                set_suit = parse_suit(request.json["suit"])
+                if not set_suit:
+                    return {"error": "Invalid suit"}, 400
+        except (AttributeError, TypeError):  # not a JSON object of strings
+            return {"error": "Invalid move"}, 400
+
+        try:
+            return table.submit(seat, card, set_suit).result(TABLE_MOVE_TIMEOUT)
+        except ValueError as error:
+            return {"error": str(error)}, 409
+        except futures.TimeoutError:
+            return {"error": "Table is busy"}, 503
+
+
+def table_seat(table) -> int:
+    """Find the current user's seat at a table.
+
+    Args:
+        table (Table): table to look at
+
+    Returns:
+        int: seat of the user; 0 if they are not seated
+    """
+    for seat, username in table.seats.items():
+        if username == current_user.username:
+            return seat
+    return 0
+
+
+# Seconds a move request waits for the table to apply the move.
+TABLE_MOVE_TIMEOUT = 10
+
+# Multiplayer tables are opened at /tables.
+api.add_resource(TableListResource, '/tables')
+# Specific tables are joined and viewed using a table ID.
+api.add_resource(TableResource, '/tables/<int:table_id>')
+api.add_resource(TableMoveResource, '/tables/<int:table_id>/moves')
+
+
+@app.route('/tables/<int:table_id>/events')
+@login_required
+def table_events(table_id):
+    """Stream a table's updates as Server-Sent Events. The first event is the
+    full table state, followed by each move, and the user's hand whenever it
+    changes.
+
+    Args:
+        table_id (int): id of the table to watch
+    """
+    table = table_service.get_table(table_id)
+    if not table:
+        return {"error": "No such table"}, 404
+    subscriber = table.subscribe(table_seat(table) or None)
+    return Response(table.stream(subscriber), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+class MatchmakingResource(Resource):
+    """Respond to REST API requests GET, POST, and DELETE at /matchmaking,
+    which queues the current user for a multiplayer table. Requests wait up to
+    MATCHMAKING_WAIT seconds for a table and otherwise answer 202, after which
+    the client polls with GET.
+    """
+    decorators = [login_required]
+
+    def get(self) -> dict:
+        """Check whether the current user has been seated.
+
+        Returns:
+            dict: table and seat of the user, or their queue status
+        """
+        future = matchmaking_requests.get(current_user.username)
+        if not future:
+            return {"status": "not queued"}, 404
+        try:
+            match = future.result(MATCHMAKING_WAIT)
+        except futures.TimeoutError:
+            return {"status": "queued"}, 202
+        except futures.CancelledError:
+            matchmaking_requests.pop(current_user.username, None)
+            return {"status": "cancelled"}, 404
+        matchmaking_requests.pop(current_user.username, None)
+        return {"status": "matched", "table_id": match.table_id, "seat": match.seat,
+                "waited": match.waited}
+
+    def post(self) -> dict:
+        """Queue the current user, e.g. {"game": "crazy_eights", "rating": 1000}.
+
+        Returns:
+            dict: table and seat of the user, or their queue status
+        """
+        username = current_user.username
+        if username not in matchmaking_requests:
+            try:
+                matchmaking_requests[username] = matchmaker.start().submit(
+                    username, request.json.get("game", "crazy_eights"),
+                    int(request.json.get("rating", DEFAULT_RATING)))
+            except ValueError as error:
+                return {"error": str(error)}, 400
+        return self.get()
+
+    def delete(self):
+        """Take the current user out of the queue.
+        """
+        matchmaker.cancel(current_user.username)
+        matchmaking_requests.pop(current_user.username, None)
+        return '', 204
+
+
+class MatchmakingMetricsResource(Resource):
+    """Respond to REST API requests GET at /matchmaking/metrics.
+    """
+
+    def get(self) -> dict:
+        """Get the matchmaking queue depths and wait times.
+
+        Returns:
+            dict: matchmaking metrics
+        """
+        return matchmaker.get_metrics()
+
+
+# Seconds a matchmaking request waits for a table before answering.
+MATCHMAKING_WAIT = 5
+
+api.add_resource(MatchmakingResource, '/matchmaking')
+api.add_resource(MatchmakingMetricsResource, '/matchmaking/metrics')
+
+
 class LoginForm(FlaskForm):
     """Represents a login form that is used to send the fields a User fills out to authenticate via REST
 
@@ -508,6 +941,84 @@ def game():
     return redirect(url_for('dashboard'))
 
 
+# Most users whose play sessions are kept in memory; the least recently active
+# are dropped.
+MAX_INPUT_SYSTEMS = 1000
+
+_input_systems = OrderedDict()  # type: OrderedDict[int, InputSystem]
+_input_systems_lock = threading.Lock()
+
+
+def get_input_system() -> InputSystem:
+    """Get the current user's play session, starting one if they have none.
+    Each session's games are seeded by the server and recorded to the
+    recordings log. The games finished in it are noted in play_sessions, with
+    their time by the server's clock, and claimed for the user from their
+    recording, so like any other score they only reach the high scores once
+    the replay verifies them.
+
+    Returns:
+        InputSystem: the session
+    """
+    user_id = current_user.id
+    with _input_systems_lock:
+        input_system = _input_systems.get(user_id)
+        if input_system is not None:
+            _input_systems.move_to_end(user_id)
+            return input_system
+
+        seed = play_sessions.start(user_id)
+
+        def on_game_over(game: str, score: int):
+            seconds = 0.0
+            if game == 'minesweeper':
+                minesweeper = input_system.minesweeper_game
+                seconds = minesweeper.end_time - minesweeper.start_time
+            play_sessions.finish_game(seed, game, score, seconds)
+            inputs = input_system.recorder.get_inputs(InputSystem.get_supported_games()[game])
+            if inputs:  # games that loaded a save are not recorded, and cannot be verified
+                try:
+                    score_verifier.submit(play_sessions.check_claim(ScoreClaim(game, user_id, score, seed, inputs)))
+                except ValueError:
+                    pass  # too long a game to verify
+
+        input_system = _input_systems[user_id] = InputSystem(seed=seed, recorder=recorder, on_game_over=on_game_over)
+        # New Mastermind games record into the statistics of whoever plays them.
+        input_system.mastermind_stats = get_user_stats(current_user.username)
+        evicted = _input_systems.popitem(last=False)[1] if len(_input_systems) > MAX_INPUT_SYSTEMS else None
+    if evicted:
+        evicted.shutdown()
+    return input_system
+
+
+def end_input_system():
+    """Drop the current user's play session, e.g. when they log out. Its
+    finished games that were not claimed for the user can still be claimed.
+    """
+    with _input_systems_lock:
+        input_system = _input_systems.pop(current_user.id, None)
+    if input_system:
+        input_system.shutdown()
+
+
+class PlaySessionResource(Resource):
+    """Respond to REST API requests GET at /play_session.
+    """
+    decorators = [login_required]
+
+    def get(self) -> dict:
+        """Get the seed of the current user's play session, to submit the
+        scores of its games with.
+
+        Returns:
+            dict: seed of the session
+        """
+        return {"seed": get_input_system().seed}
+
+
+api.add_resource(PlaySessionResource, '/play_session')
+
+
 @app.route('/game/<game>')
 @login_required
 def game_menu(game):
@@ -519,11 +1030,11 @@ def game_menu(game):
     game_subdir = game
 
     # Redirect users to the game selection menu.
-    if game_subdir not in input_system.get_supported_games().keys():
+    if game_subdir not in InputSystem.get_supported_games().keys():
         return redirect(url_for('dashboard'))
 
     return render_template('game_menu.html',
-                           game_name=input_system.get_supported_games().get(game_subdir),
+                           game_name=InputSystem.get_supported_games().get(game_subdir),
                            game_subdir=game_subdir
                            )
 
@@ -533,13 +1044,14 @@ def game_menu(game):
 def play(game):
     game_subdir = game  # alias for clarity
     form = GameForm()
+    input_system = get_input_system()
 
     user_input = "New Game"
     if input_system.get_current_game():
         input_system.game_to_load = input_system.current_game
         user_input = "Continue"
 
-    curr_game_name = input_system.get_supported_games().get(game_subdir)
+    curr_game_name = InputSystem.get_supported_games().get(game_subdir)
     if request.method == "POST":
         if form.validate_on_submit():
             user_input = form.input.data
@@ -586,20 +1098,102 @@ def play(game):
                            )
 
 
-# TODO: Add global and user high score filters.
+class GameMovesResource(Resource):
+    """Moves of the game being played, made in batches so scripted and
+    high-latency clients need one round trip for many moves.
+    """
+    decorators = [login_required]
+
+    def post(self, game: str) -> dict:
+        """Make a batch of moves, all or nothing, e.g. {"inputs": ["1,2",
+        "3,4"]}. With "results": true the reply to each move is included, and
+        with "save_name" the final state is saved once at the end.
+
+        Args:
+            game (str): subdirectory of the game
+
+        Returns:
+            dict: final view of the game, and the replies if asked for
+        """
+        inputs = request.json.get("inputs")
+        if not isinstance(inputs, list):
+            return {"error": "inputs must be a list"}, 400
+        save_name = request.json.get("save_name")
+        if save_name and Save.query.filter_by(save_name=save_name).first():
+            return {"error": "Save name already exists"}, 409
+
+        input_system = get_input_system()
+        try:
+            outputs = input_system.handle_moves(game, inputs)
+        except ValueError as error:
+            return {"error": str(error)}, 409
+
+        current_game = input_system.get_game(game)
+        input_system.set_current_game(current_game)
+        if save_name:
+            db.session.add(Save(player_id=current_user.id, game_name=game, save_name=save_name,
+                                save=pickle.dumps(current_game)))
+            db.session.commit()
+
+        response = {"view": json.loads(input_system.render(game, 'json')), "seed": input_system.seed}
+        if request.json.get("results"):
+            response["results"] = outputs
+        return response
+
+
+api.add_resource(GameMovesResource, '/game/<game>/moves')
+
+
+# Content type of each rendering of a game.
+VIEW_MIMETYPES = {'text': 'text/plain', 'html': 'text/html', 'json': 'application/json'}
+
+
+@app.route('/game/<game>/view')
+@login_required
+def game_view(game):
+    """Render the game being played as text, an HTML fragment or JSON, chosen
+    with the format query parameter. Renderings are reused until the game
+    changes, so polling and reloading are cheap.
+
+    Args:
+        game (str): subdirectory of the game to render
+    """
+    fmt = request.args.get('format', 'json')
+    if game not in InputSystem.get_supported_games() or fmt not in VIEW_MIMETYPES:
+        return {"error": "No such game or format"}, 404
+    return Response(get_input_system().render(game, fmt), mimetype=VIEW_MIMETYPES[fmt])
+
+
+# TODO: Add user high score filters.
 @app.route('/game/<game>/high_scores')
 @login_required
 def high_scores(game):
-    """Display the high scores for a game.
+    """Display the high scores for a game, of today, this week or all time as
+    chosen with the period query parameter.
 
     Args:
         game (str): game to display high scores for
     """
-    # Display the global high scores for now. Only display the top 10.
-    curr_game_name = input_system.get_supported_games().get(game)
-    scores = HighScore.query.filter_by(game_name=curr_game_name).limit(10).all()
+    period = request.args.get('period', ALL_TIME)
+    if game not in InputSystem.get_supported_games() or period not in PERIODS:
+        return redirect(url_for('dashboard'))
+
+    # Only display the top ones, which are kept in memory once loaded.
+    curr_game_name = InputSystem.get_supported_games().get(game)
+    now = utc_now()
+    scores = leaderboard.top(game, period, now)
+    if scores is None:
+        rows = HighScore.query.filter_by(game_name=curr_game_name) \
+            .filter(HighScore.created_at >= window_start(period, now)) \
+            .order_by(HighScore.score.desc()).limit(LEADERBOARD_SIZE).all()
+        leaderboard.load(game, [ScoreRecord(game, row.user_id, row.score, row.created_at) for row in rows],
+                         period, now)
+        scores = leaderboard.top(game, period, now)
     return render_template('high_scores.html',
                            game_name=curr_game_name,
+                           game_subdir=game,
+                           period=period,
+                           periods=PERIODS,
                            high_scores=scores
                            )
 
@@ -617,7 +1211,7 @@ def save(game):
             flash('Save name already exists. Please choose another', 'danger')
             return render_template('save.html', form=form)
 
-        current_game = input_system.get_current_game()
+        current_game = get_input_system().get_current_game()
         game_pickle = pickle.dumps(current_game)
         new_save = Save(player_id=current_user.id, game_name=game, save_name=form.save_name.data,
                         save=game_pickle)
@@ -645,7 +1239,7 @@ def load(game):
     if form.validate_on_submit():
         picked_save = Save.query.filter_by(save_name=form.save_name.data).first()
         if picked_save and picked_save.player_id == current_user.id:
-            input_system.set_current_game(pickle.loads(picked_save.save))
+            get_input_system().set_current_game(pickle.loads(picked_save.save))
             flash(f'{picked_save.save_name} successfully loaded!', 'success')
             return redirect(url_for('play', game=game))
 
@@ -708,6 +1302,7 @@ def dashboard():
 def logout():
     """routes to /logout. Logs out the user 
     """
+    end_input_system()
     logout_user()
     return redirect(url_for('index'))
 
@@ -719,6 +1314,11 @@ def create_app():
     is good enough to use for now.
     """
     db.create_all()
+    upgrade_high_scores()
+    for path in (app.config['SCORE_HISTOGRAMS_PATH'], app.config['RECORDINGS_PATH']):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    seed_score_histograms()
+    recorder.log = open(app.config['RECORDINGS_PATH'], 'a')
     return app
 
 
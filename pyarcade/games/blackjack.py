@@ -1,28 +1,80 @@
-from pyarcade.games.card import Rank
-from pyarcade.games.deck import Deck
+from typing import Optional
+import random
+from pyarcade.games.deck import Shoe
 from pyarcade.games.player import Player
 
+# The house hits under DEALER_STANDS.
+DEALER_STANDS = 17
+
+
+def hit_outcome(user_sum: int, house_sum: int) -> Optional[int]:
+    """Settle a hand right after the user hits: a bust loses, and 21 or a
+    busted house wins.
+
+    Args:
+        user_sum (int): total of the user's hand
+        house_sum (int): total of the house's hand
+
+    Returns:
+        Optional[int]: 1 for a win and -1 for a loss; None if the hand goes on
+    """
+    if user_sum > 21:
+        return -1
+    if user_sum == 21 or house_sum > 21:
+        return 1
+    return None
+
+
+def stand_outcome(user_sum: int, house_sum: int) -> int:
+    """Settle a hand after the user stands and the house has drawn. Ties go to
+    the house, except that both busting is a tie.
+
+    Args:
+        user_sum (int): total of the user's hand
+        house_sum (int): final total of the house's hand
+
+    Returns:
+        int: 1 for a win, -1 for a loss and 0 for a tie
+    """
+    if user_sum > 21 and house_sum > 21:
+        return 0
+    if user_sum > 21:
+        return -1
+    if house_sum > 21 or user_sum > house_sum:
+        return 1
+    return -1
+
 
-# Count all aces as 11 for now.
-# TODO: Implement user choosing ace value to be 1 or 11.
 class Blackjack:
     """Represent a game of blackjack, controlling game flow.
+
+    Args:
+        num_decks (Optional[int], optional): number of 52-card decks in the
+        shoe, which is kept across hands. Defaults to 1.
+        rng (Optional[random.Random], optional): random number generator to
+        shuffle with. Defaults to None (the random module).
     """
-    def __init__(self):
+    version = 0  # bumped on every change to the game, e.g. to cache views
+
+    def __init__(self, num_decks: Optional[int] = 1,
+                 rng: Optional[random.Random] = None):
         self.user = Player()
         self.house = Player()
         self.game_state = "New Game"
+        self.shoe = Shoe(num_decks, rng=rng)
+        self.shoe.reshuffle()
         self.setup()
 
     def setup(self) -> None:
-        """Set up the game by dealing the player and the house two cards each.
+        """Set up the game by dealing the player and the house two cards each,
+        reshuffling the shoe first if it has been dealt past its penetration.
         """
-        self.deck = Deck()
-        self.deck.shuffle()
-        self.user.add_to_hand(self.deck.draw())
-        self.house.add_to_hand(self.deck.draw())
-        self.user.add_to_hand(self.deck.draw())
-        self.house.add_to_hand(self.deck.draw())
+        if self.shoe.needs_reshuffle():
+            self.shoe.reshuffle()
+        self.hit(self.user)
+        self.hit(self.house)
+        self.hit(self.user)
+        self.hit(self.house)
 
     def hit(self, player: Player) -> None:
         """Deal a card to a player.
@@ -30,7 +82,10 @@ class Blackjack:
         Args:
             player (Player): player who gets card
         """
-        player.add_to_hand(self.deck.draw())
+        if self.shoe.is_empty():
+            self.shoe.reshuffle(self.user.get_cards() + self.house.get_cards())
+        player.add_to_hand(self.shoe.draw())
+        self.version += 1
 
     def reset(self) -> str:
         self.clear()
@@ -43,37 +98,33 @@ class Blackjack:
         self.house.clear_hand()
         self.user.clear_hand()
         self.game_state = "New Game"
+        self.version += 1
         return "History cleared"
 
     @staticmethod
     def calculate_current_sum(player: Player) -> int:
-        """Calculate the sum of the card values in a player's hand.
+        """Calculate the sum of the card values in a player's hand. Face cards
+        count 10, and one ace counts 11 if that doesn't bust the hand.
         """
-        curr_sum = 0
-        for card in player.get_cards():
-            if card.get_rank() == Rank.ACE:
-                curr_sum += 11
-            elif card.is_face_card():
-                curr_sum += 10
-            else:
-                curr_sum += card.get_rank().value
-
-        return curr_sum
+        return player.get_hand_total()
 
     def bust(self) -> str:
         """updates game state and returns loss string 
         """
         self.game_state = "Game over."
+        self.version += 1
         return "BUST"
 
     def win(self) -> str:
         """updates game state and returns win string
         """
         self.game_state = "Game over."
+        self.version += 1
         return "WIN BABY"
 
     def tie(self) -> str:
         self.game_state = "Game over."
+        self.version += 1
         return "TIE"
 
     # defines win conditions given both user sum and hand sum
@@ -86,38 +137,24 @@ class Blackjack:
         user_sum = self.calculate_current_sum(self.user)
         house_sum = self.calculate_current_sum(self.house)
 
-        if user_sum > 21 and house_sum > 21:
-            return self.tie()
-
-        if user_sum > 21:
-            return self.bust()
-
-        if house_sum > 21:
-            return self.win()
-
-        if user_sum > house_sum:
+        outcome = stand_outcome(user_sum, house_sum)
+        if outcome > 0:
             return self.win()
-
-        else:
+        if outcome == 0:
+            return self.tie()
+        if user_sum <= 21:
             self.clear()
-            return self.bust()
+        return self.bust()
 
     def check_if_bust(self, user_sum: int, house_sum: int) -> str:
         """
         checks if after a turn the user has busted or not. Used when input is hit
         """
-        if user_sum > 21:
-            self.clear()
-            return self.bust()
-
-        elif user_sum == 21:
-            self.clear()
-            return self.win()
-        elif house_sum > 21:
-            self.clear()
-            return self.win()
-
-        return ""
+        outcome = hit_outcome(user_sum, house_sum)
+        if outcome is None:
+            return ""
+        self.clear()
+        return self.win() if outcome > 0 else self.bust()
 
     def next_state(self, decision: str) -> str:
         """Play out one turn of blackjack given the user decision to hit or
@@ -142,7 +179,7 @@ class Blackjack:
         # user stands
         elif decision == "stand":
             # dealer must hit under 17
-            while house_sum < 17:
+            while house_sum < DEALER_STANDS:
                 self.hit(self.house)
                 house_sum = self.calculate_current_sum(self.house)
 
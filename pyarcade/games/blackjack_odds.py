@@ -0,0 +1,268 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Optional, List, NamedTuple, Tuple, Iterator
+import json
+import os
+from pyarcade.games.blackjack import Blackjack, DEALER_STANDS
+
+# Hand values of the ten kinds of card that play differently, following
+# Blackjack.calculate_current_sum: aces count 1 here, or 11 when the hand is
+# soft, and face cards 10.
+VALUES = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+
+# Kind of each rank, indexed by rank value - 1.
+RANK_KINDS = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 9)
+
+# Chance of drawing each kind from an infinite deck.
+INFINITE_DECK = tuple(RANK_KINDS.count(kind) / len(RANK_KINDS) for kind in range(len(VALUES)))
+
+# Busted totals are all stored as BUST.
+BUST = 22
+
+# Final dealer totals, in the order dealer_outcomes gives their chances.
+DEALER_TOTALS = (17, 18, 19, 20, 21, BUST)
+
+# Highest total a hand can have without busting.
+MAX_TOTAL = 21
+
+# Bump when the game rules change, so cached tables are recomputed.
+RULES_VERSION = 2
+
+# Where the infinite-deck tables are cached.
+TABLES_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'pyarcade', 'blackjack_odds.json')
+
+# Shoe compositions are tuples of counts per kind; None is an infinite deck.
+Counts = Optional[Tuple[int, ...]]
+
+# A hand is its best total and whether it is soft (an ace counts 11).
+Hand = Tuple[int, bool]
+
+
+class HandOdds(NamedTuple):
+    """Expected value of each decision, in bets won per bet."""
+    stand: float
+    hit: float  # hitting, then playing the rest of the hand perfectly
+
+    def best(self) -> str:
+        """
+        Returns:
+            str: decision with the higher expected value, 'hit' or 'stand'
+        """
+        return 'hit' if self.hit > self.stand else 'stand'
+
+
+def add_card(hand: Hand, value: int) -> Hand:
+    """Add a card to a hand, as Player.get_hand_total counts it.
+
+    Args:
+        hand (Hand): total and softness of the hand
+        value (int): value of the card, 1 for aces
+
+    Returns:
+        Hand: total and softness after the card
+    """
+    total, soft = hand
+    total += value
+    if value == 1 and total <= 11:
+        total += 10
+        soft = True
+    elif total > 21 and soft:
+        total -= 10
+        soft = False
+    return total, soft
+
+
+def _draws(counts: Counts) -> Iterator[Tuple[float, int, Counts]]:
+    """Yield the chance of drawing each kind and the shoe left afterwards.
+    An exhausted shoe is treated as freshly shuffled, i.e. infinite.
+    """
+    total = sum(counts) if counts else 0
+    if not total:
+        for kind, chance in enumerate(INFINITE_DECK):
+            yield chance, kind, None
+        return
+    for kind, count in enumerate(counts):
+        if count:
+            yield count / total, kind, counts[:kind] + (count - 1,) + counts[kind + 1:]
+
+
+@lru_cache(maxsize=1 << 16)
+def dealer_outcomes(house: Hand, counts: Counts = None) -> Tuple[float, ...]:
+    """Find the chances of each final dealer total, as the dealer hits under
+    17, soft or hard, when the user stands.
+
+    Args:
+        house (Hand): total and softness of the house's hand
+        counts (Counts, optional): cards left in the shoe per kind. Defaults
+        to None (an infinite deck).
+
+    Returns:
+        Tuple[float, ...]: chance of ending on each of DEALER_TOTALS
+    """
+    if house[0] >= DEALER_STANDS:
+        final = min(house[0], BUST)
+        return tuple(1.0 if total == final else 0.0 for total in DEALER_TOTALS)
+
+    chances = [0.0] * len(DEALER_TOTALS)
+    for chance, kind, rest in _draws(counts):
+        for i, outcome in enumerate(dealer_outcomes(add_card(house, VALUES[kind]), rest)):
+            chances[i] += chance * outcome
+    return tuple(chances)
+
+
+def stand_ev(user_total: int, house: Hand, counts: Counts = None) -> float:
+    """Find the expected value of standing, when ties go to the house and
+    both busting is a tie.
+
+    Args:
+        user_total (int): current total of the user's hand
+        house (Hand): total and softness of the house's hand
+        counts (Counts, optional): cards left in the shoe per kind. Defaults
+        to None (an infinite deck).
+
+    Returns:
+        float: expected bets won
+    """
+    outcomes = dealer_outcomes(house, counts)
+    house_busts = outcomes[-1]
+    if user_total > 21:
+        return house_busts - 1.0
+    ev = house_busts
+    for total, chance in zip(DEALER_TOTALS, outcomes[:-1]):
+        ev += chance if user_total > total else -chance
+    return ev
+
+
+@lru_cache(maxsize=1 << 16)
+def hit_ev(user: Hand, house: Hand, counts: Counts = None) -> float:
+    """Find the expected value of hitting and then playing perfectly. As in
+    Blackjack.check_if_bust, a hit that busts loses, one that makes 21 wins,
+    and any other hit wins if the house is already bust.
+
+    Args:
+        user (Hand): total and softness of the user's hand
+        house (Hand): total and softness of the house's hand
+        counts (Counts, optional): cards left in the shoe per kind. Defaults
+        to None (an infinite deck).
+
+    Returns:
+        float: expected bets won
+    """
+    ev = 0.0
+    for chance, kind, rest in _draws(counts):
+        after = add_card(user, VALUES[kind])
+        if after[0] > 21:
+            ev -= chance
+        elif after[0] == 21 or house[0] > 21:
+            ev += chance
+        else:
+            ev += chance * max(stand_ev(after[0], house, rest), hit_ev(after, house, rest))
+    return ev
+
+
+def compute_tables() -> dict:
+    """Compute the infinite-deck expected values of standing and hitting for
+    every pair of hands.
+
+    Returns:
+        dict: 'stand' table indexed [user_total][house_total][house_soft] and
+        'hit' table indexed [user_total][user_soft][house_total][house_soft]
+    """
+    totals = range(MAX_TOTAL + 1)
+    return {
+        'version': RULES_VERSION,
+        'stand': [[[stand_ev(user, (house, house_soft)) for house_soft in (False, True)]
+                   for house in totals] for user in totals],
+        'hit': [[[[hit_ev((user, user_soft), (house, house_soft)) for house_soft in (False, True)]
+                  for house in totals] for user_soft in (False, True)] for user in totals]
+    }
+
+
+_tables = {}
+
+
+def get_tables(path: Optional[str] = TABLES_PATH) -> dict:
+    """Get the infinite-deck tables, loading them from the cache file or
+    computing and caching them there.
+
+    Args:
+        path (Optional[str], optional): cache file. Defaults to TABLES_PATH.
+
+    Returns:
+        dict: tables as returned by compute_tables
+    """
+    if path in _tables:
+        return _tables[path]
+
+    tables = None
+    try:
+        with open(path) as cache:
+            tables = json.load(cache)
+    except (OSError, ValueError):
+        pass
+    if not tables or tables.get('version') != RULES_VERSION:
+        tables = compute_tables()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as cache:
+                json.dump(tables, cache)
+        except OSError:
+            pass  # the tables still work, they just aren't cached
+    _tables[path] = tables
+    return tables
+
+
+def table_odds(user: Hand, house: Hand, path: Optional[str] = TABLES_PATH) -> HandOdds:
+    """Look up the infinite-deck odds of a hand.
+
+    Args:
+        user (Hand): total and softness of the user's hand
+        house (Hand): total and softness of the house's hand
+        path (Optional[str], optional): cache file of the tables. Defaults to
+        TABLES_PATH.
+
+    Returns:
+        HandOdds: expected values of standing and hitting
+    """
+    tables = get_tables(path)
+    return HandOdds(tables['stand'][user[0]][house[0]][house[1]],
+                    tables['hit'][user[0]][user[1]][house[0]][house[1]])
+
+
+def shoe_counts(rank_counts: List[int]) -> Tuple[int, ...]:
+    """Group a shoe's cards by kind.
+
+    Args:
+        rank_counts (List[int]): cards per rank, as from Shoe.get_rank_counts
+
+    Returns:
+        Tuple[int, ...]: cards per kind
+    """
+    counts = [0] * len(VALUES)
+    for rank_idx, count in enumerate(rank_counts):
+        counts[RANK_KINDS[rank_idx]] += count
+    return tuple(counts)
+
+
+def hand_odds(game: Blackjack, exact: Optional[bool] = False,
+              path: Optional[str] = TABLES_PATH) -> HandOdds:
+    """Find the odds of the current hand of a game. By default they are
+    looked up in the infinite-deck tables; the exact odds recurse over the
+    cards left in the shoe and take milliseconds per hand.
+
+    Args:
+        game (Blackjack): game being played
+        exact (Optional[bool], optional): whether to use the exact cards left
+        in the shoe rather than an infinite deck. Defaults to False.
+        path (Optional[str], optional): cache file of the infinite-deck
+        tables. Defaults to TABLES_PATH.
+
+    Returns:
+        HandOdds: expected values of standing and hitting
+    """
+    user = game.calculate_current_sum(game.user), game.user.is_soft()
+    house = game.calculate_current_sum(game.house), game.house.is_soft()
+    if not exact:
+        return table_odds(user, house, path)
+    counts = shoe_counts(game.shoe.get_rank_counts())
+    return HandOdds(stand_ev(user[0], house, counts), hit_ev(user, house, counts))
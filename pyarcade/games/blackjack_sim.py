@@ -0,0 +1,418 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Tuple
+import argparse
+import random
+import time
+import numpy as np
+from pyarcade.games.blackjack import Blackjack
+from pyarcade.games.blackjack_odds import get_tables, DEALER_STANDS, MAX_TOTAL, TABLES_PATH
+from pyarcade.games.card import DECK_SIZE, Rank
+
+# Hands each worker task plays before reporting back.
+CHUNK_SIZE = 200000
+# Shoes each worker plays side by side, one hand of each per step.
+BATCH_SIZE = 10000
+
+# Hand value of each card id, following Blackjack.calculate_current_sum: aces
+# count 1, or 11 in a soft hand, and face cards 10.
+CARD_VALUES = np.array([min(rank.value, 10) for _ in range(DECK_SIZE // len(Rank)) for rank in Rank],
+                       dtype=np.int8)
+
+
+class Policy:
+    """Base class for the user's decisions in simulated hands. Policies
+    decide for whole arrays of hands at once, but also work on single totals.
+    """
+    def decide(self, user_totals: np.ndarray, user_soft: np.ndarray,
+               house_totals: np.ndarray, house_soft: np.ndarray) -> np.ndarray:
+        """Decide which hands to hit.
+
+        Args:
+            user_totals (np.ndarray): totals of the user's hands
+            user_soft (np.ndarray): whether each of the user's hands is soft
+            house_totals (np.ndarray): totals of the house's hands
+            house_soft (np.ndarray): whether each of the house's hands is soft
+
+        Returns:
+            np.ndarray: whether to hit each hand
+        """
+        raise NotImplementedError
+
+
+class StandOnPolicy(Policy):
+    """Hit until the hand reaches a total, like the dealer does at 17.
+
+    Args:
+        stand_on (Optional[int], optional): total to stand on. Defaults to 17.
+    """
+    def __init__(self, stand_on: Optional[int] = DEALER_STANDS):
+        self.stand_on = stand_on
+
+    def decide(self, user_totals: np.ndarray, user_soft: np.ndarray,
+               house_totals: np.ndarray, house_soft: np.ndarray) -> np.ndarray:
+        return user_totals < self.stand_on
+
+
+class BasicStrategyPolicy(Policy):
+    """Hit whenever the infinite-deck tables of blackjack_odds give hitting
+    the higher expected value, which also looks at the house's hand.
+
+    Args:
+        path (Optional[str], optional): cache file of the tables. Defaults to
+        TABLES_PATH.
+    """
+    def __init__(self, path: Optional[str] = TABLES_PATH):
+        tables = get_tables(path)
+        stand = np.array(tables['stand'])
+        self.hit_table = np.array(tables['hit']) > stand[:, np.newaxis]
+
+    def decide(self, user_totals: np.ndarray, user_soft: np.ndarray,
+               house_totals: np.ndarray, house_soft: np.ndarray) -> np.ndarray:
+        return self.hit_table[user_totals, np.asarray(user_soft, np.intp), house_totals,
+                              np.asarray(house_soft, np.intp)]
+
+
+# Policies by command line name.
+POLICIES = {
+    'basic': BasicStrategyPolicy,
+    'stand-on': StandOnPolicy
+}
+
+
+class BlackjackSummary:
+    """Aggregate the outcomes of many simulated hands. Summaries from
+    different workers can be merged.
+
+    Args:
+        payout (Optional[float], optional): bets won per bet on a win.
+        Defaults to 1.
+    """
+    def __init__(self, payout: Optional[float] = 1.0):
+        self.payout = payout
+        self.hands = 0
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+
+    def add(self, outcomes: np.ndarray) -> BlackjackSummary:
+        """Add the outcomes of finished hands.
+
+        Args:
+            outcomes (np.ndarray): 1 for each win, -1 for each loss and 0 for
+            each tie
+
+        Returns:
+            BlackjackSummary: summary after adding the hands
+        """
+        wins = int(np.count_nonzero(outcomes > 0))
+        losses = int(np.count_nonzero(outcomes < 0))
+        self.hands += len(outcomes)
+        self.wins += wins
+        self.losses += losses
+        self.ties += len(outcomes) - wins - losses
+        return self
+
+    def merge(self, other: BlackjackSummary) -> BlackjackSummary:
+        """Add another summary's hands to this one.
+
+        Args:
+            other (BlackjackSummary): summary to merge in
+
+        Returns:
+            BlackjackSummary: summary after merging
+        """
+        self.hands += other.hands
+        self.wins += other.wins
+        self.losses += other.losses
+        self.ties += other.ties
+        return self
+
+    def get_house_edge(self) -> float:
+        """
+        Returns:
+            float: the house's expected winnings per bet
+        """
+        if not self.hands:
+            return 0.0
+        return (self.losses - self.payout * self.wins) / self.hands
+
+    def report(self) -> str:
+        if not self.hands:
+            return "No hands played"
+        return "{} hands: win {:.4f} / lose {:.4f} / tie {:.4f}, house edge {:.4f}".format(
+            self.hands, self.wins / self.hands, self.losses / self.hands,
+            self.ties / self.hands, self.get_house_edge())
+
+
+class ShoeBatch:
+    """Many shoes dealt side by side, each with its own cursor, holding card
+    values rather than cards.
+
+    Like Shoe, each shoe is reshuffled before a hand once it has been dealt
+    past its penetration. A shoe that runs out in the middle of a hand is
+    reshuffled whole; the game leaves the cards in play out, which only
+    matters for the rare hand that empties the shoe.
+
+    Args:
+        num_shoes (int): number of shoes
+        num_decks (int): 52-card decks per shoe
+        penetration (float): fraction of a shoe to deal before reshuffling
+        rng (np.random.Generator): random number generator
+    """
+    def __init__(self, num_shoes: int, num_decks: int, penetration: float,
+                 rng: np.random.Generator):
+        self.rng = rng
+        self.values = rng.permuted(np.tile(np.repeat(CARD_VALUES, num_decks), (num_shoes, 1)), axis=1)
+        self.pos = np.zeros(num_shoes, dtype=np.intp)
+        self.cut = int(self.values.shape[1] * penetration)
+
+    def reshuffle(self, shoes: np.ndarray):
+        """Reshuffle some of the shoes.
+
+        Args:
+            shoes (np.ndarray): indices of the shoes to reshuffle
+        """
+        if len(shoes):
+            self.values[shoes] = self.rng.permuted(self.values[shoes], axis=1)
+            self.pos[shoes] = 0
+
+    def deal(self, shoes: np.ndarray) -> np.ndarray:
+        """Deal a card from some of the shoes.
+
+        Args:
+            shoes (np.ndarray): indices of the shoes to deal from
+
+        Returns:
+            np.ndarray: value of the card dealt from each shoe
+        """
+        self.reshuffle(shoes[self.pos[shoes] >= self.values.shape[1]])
+        values = self.values[shoes, self.pos[shoes]]
+        self.pos[shoes] += 1
+        return values
+
+
+def add_cards(totals: np.ndarray, soft: np.ndarray, hands: np.ndarray, values: np.ndarray):
+    """Add a card to some hands in place, as Player.get_hand_total counts it:
+    an ace counts 11 if that doesn't bust the hand, and a soft hand that would
+    bust counts its ace as 1 again.
+
+    Args:
+        totals (np.ndarray): totals of every hand
+        soft (np.ndarray): whether each hand is soft
+        hands (np.ndarray): indices of the hands to add to
+        values (np.ndarray): value of each hand's card, 1 for aces
+    """
+    after = totals[hands] + values
+    softened = (values == 1) & (after <= 11)
+    hardened = soft[hands] & (after > 21)
+    totals[hands] = after + 10 * softened - 10 * hardened
+    soft[hands] = (soft[hands] | softened) & ~hardened
+
+
+def play_hands(batch: ShoeBatch, policy: Policy) -> np.ndarray:
+    """Play one hand from every shoe in a batch, following Blackjack: the
+    user and the house are dealt two cards each, the user hits until the
+    policy stands or check_if_bust ends the hand, and after a stand the house
+    hits under 17 and win_condition decides.
+
+    Args:
+        batch (ShoeBatch): shoes to play from
+        policy (Policy): the user's decisions
+
+    Returns:
+        np.ndarray: 1 for each win, -1 for each loss and 0 for each tie
+    """
+    num_shoes = len(batch.pos)
+    every = np.arange(num_shoes)
+    batch.reshuffle(every[batch.pos >= batch.cut])
+    user = np.zeros(num_shoes, dtype=np.int16)
+    house = np.zeros(num_shoes, dtype=np.int16)
+    user_soft = np.zeros(num_shoes, dtype=bool)
+    house_soft = np.zeros(num_shoes, dtype=bool)
+    for _ in range(2):
+        add_cards(user, user_soft, every, batch.deal(every))
+        add_cards(house, house_soft, every, batch.deal(every))
+
+    outcomes = np.zeros(num_shoes, dtype=np.int8)
+    playing = every
+    stood = []
+    while len(playing):
+        hits = policy.decide(user[playing], user_soft[playing], house[playing], house_soft[playing])
+        stood.append(playing[~hits])
+        playing = playing[hits]
+        add_cards(user, user_soft, playing, batch.deal(playing))
+
+        # A hit that busts loses, and one that makes 21 or faces a bust house
+        # wins.
+        totals = user[playing]
+        outcomes[playing[totals > 21]] = -1
+        won = (totals == 21) | ((totals < 21) & (house[playing] > 21))
+        outcomes[playing[won]] = 1
+        playing = playing[(totals < 21) & (house[playing] <= 21)]
+
+    standing = np.concatenate(stood)
+    drawing = standing[house[standing] < DEALER_STANDS]
+    while len(drawing):
+        add_cards(house, house_soft, drawing, batch.deal(drawing))
+        drawing = drawing[house[drawing] < DEALER_STANDS]
+
+    user_totals = user[standing]
+    house_totals = house[standing]
+    outcomes[standing] = np.where(
+        (user_totals > 21) & (house_totals > 21), 0,
+        np.where(user_totals > 21, -1,
+                 np.where((house_totals > 21) | (user_totals > house_totals), 1, -1)))
+    return outcomes
+
+
+def _run_chunk(args: Tuple[int, int, int, Policy, int, float, float, int]) -> BlackjackSummary:
+    """Play a chunk of hands on its own random stream. Top level so process
+    pools can pickle it.
+    """
+    seed, chunk_idx, num_hands, policy, num_decks, penetration, payout, batch_size = args
+    rng = np.random.default_rng((seed, chunk_idx))
+    batch = ShoeBatch(min(batch_size, num_hands), num_decks, penetration, rng)
+    summary = BlackjackSummary(payout)
+    while summary.hands < num_hands:
+        outcomes = play_hands(batch, policy)
+        summary.add(outcomes[:num_hands - summary.hands])
+    return summary
+
+
+def simulate(num_hands: int, policy: Optional[Policy] = None,
+             num_decks: Optional[int] = 1, penetration: Optional[float] = 0.75,
+             payout: Optional[float] = 1.0, seed: Optional[int] = 0,
+             workers: Optional[int] = None,
+             chunk_size: Optional[int] = CHUNK_SIZE,
+             batch_size: Optional[int] = BATCH_SIZE) -> BlackjackSummary:
+    """Simulate many Blackjack hands in NumPy batches.
+
+    Hands are split into chunks, each played on an independent random stream
+    derived from the seed and the chunk number, so results depend only on the
+    seed and not on how many workers ran them.
+
+    Args:
+        num_hands (int): number of hands to play
+        policy (Optional[Policy], optional): the user's decisions. Defaults to
+        None (BasicStrategyPolicy).
+        num_decks (Optional[int], optional): 52-card decks per shoe. Defaults
+        to 1.
+        penetration (Optional[float], optional): fraction of a shoe to deal
+        before reshuffling. Defaults to 0.75.
+        payout (Optional[float], optional): bets won per bet on a win.
+        Defaults to 1.
+        seed (Optional[int], optional): base seed. Defaults to 0.
+        workers (Optional[int], optional): number of worker processes; 1 plays
+        in this process. Defaults to None (one per CPU).
+        chunk_size (Optional[int], optional): hands per worker task. Defaults
+        to CHUNK_SIZE.
+        batch_size (Optional[int], optional): shoes played side by side.
+        Defaults to BATCH_SIZE.
+
+    Returns:
+        BlackjackSummary: aggregated results
+    """
+    policy = policy or BasicStrategyPolicy()
+    chunks = [(seed, chunk_idx, min(chunk_size, num_hands - start), policy,
+               num_decks, penetration, payout, batch_size)
+              for chunk_idx, start in enumerate(range(0, num_hands, chunk_size))]
+    summary = BlackjackSummary(payout)
+    if workers == 1:
+        for chunk in chunks:
+            summary.merge(_run_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            for chunk_summary in executor.map(_run_chunk, chunks):
+                summary.merge(chunk_summary)
+    return summary
+
+
+def play_game_hand(game: Blackjack, policy: Policy) -> int:
+    """Play one hand through the Blackjack game itself.
+
+    Args:
+        game (Blackjack): game to play, which starts a new hand
+        policy (Policy): the user's decisions
+
+    Returns:
+        int: 1 for a win, -1 for a loss and 0 for a tie
+    """
+    game.clear()
+    game.setup()
+    while True:
+        hit = policy.decide(game.calculate_current_sum(game.user), game.user.is_soft(),
+                            game.calculate_current_sum(game.house), game.house.is_soft())
+        result = game.next_state('hit' if hit else 'stand')
+        if result.endswith('WIN BABY'):
+            return 1
+        if result.endswith('BUST'):
+            return -1
+        if result.endswith('TIE'):
+            return 0
+
+
+def cross_check(num_hands: int, policy: Optional[Policy] = None,
+                num_decks: Optional[int] = 1, payout: Optional[float] = 1.0,
+                seed: Optional[int] = 0) -> BlackjackSummary:
+    """Play hands one at a time through Blackjack, to check simulate against
+    the game's own logic.
+
+    Args:
+        num_hands (int): number of hands to play
+        policy (Optional[Policy], optional): the user's decisions. Defaults to
+        None (BasicStrategyPolicy).
+        num_decks (Optional[int], optional): 52-card decks in the shoe.
+        Defaults to 1.
+        payout (Optional[float], optional): bets won per bet on a win.
+        Defaults to 1.
+        seed (Optional[int], optional): random seed. Defaults to 0.
+
+    Returns:
+        BlackjackSummary: aggregated results
+    """
+    policy = policy or BasicStrategyPolicy()
+    game = Blackjack(num_decks, random.Random(seed))
+    outcomes = [play_game_hand(game, policy) for _ in range(num_hands)]
+    return BlackjackSummary(payout).add(np.array(outcomes))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point, installed as pyarcade-blackjack-sim.
+
+    Args:
+        argv (Optional[List[str]], optional): command line arguments. Defaults
+        to None (sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Simulate Blackjack hands under a player policy.")
+    parser.add_argument("--hands", type=int, default=1000000, help="number of hands to play")
+    parser.add_argument("--policy", default="basic", choices=POLICIES.keys(), help="the player's decisions")
+    parser.add_argument("--stand-on", type=int, default=DEALER_STANDS,
+                        choices=range(2, MAX_TOTAL + 1), help="total the stand-on policy stands on")
+    parser.add_argument("--decks", type=int, default=1, help="52-card decks per shoe")
+    parser.add_argument("--penetration", type=float, default=0.75, help="fraction of the shoe dealt before reshuffling")
+    parser.add_argument("--payout", type=float, default=1.0, help="bets won per bet on a win")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--cross-check", type=int, default=0, metavar="HANDS",
+                        help="also play this many hands through the game itself")
+    args = parser.parse_args(argv)
+
+    policy = StandOnPolicy(args.stand_on) if args.policy == "stand-on" else BasicStrategyPolicy()
+    start = time.perf_counter()
+    summary = simulate(args.hands, policy, args.decks, args.penetration, args.payout,
+                       args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    print(summary.report())
+    print("{:.0f} hands/sec".format(summary.hands / elapsed if elapsed else 0))
+
+    if args.cross_check:
+        start = time.perf_counter()
+        summary = cross_check(args.cross_check, policy, args.decks, args.payout, args.seed)
+        elapsed = time.perf_counter() - start
+        print("game: " + summary.report())
+        print("{:.0f} hands/sec".format(summary.hands / elapsed if elapsed else 0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+from typing import Optional, List
+import random
+from pyarcade.games.blackjack import hit_outcome, stand_outcome, DEALER_STANDS
+from pyarcade.games.deck import Shoe
+from pyarcade.games.player import Player
+
+MAX_SEATS = 7
+
+# Action states of a seat during a round.
+PLAYING = 'playing'
+STOOD = 'stood'
+SETTLED = 'settled'
+
+# How each outcome is shown.
+_OUTCOME_NAMES = {1: 'WIN', 0: 'TIE', -1: 'LOSE'}
+
+
+class BlackjackTable:
+    """Represent a casino-style blackjack table, with up to seven seats dealt
+    from one shared shoe against one house hand.
+
+    Each seat hits or stands in turn, using the same rules as Blackjack. Once
+    every seat has stood or been settled, the house draws once for the whole
+    table and every seat still standing is settled together.
+
+    Args:
+        num_seats (Optional[int], optional): number of seats from [1, 7].
+        Defaults to 1.
+        num_decks (Optional[int], optional): number of 52-card decks in the
+        shoe, which is kept across rounds. Defaults to 1.
+        rng (Optional[random.Random], optional): random number generator to
+        shuffle with. Defaults to None (the random module).
+    """
+    def __init__(self, num_seats: Optional[int] = 1,
+                 num_decks: Optional[int] = 1,
+                 rng: Optional[random.Random] = None):
+        if num_seats < 1 or num_seats > MAX_SEATS:
+            raise ValueError('Tables have 1 to {} seats'.format(MAX_SEATS))
+        self.seats = [Player() for _ in range(num_seats)]
+        self.house = Player()
+        self.states = [SETTLED] * num_seats
+        self.outcomes = [None] * num_seats  # type: List[Optional[int]]
+        self.bets = [1] * num_seats
+        self.balances = [0] * num_seats
+        self.shoe = Shoe(num_decks, rng=rng)
+        self.shoe.reshuffle()
+        self.deal()
+
+    def deal(self) -> BlackjackTable:
+        """Start a round: clear the hands, reshuffle the shoe if it has been
+        dealt past its penetration, and deal two cards to each seat and the
+        house, one card around the table at a time.
+
+        Returns:
+            BlackjackTable: table after dealing
+        """
+        if self.shoe.needs_reshuffle():
+            self.shoe.reshuffle()
+        self.house.clear_hand()
+        for seat, player in enumerate(self.seats):
+            player.clear_hand()
+            self.states[seat] = PLAYING
+            self.outcomes[seat] = None
+        for _ in range(2):
+            for player in self.seats:
+                self._draw(player)
+            self._draw(self.house)
+        return self
+
+    def hit(self, seat: int) -> Optional[int]:
+        """Deal a card to a seat that is still playing, settling it right away
+        if it busts or makes 21.
+
+        Args:
+            seat (int): seat index from [0, num_seats)
+
+        Returns:
+            Optional[int]: the seat's outcome if it was settled; None otherwise
+        """
+        if self.states[seat] != PLAYING:
+            return self.outcomes[seat]
+        player = self.seats[seat]
+        self._draw(player)
+        outcome = hit_outcome(player.get_hand_total(), self.house.get_hand_total())
+        if outcome is not None:
+            self._settle(seat, outcome)
+        self._resolve_if_done()
+        return outcome
+
+    def stand(self, seat: int) -> BlackjackTable:
+        """Stand a seat that is still playing.
+
+        Args:
+            seat (int): seat index from [0, num_seats)
+
+        Returns:
+            BlackjackTable: table after the seat stands
+        """
+        if self.states[seat] == PLAYING:
+            self.states[seat] = STOOD
+        self._resolve_if_done()
+        return self
+
+    def is_round_over(self) -> bool:
+        """
+        Returns:
+            bool: whether every seat has been settled
+        """
+        return all(state == SETTLED for state in self.states)
+
+    def resolve(self) -> List[Optional[int]]:
+        """Play the house once for the whole table and settle every seat that
+        stood. Seats still playing are stood first.
+
+        Returns:
+            List[Optional[int]]: outcome of every seat: 1 for a win, -1 for a
+            loss and 0 for a tie
+        """
+        standing = [seat for seat, state in enumerate(self.states) if state != SETTLED]
+        if standing:
+            # The house only draws if a seat is waiting on it.
+            while self.house.get_hand_total() < DEALER_STANDS:
+                self._draw(self.house)
+            house_sum = self.house.get_hand_total()
+            for seat in standing:
+                self._settle(seat, stand_outcome(self.seats[seat].get_hand_total(), house_sum))
+        return self.outcomes
+
+    def render(self) -> str:
+        """Show the whole table at once.
+
+        Returns:
+            str: house total, then each seat's total and state or outcome
+        """
+        lines = ["HOUSE HAND: " + str(self.house.get_hand_total())]
+        for seat, player in enumerate(self.seats):
+            status = self.states[seat]
+            if status == SETTLED:
+                status = _OUTCOME_NAMES[self.outcomes[seat]]
+            lines.append("SEAT {}: {} {} (balance {})".format(
+                seat + 1, player.get_hand_total(), status, self.balances[seat]))
+        return "\n".join(lines)
+
+    def _draw(self, player: Player):
+        if self.shoe.is_empty():
+            in_play = self.house.get_cards() + [card for p in self.seats for card in p.get_cards()]
+            self.shoe.reshuffle(in_play)
+        player.add_to_hand(self.shoe.draw())
+
+    def _settle(self, seat: int, outcome: int):
+        self.states[seat] = SETTLED
+        self.outcomes[seat] = outcome
+        self.balances[seat] += outcome * self.bets[seat]
+
+    def _resolve_if_done(self):
+        if PLAYING not in self.states:
+            self.resolve()
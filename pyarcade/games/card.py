@@ -1,5 +1,7 @@
+from __future__ import annotations
 from pyarcade.games.ordered_enum import OrderedEnum
 from enum import unique
+from typing import Optional
 
 
 @unique
@@ -32,25 +34,66 @@ class Rank(OrderedEnum):
     KING = 13
 
 
+# Number of distinct cards in a 52-card deck.
+DECK_SIZE = 52
+_NUM_RANKS = len(Rank)
+
+
 class Card:
     """Represent a playing card with a suit and rank.
 
+    Cards are interned flyweights: constructing a card returns the one
+    canonical instance for that rank and suit, so cards compare and hash by
+    their integer id in [0, 52) and can be stored as small ints.
+
     Args:
         rank (Rank): playing card rank
         suit (Suit): playing card suit
     """
-    def __init__(self, rank: Rank, suit: Suit):
-        self.RANK = rank
-        self.SUIT = suit
+    __slots__ = ('RANK', 'SUIT', '_id', '_str')
+
+    def __new__(cls, rank: Rank, suit: Suit):
+        return CARDS[suit.value * _NUM_RANKS + rank.value - 1]
+
+    @classmethod
+    def _create(cls, rank: Rank, suit: Suit) -> Card:
+        card = object.__new__(cls)
+        card.RANK = rank
+        card.SUIT = suit
+        card._id = suit.value * _NUM_RANKS + rank.value - 1
+        card._str = rank.name.lower() + ' of ' + suit.name.lower()
+        return card
+
+    @staticmethod
+    def from_id(card_id: int) -> Card:
+        """Get the card with an integer id.
+
+        Args:
+            card_id (int): card id in [0, 52)
+
+        Returns:
+            Card: the canonical card with that id
+        """
+        return CARDS[card_id]
 
     def __eq__(self, other: object):
-        return (isinstance(other, Card) and
-                self.get_rank() == other.get_rank() and
-                self.get_suit() == other.get_suit())
+        return self is other or (isinstance(other, Card) and self._id == other._id)
+
+    def __hash__(self):
+        return self._id
 
     def __str__(self):
-        return self.get_rank().name.lower() + ' of ' +\
-            self.get_suit().name.lower()
+        return self._str
+
+    def __repr__(self):
+        return '<Card({})>'.format(self._str)
+
+    def __reduce__(self):
+        # Unpickle to the canonical instance rather than a copy.
+        return Card.from_id, (self._id,)
+
+    def get_id(self) -> int:
+        return self._id
 
     def get_rank(self) -> Rank:
         return self.RANK
@@ -60,3 +103,76 @@ class Card:
 
     def is_face_card(self) -> bool:
         return self.RANK > Rank.TEN
+
+
+# The canonical cards, ordered by id: all ranks of spades, then hearts, etc.
+CARDS = tuple(Card._create(rank, suit) for suit in Suit for rank in Rank)
+
+# Bitmasks selecting every card id of a suit or of a rank, for hands kept as
+# bitsets of card ids.
+SUIT_MASKS = {suit: ((1 << _NUM_RANKS) - 1) << (suit.value * _NUM_RANKS)
+              for suit in Suit}
+RANK_MASKS = {rank: sum(1 << (suit.value * _NUM_RANKS + rank.value - 1)
+                        for suit in Suit)
+              for rank in Rank}
+
+# Text naming each rank and suit, in lower case: the full names, plus
+# numbers, initials and suit symbols.
+RANK_TOKENS = dict({rank.name.lower(): rank for rank in Rank},
+                   **{str(rank.value): rank for rank in Rank},
+                   a=Rank.ACE, j=Rank.JACK, q=Rank.QUEEN, k=Rank.KING)
+SUIT_TOKENS = dict({suit.name.lower(): suit for suit in Suit},
+                   **{suit.name.lower()[:-1]: suit for suit in Suit},
+                   **{suit.name.lower()[0]: suit for suit in Suit},
+                   **{symbol: suit for suit, symbols in ((Suit.SPADES, '\u2660\u2664'),
+                                                         (Suit.HEARTS, '\u2665\u2661'),
+                                                         (Suit.CLUBS, '\u2663\u2667'),
+                                                         (Suit.DIAMONDS, '\u2666\u2662'))
+                      for symbol in symbols})
+
+
+def parse_rank(text: str) -> Optional[Rank]:
+    """Find the rank some text names, e.g. "eight", "8" or "J".
+
+    Args:
+        text (str): name of the rank
+
+    Returns:
+        Optional[Rank]: the rank, or None if the text names none
+    """
+    return RANK_TOKENS.get(text.strip().lower())
+
+
+def parse_suit(text: str) -> Optional[Suit]:
+    """Find the suit some text names, e.g. "spades", "spade", "s" or "\u2660".
+
+    Args:
+        text (str): name of the suit
+
+    Returns:
+        Optional[Suit]: the suit, or None if the text names none
+    """
+    return SUIT_TOKENS.get(text.strip().lower())
+
+
+def parse_card(text: str) -> Optional[Card]:
+    """Find the card some text names: a rank and a suit separated by a comma,
+    e.g. "Eight,Spades" or "8,\u2660", or written together, e.g. "8s" or "10\u2665".
+
+    Args:
+        text (str): name of the card
+
+    Returns:
+        Optional[Card]: the card, or None if the text names none
+    """
+    rank_text, comma, suit_text = text.partition(',')
+    if not comma:
+        text = text.strip()
+        rank_text, suit_text = text[:-1], text[-1:]
+    elif ',' in suit_text:
+        return None
+    rank = RANK_TOKENS.get(rank_text.strip().lower())
+    suit = SUIT_TOKENS.get(suit_text.strip().lower())
+    if rank is None or suit is None:
+        return None
+    return CARDS[suit.value * _NUM_RANKS + rank.value - 1]
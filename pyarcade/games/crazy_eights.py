@@ -1,28 +1,71 @@
 from __future__ import annotations
-from typing import Optional, List
-from pyarcade.games.card import Rank, Suit, Card
-from pyarcade.games.deck import Deck
+from collections import deque
+from typing import Optional, List, NamedTuple, Tuple
+import random
+from pyarcade.games.card import Rank, Suit, Card, SUIT_MASKS, RANK_MASKS
+from pyarcade.games.deck import Shoe
+from pyarcade.games.events import GameOver
 from pyarcade.games.player import Player
 
+# Most rounds kept in a game's round history and games kept in the game history.
+MAX_ROUND_HIST = 50
+MAX_GAME_HIST = 20
+
+
+class RoundResult(NamedTuple):
+    """Snapshot of a finished round. Players are indexed from 0."""
+    points: Tuple[int, ...]  # points left in each player's hand
+    winners: Tuple[int, ...]  # numbers of the players with the fewest points
+    hand_sizes: Tuple[int, ...]  # cards left in each player's hand
+    scores: Tuple[int, ...]  # each player's game score after the round
+
+
+class GameResult(NamedTuple):
+    """Snapshot of a finished game."""
+    scores: Tuple[int, ...]  # each player's final score
+    rounds: Tuple[RoundResult, ...]  # most recent rounds of the game
+
+
+def card_points(card: Card) -> int:
+    """Get the points a card left in a player's hand counts for at the end of
+    a round: 50 for eights, 10 for face cards and the rank value otherwise.
+
+    Args:
+        card (Card): card to count
+
+    Returns:
+        int: points of the card
+    """
+    if card.get_rank() == Rank.EIGHT:
+        return 50
+    if card.get_rank() > Rank.TEN:
+        return 10
+    return card.get_rank().value
+
 
 class CrazyEights:
     """Represent a crazy eights game.
 
     Args:
         num_players (int): number of players from [2, 7].
+        rng (Optional[random.Random], optional): random number generator to
+        shuffle with. Defaults to None (the random module).
     """
-    def __init__(self, num_players: int):
+    version = 0  # bumped on every change to the game, e.g. to cache views
+    game_over = None  # GameOver of the last game ended, until it is picked up
+
+    def __init__(self, num_players: int, rng: Optional[random.Random] = None):
         # Set up the game.
+        self.rng = rng
         self.setup_game(num_players)
         self.curr_suit = Suit.SPADES  # suit choice after an eight is played
 
         # Keep track of the game history.
-        self.game_hist = []
-        self.game_state = "Round 1"
+        self.game_hist = deque(maxlen=MAX_GAME_HIST)
 
     def setup_round(self, num_players: int):
-        """Set up the game by making a deck, shuffling it, dealing cards,
-        making a discard, flipping over the top card, and creating the
+        """Set up the round by gathering and reshuffling the shoe, dealing
+        cards, making a discard, flipping over the top card, and creating the
         round points.
 
         Args:
@@ -33,18 +76,18 @@ class CrazyEights:
         """
         for player in self.players.values():
             player.clear_hand()  # empty the players' hands from prev rounds
-        num_decks = 2 if len(self.players) > 5 else 1
-        self.deck = Deck(num_decks)
-        self.deck.shuffle()
+        self.deck.reshuffle()
         num_cards = 5 if len(self.players) > 2 else 7
         self.deal(num_cards)
         self.discard = []
         self.discard.append(self.deck.draw())
         self.pts = [0] * num_players
+        self.game_state = "Round {}".format(self.round_num + 1)
+        self.version += 1
 
     def setup_game(self, num_players: int) -> CrazyEights:
-        """Set up the game by creating the players, creating the round history,
-        and completing round setup.
+        """Set up the game by creating the players and the shoe, creating the
+        round history, and completing round setup.
 
         Args:
             num_players (int): number of players the game will have
@@ -56,11 +99,16 @@ class CrazyEights:
         # is player 1.
         self.players = {}
         for n in range(num_players):
-            # Note that constructing with [] is needed to block pointer aliases
-            self.players[n + 1] = Player([])
+            self.players[n + 1] = Player()
+
+        # Create the shoe, which is reused by every round of the game.
+        num_decks = 2 if num_players > 5 else 1
+        self.deck = Shoe(num_decks, rng=self.rng)
 
-        # Create the round history.
-        self.round_hist = []
+        # Create the round history. round_num counts every finished round,
+        # including those dropped from the capped history.
+        self.round_hist = deque(maxlen=MAX_ROUND_HIST)
+        self.round_num = 0
 
         # Set up for the first round.
         self.setup_round(num_players)
@@ -128,6 +176,7 @@ class CrazyEights:
 
         card = self.deck.draw()
         self.players.get(player_num).add_to_hand(card)
+        self.version += 1
         return self
 
     def play(self, player_num: int, card_to_play: Card,
@@ -150,12 +199,12 @@ class CrazyEights:
             self.discard.append(card_to_play)
 
             if not player.has_cards():
-                self.game_state = "Round {}".format(str(len(self.round_hist) + 1))
                 self.reset_round()
 
             if card_to_play.get_rank() == Rank.EIGHT:
                 self.curr_suit = set_suit
 
+            self.version += 1
             return True
         return False
 
@@ -199,57 +248,86 @@ class CrazyEights:
             player_num (int): player number
 
         Returns:
-            List[Card]: cards in the player's hand that are viable
+            List[Card]: cards in the player's hand that are viable: those
+            matching the top card's rank, then its suit, then eights, each
+            ordered by id
         """
         top_card = self.discard[-1]
         tc_suit = self.get_top_card_suit()
 
         player = self.players.get(player_num)
-        same_rank = player.get_cards(top_card.get_rank())
-        same_suit = player.get_cards(tc_suit)
-        eights = player.get_cards(Rank.EIGHT)
-
-        cards = same_rank + same_suit + eights
-        return cards
+        rank_mask = RANK_MASKS[top_card.get_rank()]
+        suit_mask = SUIT_MASKS[tc_suit] & ~rank_mask
+        # turn() plays the first option, so the order decides its moves.
+        return (player.get_cards_in(rank_mask) + player.get_cards_in(suit_mask)
+                + player.get_cards_in(RANK_MASKS[Rank.EIGHT] & ~rank_mask & ~suit_mask))
 
-    def turn(self, player_num: int) -> Card:
+    def turn(self, player_num: int, strategy=None) -> Card:
         """Play out a player's turn using automated choices.
 
         Args:
             player_num (int): number of the player whose turn it is
+            strategy (Optional[Strategy], optional): strategy from
+            crazy_eights_ai that picks the card to play. Defaults to None
+            (play the first possible card, setting spades on eights).
 
         Returns:
-            Card: card that the player plays
+            Card: card that the player plays; None if the round ended because
+            the cards ran out while they were drawing
         """
+        round_num = self.round_num
         while True:
-            # Try to play the first possible card.
-            card_ops = self.play_options(player_num)
-            if card_ops:
-                self.play(player_num, card_ops[0])
-                break
+            # Try to play a card.
+            if strategy:
+                move = strategy.choose(self, player_num)
+            else:
+                card_ops = self.play_options(player_num)
+                move = (card_ops[0], Suit.SPADES) if card_ops else None
+            if move:
+                self.play(player_num, move[0], move[1])
+                return move[0]
             # Draw a card if none could be played.
-            else:  # TODO: check behavior if game ends off of emptying deck
-                self.draw(player_num)
+            self.draw(player_num)
+            if self.round_num != round_num:
+                return None
+
+    def copy(self, rng: Optional[random.Random] = None) -> CrazyEights:
+        """Copy the state of the current round, e.g. to look ahead without
+        touching the real game. Round and game history are not copied, but
+        the round count is.
+
+        Args:
+            rng (Optional[random.Random], optional): random number generator
+            for the copy. Defaults to None (this game's).
+
+        Returns:
+            CrazyEights: copy of the game
+        """
+        game = CrazyEights.__new__(CrazyEights)
+        game.rng = rng if rng is not None else self.rng
+        game.players = {n: player.copy() for n, player in self.players.items()}
+        game.deck = self.deck.copy(game.rng)
+        game.discard = list(self.discard)
+        game.pts = list(self.pts)
+        game.curr_suit = self.curr_suit
+        game.round_hist = deque(maxlen=MAX_ROUND_HIST)
+        game.round_num = self.round_num
+        game.game_hist = deque(maxlen=MAX_GAME_HIST)
+        game.game_state = self.game_state
+        game.version = self.version
+        return game
 
     def reset_round(self) -> CrazyEights:
-        """Reset the round, storing it into the game's round history.
+        """Reset the round, storing its result into the game's round history.
 
         Returns:
             CrazyEights: game after the round has been reset
         """
-        # Store the game state in the round history.
-        self.round_hist.append(self.players)
-
         # Count each player's points.
         for n in self.players:
             player = self.players.get(n)
             for card in player.get_cards():
-                card_pts = card.get_rank().value
-                if card.get_rank() == Rank.EIGHT:
-                    card_pts = 50
-                if card.get_rank() > Rank.TEN:
-                    card_pts = 10
-                self.pts[n - 1] += card_pts
+                self.pts[n - 1] += card_points(card)
 
         # The player(s) with the lowest points won. Add the differences between
         # their points and each of the other players' points to their scores.
@@ -262,16 +340,29 @@ class CrazyEights:
             if self.pts[i] > min_score:
                 total_pts_diff += self.pts[i] - min_score
 
-        for i in range(len(winners)):
+        for i in winners:
             winner = self.players.get(i + 1)
             winner.increase_score(total_pts_diff)
 
+        # Store the result in the round history.
+        self.round_hist.append(RoundResult(
+            points=tuple(self.pts),
+            winners=tuple(i + 1 for i in winners),
+            hand_sizes=tuple(len(self.players.get(n + 1).get_cards())
+                             for n in range(len(self.players))),
+            scores=tuple(self.players.get(n + 1).get_score()
+                         for n in range(len(self.players)))))
+        self.round_num += 1
+
         # Reset the round by setting up a new round and return.
         self.setup_round(len(self.players))
         return self
 
     def reset(self, num_players: Optional[int] = None) -> str:
-        """Reset the game, storing its current state in the game history.
+        """Reset the game, storing its current state in the game history. The
+        game only ends with a GameOver if at least one of its rounds was played
+        out; its scores are those after the last such round, not counting the
+        round cut short by the reset.
 
         Args:
             num_players (Optional[int], optional): number of players to start
@@ -280,9 +371,12 @@ class CrazyEights:
         Returns:
             CrazyEights: game after being reset
         """
-        self.game_state = "Round 1"
+        finished = self.round_hist[-1].scores if self.round_hist else None
         self.reset_round()  # reset round to store current round into hist
-        self.game_hist.append((self.players, self.round_hist))
+        self.game_hist.append(GameResult(
+            scores=self.round_hist[-1].scores, rounds=tuple(self.round_hist)))
+        if finished:
+            self.game_over = GameOver('crazy_eights', finished)
         if num_players:
             self.setup_game(num_players)
         else:
@@ -0,0 +1,441 @@
+from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Tuple, Dict, Sequence
+import math
+import random
+import threading
+import time
+import weakref
+from pyarcade.games.card import Rank, Suit, Card
+from pyarcade.games.crazy_eights import CrazyEights, card_points
+
+# A move is the card to play and, for eights, the suit to change the play to.
+Move = Tuple[Card, Optional[Suit]]
+
+# Turns after which a lookahead rollout stops and scores the round as it is.
+MAX_ROLLOUT_TURNS = 500
+
+
+class Strategy:
+    """Base class for automated Crazy Eights players. Strategies are passed to
+    CrazyEights.turn, which keeps drawing while choose returns None.
+    """
+    expensive = False  # whether choose searches, so is worth working out ahead
+    def choose(self, game: CrazyEights, player_num: int) -> Optional[Move]:
+        """Choose the card a player should play.
+
+        Args:
+            game (CrazyEights): game being played
+            player_num (int): number of the player whose turn it is
+
+        Returns:
+            Optional[Move]: card to play and suit to set if it is an eight;
+            None to draw a card
+        """
+        raise NotImplementedError
+
+
+class FirstCardStrategy(Strategy):
+    """Play the first possible card, setting spades on eights. This is what
+    CrazyEights.turn does without a strategy.
+    """
+    def choose(self, game: CrazyEights, player_num: int) -> Optional[Move]:
+        card_ops = game.play_options(player_num)
+        return (card_ops[0], Suit.SPADES) if card_ops else None
+
+
+class HeuristicStrategy(Strategy):
+    """Hold eights until nothing else can be played, stay in the suit with the
+    most cards in hand, and shed high-scoring cards first. Eights set the suit
+    the player holds the most of.
+    """
+    def choose(self, game: CrazyEights, player_num: int) -> Optional[Move]:
+        card_ops = game.play_options(player_num)
+        if not card_ops:
+            return None
+
+        player = game.players.get(player_num)
+        suit_counts = self.count_suits(player.get_cards())
+        non_eights = [card for card in card_ops if card.get_rank() != Rank.EIGHT]
+        if non_eights:
+            card = max(non_eights, key=lambda c: (suit_counts[c.get_suit()], card_points(c)))
+            return card, None
+
+        eight = card_ops[0]
+        rest = list(player.get_cards())
+        rest.remove(eight)
+        return eight, self.best_suit(rest)
+
+    @staticmethod
+    def count_suits(cards: List[Card]) -> Dict[Suit, int]:
+        """Count the non-eight cards of each suit.
+
+        Args:
+            cards (List[Card]): cards to count
+
+        Returns:
+            Dict[Suit, int]: number of cards per suit
+        """
+        counts = {suit: 0 for suit in Suit}
+        for card in cards:
+            if card.get_rank() != Rank.EIGHT:
+                counts[card.get_suit()] += 1
+        return counts
+
+    @classmethod
+    def best_suit(cls, cards: List[Card]) -> Suit:
+        """Pick the suit to set after an eight: the one with the most cards,
+        then the most points to shed.
+
+        Args:
+            cards (List[Card]): cards left in hand after the eight
+
+        Returns:
+            Suit: suit to set
+        """
+        counts = cls.count_suits(cards)
+        points = {suit: 0 for suit in Suit}
+        for card in cards:
+            points[card.get_suit()] += card_points(card)
+        return max(Suit, key=lambda suit: (counts[suit], points[suit]))
+
+
+class MonteCarloStrategy(Strategy):
+    """Look ahead by determinized Monte-Carlo search.
+
+    Each rollout copies the game, deals the cards the player cannot see (the
+    opponents' hands and the shoe) at random, plays one candidate move and
+    plays the round out with the rollout strategy. Every candidate is tried
+    on the same deals, and a move replaces the rollout strategy's own choice
+    only if it does better on those deals by more than one standard error.
+    The search runs until the time budget or the rollout cap runs out, but
+    always tries every candidate at least twice.
+
+    Args:
+        time_budget (Optional[float], optional): seconds to search per move.
+        Defaults to 0.05.
+        max_rollouts (Optional[int], optional): maximum rollouts per
+        candidate move, for reproducible searches. Defaults to None (only the
+        time budget).
+        rollout_strategy (Optional[Strategy], optional): strategy every seat
+        plays with during rollouts. Defaults to HeuristicStrategy.
+        rng (Optional[random.Random], optional): random number generator.
+        Defaults to None (a fresh one).
+    """
+    expensive = True
+
+    def __init__(self, time_budget: Optional[float] = 0.05,
+                 max_rollouts: Optional[int] = None,
+                 rollout_strategy: Optional[Strategy] = None,
+                 rng: Optional[random.Random] = None):
+        self.time_budget = time_budget
+        self.max_rollouts = max_rollouts
+        self.rollout_strategy = rollout_strategy or HeuristicStrategy()
+        self.rng = rng
+
+    def choose(self, game: CrazyEights, player_num: int) -> Optional[Move]:
+        moves = self.candidate_moves(game, player_num)
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+
+        # All eights play the same, so an eight matches on the suit it sets.
+        default = self.rollout_strategy.choose(game, player_num)
+        default_idx = 0
+        for move_idx, (card, suit) in enumerate(moves):
+            if (card == default[0] and suit is None) or (
+                    card.get_rank() == Rank.EIGHT == default[0].get_rank() and suit == default[1]):
+                default_idx = move_idx
+
+        # Sum each move's reward minus the default move's on the same deal.
+        rng = self.rng or random.Random()
+        diff_sums = [0.0] * len(moves)
+        diff_squares = [0.0] * len(moves)
+        deadline = time.perf_counter() + self.time_budget
+        deals = 0
+        while deals < 2 or (
+                (self.max_rollouts is None or deals < self.max_rollouts) and
+                time.perf_counter() < deadline):
+            seed = rng.getrandbits(32)
+            rewards = [self.rollout(game, player_num, move, random.Random(seed))
+                       for move in moves]
+            for move_idx, reward in enumerate(rewards):
+                diff = reward - rewards[default_idx]
+                diff_sums[move_idx] += diff
+                diff_squares[move_idx] += diff * diff
+            deals += 1
+
+        best_idx = max(range(len(moves)), key=lambda i: diff_sums[i])
+        mean = diff_sums[best_idx] / deals
+        variance = max(diff_squares[best_idx] / deals - mean * mean, 0.0)
+        if mean > math.sqrt(variance / deals):
+            return moves[best_idx]
+        return moves[default_idx]
+
+    @staticmethod
+    def candidate_moves(game: CrazyEights, player_num: int) -> List[Move]:
+        """List the distinct moves a player can make. All eights play the same,
+        so one eight is tried with each suit.
+
+        Args:
+            game (CrazyEights): game being played
+            player_num (int): number of the player whose turn it is
+
+        Returns:
+            List[Move]: possible moves
+        """
+        moves = []
+        seen = set()  # ids of the cards tried, as several decks repeat them
+        eight = None
+        for card in game.play_options(player_num):
+            if card.get_rank() == Rank.EIGHT:
+                eight = card
+            elif card.get_id() not in seen:
+                seen.add(card.get_id())
+                moves.append((card, None))
+        if eight:
+            moves.extend((eight, suit) for suit in Suit)
+        return moves
+
+    @staticmethod
+    def determinize(game: CrazyEights, player_num: int, rng: random.Random) -> CrazyEights:
+        """Deal the cards a player cannot see at random, keeping hand sizes.
+
+        Args:
+            game (CrazyEights): copy of the game to change
+            player_num (int): number of the player whose view is kept
+            rng (random.Random): random number generator
+
+        Returns:
+            CrazyEights: game after its hidden cards are redealt
+        """
+        others = [player for n, player in game.players.items() if n != player_num]
+        unseen = game.deck.get_undealt()
+        for player in others:
+            unseen.extend(player.get_cards())
+        rng.shuffle(unseen)
+
+        dealt = 0
+        for player in others:
+            hand_size = len(player.get_cards())
+            player.clear_hand()
+            for card in unseen[dealt:dealt + hand_size]:
+                player.add_to_hand(card)
+            dealt += hand_size
+        game.deck.set_undealt(unseen[dealt:])
+        return game
+
+    def rollout(self, game: CrazyEights, player_num: int, move: Move,
+                rng: random.Random) -> float:
+        """Play a move on a determinized copy of the game and finish the round.
+
+        Args:
+            game (CrazyEights): game being played
+            player_num (int): number of the player making the move
+            move (Move): move to try
+            rng (random.Random): random number generator
+
+        Returns:
+            float: the player's score gain over the round minus the best
+            opponent's
+        """
+        sim = self.determinize(game.copy(rng), player_num, rng)
+        before = {n: player.get_score() for n, player in sim.players.items()}
+
+        sim.play(player_num, move[0], move[1])
+        num_players = len(sim.players)
+        seat = player_num
+        turns = 0
+        round_num = sim.round_num
+        while sim.round_num == round_num:
+            if turns == MAX_ROLLOUT_TURNS:
+                sim.reset_round()
+                break
+            seat = seat % num_players + 1
+            sim.turn(seat, self.rollout_strategy)
+            turns += 1
+
+        gains = {n: player.get_score() - before[n] for n, player in sim.players.items()}
+        own_gain = gains.pop(player_num)
+        return own_gain - max(gains.values())
+
+
+def visible_state(game: CrazyEights, player_num: int) -> tuple:
+    """Everything a player can see of a game on their turn: their hand, the
+    top card and suit to follow, the size of every hand, the shoe and the
+    discard pile, and the scores.
+
+    Args:
+        game (CrazyEights): game being played
+        player_num (int): number of the player whose turn it is
+
+    Returns:
+        tuple: hashable state, equal whenever the player sees the same game
+    """
+    players = [game.players.get(n) for n in sorted(game.players)]
+    hand = game.players.get(player_num).get_cards()
+    return (player_num, game.round_num, game.discard[-1], game.get_top_card_suit(),
+            tuple(sorted(card.get_id() for card in hand)),
+            tuple(len(player.get_cards()) for player in players),
+            tuple(player.get_score() for player in players),
+            len(game.discard), len(game.deck.get_undealt()))
+
+
+class _Stopped(Exception):
+    """Raised to abandon thinking ahead once the human has moved."""
+
+
+_UNKNOWN = object()
+
+
+class _LookUpChoices(Strategy):
+    # Play the choices worked out ahead, and the strategy's own otherwise.
+    def __init__(self, scheduler: TurnScheduler):
+        self.scheduler = scheduler
+
+    def choose(self, game: CrazyEights, player_num: int) -> Optional[Move]:
+        scheduler = self.scheduler
+        with scheduler._lock:
+            move = scheduler._choices.get(visible_state(game, player_num), _UNKNOWN)
+        if move is _UNKNOWN:
+            return scheduler.strategy.choose(game, player_num)
+        scheduler.looked_up += 1
+        return move
+
+
+class _RecordChoices(Strategy):
+    # Make the strategy's choices on a copy of the game and keep them.
+    def __init__(self, scheduler: TurnScheduler, stop: threading.Event):
+        self.scheduler = scheduler
+        self.stop = stop
+
+    def choose(self, game: CrazyEights, player_num: int) -> Optional[Move]:
+        if self.stop.is_set():
+            raise _Stopped
+        move = self.scheduler.strategy.choose(game, player_num)
+        with self.scheduler._lock:
+            if not self.stop.is_set():
+                self.scheduler._choices[visible_state(game, player_num)] = move
+        return move
+
+
+class TurnScheduler:
+    """Play a game's automated seats after a human has moved, until it is a
+    human's turn again or the round ends.
+
+    Strategies that search (Strategy.expensive) think ahead: while the human
+    is deciding, a background thread plays each move the human could make on
+    a copy of the game and keeps the choices of the automated seats that
+    follow. The turns after the human's actual move then look their choices
+    up rather than searching. Choices are kept by everything the seat can
+    see, so a choice looked up is one the strategy could have made itself.
+    Cheap strategies just play, with no background thread.
+
+    Args:
+        human_seats (Optional[Sequence[int]], optional): seats played by
+        humans. Defaults to (1,).
+        strategy (Optional[Strategy], optional): strategy of the automated
+        seats. Defaults to HeuristicStrategy.
+        background (Optional[bool], optional): whether to think ahead on a
+        background thread. Defaults to True.
+    """
+    def __init__(self, human_seats: Optional[Sequence[int]] = (1,),
+                 strategy: Optional[Strategy] = None,
+                 background: Optional[bool] = True):
+        self.human_seats = tuple(human_seats)
+        self.strategy = strategy or HeuristicStrategy()
+        self._executor = None
+        if background and self.strategy.expensive:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            # Sessions are rarely shut down, so let the thread go with them.
+            weakref.finalize(self, self._executor.shutdown, False)
+        self._lock = threading.Lock()
+        self._choices = {}  # visible state -> move, worked out ahead
+        self._stop = threading.Event()
+        self.looked_up = 0  # automated turns played from choices worked out ahead
+
+    def advance(self, game: CrazyEights, after_seat: int) -> List[Tuple[int, Optional[Card]]]:
+        """Play the automated seats that follow a seat, then think ahead for
+        the human whose turn it is.
+
+        Args:
+            game (CrazyEights): game being played
+            after_seat (int): seat that just moved
+
+        Returns:
+            List[Tuple[int, Optional[Card]]]: seat and card played for each
+            automated turn; no card if the round ended while they drew
+        """
+        self._stop.set()
+        moves, seat = self._play_turns(game, after_seat, _LookUpChoices(self))
+        with self._lock:
+            self._choices.clear()
+        self.think_ahead(game, seat if seat in self.human_seats else self.human_seats[0])
+        return moves
+
+    def think_ahead(self, game: CrazyEights, human_seat: int) -> Optional[Future]:
+        """Start working out how the automated seats answer each move a human
+        could make next. The game is copied first, so it can be played on as
+        soon as this returns.
+
+        Args:
+            game (CrazyEights): game being played
+            human_seat (int): seat of the human whose turn it is
+
+        Returns:
+            Optional[Future]: done once the choices are worked out; None if
+            this scheduler does not think ahead
+        """
+        if not self._executor:
+            return None
+        self._stop.set()
+        stop = self._stop = threading.Event()
+        snapshot = game.copy(random.Random())  # never draws from the game's generator
+        return self._executor.submit(self._think, snapshot, human_seat, stop)
+
+    def shutdown(self):
+        """Stop thinking ahead and release the background thread.
+        """
+        self._stop.set()
+        if self._executor:
+            self._executor.shutdown()
+
+    def _think(self, snapshot: CrazyEights, human_seat: int, stop: threading.Event):
+        record = _RecordChoices(self, stop)
+        try:
+            for card, suit in MonteCarloStrategy.candidate_moves(snapshot, human_seat):
+                sim = snapshot.copy(random.Random())
+                sim.play(human_seat, card, suit)
+                self._play_turns(sim, human_seat, record)
+        except _Stopped:
+            pass
+
+    def _play_turns(self, game: CrazyEights, after_seat: int,
+                    strategy: Strategy) -> Tuple[List[Tuple[int, Optional[Card]]], int]:
+        num_players = len(game.players)
+        round_num = game.round_num
+        moves = []
+        seat = after_seat % num_players + 1
+        while seat not in self.human_seats and game.round_num == round_num:
+            moves.append((seat, game.turn(seat, strategy)))
+            seat = seat % num_players + 1
+        return moves, seat
+
+
+# Strategies by difficulty level.
+DIFFICULTIES = {
+    'easy': FirstCardStrategy,
+    'medium': HeuristicStrategy,
+    'hard': MonteCarloStrategy
+}
+
+
+def get_strategy(difficulty: str) -> Strategy:
+    """Create the strategy for a difficulty level.
+
+    Args:
+        difficulty (str): one of the DIFFICULTIES
+
+    Returns:
+        Strategy: new strategy for the difficulty
+    """
+    return DIFFICULTIES[difficulty.lower()]()
@@ -0,0 +1,404 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Tuple
+import argparse
+import math
+import random
+import time
+from pyarcade.games.card import Card
+from pyarcade.games.crazy_eights import CrazyEights
+from pyarcade.games.crazy_eights_ai import Strategy, FirstCardStrategy, DIFFICULTIES
+
+# Games each worker task plays before reporting back.
+CHUNK_SIZE = 500
+# Turns after which a round is called off and scored as it stands.
+MAX_TURNS_PER_ROUND = 1000
+
+
+class GameRecord:
+    """Represent the outcome of one simulated Crazy Eights game.
+
+    Args:
+        scores (List[int]): final score of each seat
+        rounds (int): number of rounds played
+        turns (int): number of turns played
+        draws (List[int]): number of cards each seat drew
+    """
+    __slots__ = ('scores', 'rounds', 'turns', 'draws')
+
+    def __init__(self, scores: List[int], rounds: int, turns: int,
+                 draws: List[int]):
+        self.scores = scores
+        self.rounds = rounds
+        self.turns = turns
+        self.draws = draws
+
+    def get_winners(self) -> List[int]:
+        """
+        Returns:
+            List[int]: indices of the seats with the highest score
+        """
+        best = max(self.scores)
+        return [seat for seat, score in enumerate(self.scores) if score == best]
+
+
+class SimulationSummary:
+    """Aggregate the outcomes of many simulated games between the same number
+    of seats. Summaries from different workers can be merged.
+
+    Args:
+        num_players (int): number of seats in each game
+    """
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+        self.games = 0
+        self.rounds = 0
+        self.turns = 0
+        self.min_turns = 0
+        self.max_turns = 0
+        self.wins = [0] * num_players
+        self.score_totals = [0] * num_players
+        self.draw_totals = [0] * num_players
+
+    def add(self, record: GameRecord) -> SimulationSummary:
+        """Add a game to the summary.
+
+        Args:
+            record (GameRecord): game to add
+
+        Returns:
+            SimulationSummary: summary after the game is added
+        """
+        if not self.games or record.turns < self.min_turns:
+            self.min_turns = record.turns
+        self.max_turns = max(self.max_turns, record.turns)
+        self.games += 1
+        self.rounds += record.rounds
+        self.turns += record.turns
+        for seat in record.get_winners():
+            self.wins[seat] += 1
+        for seat in range(self.num_players):
+            self.score_totals[seat] += record.scores[seat]
+            self.draw_totals[seat] += record.draws[seat]
+        return self
+
+    def merge(self, other: SimulationSummary) -> SimulationSummary:
+        """Fold another summary into this one.
+
+        Args:
+            other (SimulationSummary): summary over the same number of seats
+
+        Returns:
+            SimulationSummary: summary after the merge
+        """
+        if not other.games:
+            return self
+        if not self.games or other.min_turns < self.min_turns:
+            self.min_turns = other.min_turns
+        self.max_turns = max(self.max_turns, other.max_turns)
+        self.games += other.games
+        self.rounds += other.rounds
+        self.turns += other.turns
+        for seat in range(self.num_players):
+            self.wins[seat] += other.wins[seat]
+            self.score_totals[seat] += other.score_totals[seat]
+            self.draw_totals[seat] += other.draw_totals[seat]
+        return self
+
+    def report(self) -> str:
+        """Describe the summary.
+
+        Returns:
+            str: a table of per-seat results followed by game length statistics
+        """
+        games = max(self.games, 1)
+        lines = ["{} games, {} players".format(self.games, self.num_players),
+                 "seat  win rate  avg score  avg draws"]
+        for seat in range(self.num_players):
+            lines.append("{:>4}  {:>8.3f}  {:>9.1f}  {:>9.1f}".format(
+                seat + 1, self.wins[seat] / games,
+                self.score_totals[seat] / games, self.draw_totals[seat] / games))
+        lines.append("rounds/game: {:.2f}  turns/game: {:.1f} (min {}, max {})".format(
+            self.rounds / games, self.turns / games, self.min_turns, self.max_turns))
+        return "\n".join(lines)
+
+
+def play_turn(game: CrazyEights, player_num: int,
+              strategy: Strategy) -> Tuple[Optional[Card], int]:
+    """Play out a seat's turn the way CrazyEights.turn does, counting the cards
+    drawn.
+
+    Args:
+        game (CrazyEights): game being played
+        player_num (int): number of the player whose turn it is
+        strategy (Strategy): strategy the seat plays with
+
+    Returns:
+        Tuple[Optional[Card], int]: card played, or None if the round ended
+        while drawing, and the number of cards drawn
+    """
+    round_num = game.round_num
+    draws = 0
+    while True:
+        move = strategy.choose(game, player_num)
+        if move:
+            game.play(player_num, move[0], move[1])
+            return move[0], draws
+        game.draw(player_num)
+        draws += 1
+        if game.round_num != round_num:
+            return None, draws
+
+
+def play_round(game: CrazyEights, strategies: List[Strategy],
+               draws: List[int]) -> int:
+    """Play a round to its end, seats taking turns starting from player 1.
+
+    Args:
+        game (CrazyEights): game being played
+        strategies (List[Strategy]): strategy of each seat
+        draws (List[int]): cards drawn per seat, updated in place
+
+    Returns:
+        int: number of turns played
+    """
+    round_num = game.round_num
+    num_players = len(game.players)
+    turns = 0
+    while game.round_num == round_num:
+        if turns == MAX_TURNS_PER_ROUND:
+            game.reset_round()
+            break
+        player_num = turns % num_players + 1
+        _, drawn = play_turn(game, player_num, strategies[player_num - 1])
+        draws[player_num - 1] += drawn
+        turns += 1
+    return turns
+
+
+def play_game(strategies: List[Strategy], rng: random.Random,
+              target_score: Optional[int] = 100,
+              max_rounds: Optional[int] = 50) -> GameRecord:
+    """Play a whole game headlessly: rounds until a seat reaches the target
+    score, or until max_rounds have been played.
+
+    Args:
+        strategies (List[Strategy]): strategy of each seat; from 2 to 7 seats
+        rng (random.Random): random number generator for the game
+        target_score (Optional[int], optional): score that ends the game.
+        Defaults to 100.
+        max_rounds (Optional[int], optional): maximum rounds in a game.
+        Defaults to 50.
+
+    Returns:
+        GameRecord: outcome of the game
+    """
+    num_players = len(strategies)
+    game = CrazyEights(num_players, rng)
+    draws = [0] * num_players
+    turns = 0
+    rounds = 0
+    while rounds < max_rounds:
+        turns += play_round(game, strategies, draws)
+        rounds += 1
+        if max(player.get_score() for player in game.players.values()) >= target_score:
+            break
+    scores = [game.players.get(n + 1).get_score() for n in range(num_players)]
+    return GameRecord(scores, rounds, turns, draws)
+
+
+def _run_chunk(args: Tuple[int, int, int, List[Strategy], int, int, bool]) -> SimulationSummary:
+    """Play a chunk of games on its own random stream. Top level so process
+    pools can pickle it.
+    """
+    seed, chunk_idx, num_games, strategies, target_score, max_rounds, rotate_seats = args
+    rng = random.Random("{}:{}".format(seed, chunk_idx))
+    num_players = len(strategies)
+    summary = SimulationSummary(num_players)
+    for game_idx in range(num_games):
+        # Rotating seats cancels out the first player's advantage. Records are
+        # rotated back so each position in the summary follows one strategy.
+        shift = game_idx % num_players if rotate_seats else 0
+        record = play_game(strategies[shift:] + strategies[:shift], rng,
+                           target_score, max_rounds)
+        record.scores = record.scores[-shift:] + record.scores[:-shift] if shift else record.scores
+        record.draws = record.draws[-shift:] + record.draws[:-shift] if shift else record.draws
+        summary.add(record)
+    return summary
+
+
+def simulate(num_games: int, num_players: int, seed: Optional[int] = 0,
+             workers: Optional[int] = None, target_score: Optional[int] = 100,
+             max_rounds: Optional[int] = 50,
+             chunk_size: Optional[int] = CHUNK_SIZE,
+             strategies: Optional[List[Strategy]] = None,
+             rotate_seats: Optional[bool] = False) -> SimulationSummary:
+    """Simulate many games between automated seats.
+
+    Games are split into chunks, each played on an independent random stream
+    derived from the seed and the chunk number, so results depend only on the
+    seed and not on how many workers ran them (as long as no strategy searches
+    against the clock).
+
+    Args:
+        num_games (int): number of games to play
+        num_players (int): number of seats from [2, 7]
+        seed (Optional[int], optional): base seed. Defaults to 0.
+        workers (Optional[int], optional): number of worker processes; 1 plays
+        in this process. Defaults to None (one per CPU).
+        target_score (Optional[int], optional): score that ends a game.
+        Defaults to 100.
+        max_rounds (Optional[int], optional): maximum rounds in a game.
+        Defaults to 50.
+        chunk_size (Optional[int], optional): games per worker task. Defaults
+        to CHUNK_SIZE.
+        strategies (Optional[List[Strategy]], optional): strategy of each
+        seat. Defaults to None (FirstCardStrategy for every seat).
+        rotate_seats (Optional[bool], optional): whether to rotate strategies
+        around the table from game to game. Defaults to False.
+
+    Returns:
+        SimulationSummary: aggregated results, one position per strategy
+    """
+    if strategies is None:
+        strategies = [FirstCardStrategy() for _ in range(num_players)]
+    chunks = [(seed, chunk_idx, min(chunk_size, num_games - start), strategies,
+               target_score, max_rounds, rotate_seats)
+              for chunk_idx, start in enumerate(range(0, num_games, chunk_size))]
+    summary = SimulationSummary(num_players)
+    if workers == 1:
+        for chunk in chunks:
+            summary.merge(_run_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            for chunk_summary in executor.map(_run_chunk, chunks):
+                summary.merge(chunk_summary)
+    return summary
+
+
+def wilson_interval(successes: float, trials: int,
+                    z: Optional[float] = 1.96) -> Tuple[float, float]:
+    """Compute the Wilson score interval of a rate.
+
+    Args:
+        successes (float): number of successes
+        trials (int): number of trials
+        z (Optional[float], optional): normal quantile of the confidence
+        level. Defaults to 1.96 (95%).
+
+    Returns:
+        Tuple[float, float]: lower and upper bound of the rate
+    """
+    if not trials:
+        return 0.0, 1.0
+    rate = successes / trials
+    denom = 1 + z * z / trials
+    center = (rate + z * z / (2 * trials)) / denom
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class HeadToHeadResult:
+    """Represent the outcome of a two-player match between strategies.
+
+    Args:
+        summary (SimulationSummary): summary of the games, strategy A first
+        elapsed (float): seconds the match took
+    """
+    def __init__(self, summary: SimulationSummary, elapsed: float):
+        self.summary = summary
+        self.elapsed = elapsed
+        self.games = summary.games
+        self.ties = summary.wins[0] + summary.wins[1] - summary.games
+        self.wins = summary.wins[0] - self.ties
+        self.losses = summary.wins[1] - self.ties
+
+    def get_win_rate(self) -> float:
+        """
+        Returns:
+            float: strategy A's win rate, counting ties as half a win
+        """
+        return (self.wins + self.ties / 2) / self.games if self.games else 0.0
+
+    def get_interval(self) -> Tuple[float, float]:
+        """
+        Returns:
+            Tuple[float, float]: 95% confidence interval of the win rate
+        """
+        return wilson_interval(self.wins + self.ties / 2, self.games)
+
+    def report(self) -> str:
+        low, high = self.get_interval()
+        return "A wins {} / B wins {} / ties {}: win rate {:.3f} (95% CI {:.3f}-{:.3f}), {:.0f} games/sec".format(
+            self.wins, self.losses, self.ties, self.get_win_rate(), low, high,
+            self.games / self.elapsed if self.elapsed else 0)
+
+
+def head_to_head(strategy_a: Strategy, strategy_b: Strategy, num_games: int,
+                 seed: Optional[int] = 0, workers: Optional[int] = None,
+                 target_score: Optional[int] = 0,
+                 max_rounds: Optional[int] = 1) -> HeadToHeadResult:
+    """Play two strategies against each other, alternating who goes first.
+    By default each game is a single round, the winner being the seat that
+    scores it.
+
+    Args:
+        strategy_a (Strategy): first strategy
+        strategy_b (Strategy): second strategy
+        num_games (int): number of games to play
+        seed (Optional[int], optional): base seed. Defaults to 0.
+        workers (Optional[int], optional): number of worker processes.
+        Defaults to None (one per CPU).
+        target_score (Optional[int], optional): score that ends a game.
+        Defaults to 0.
+        max_rounds (Optional[int], optional): maximum rounds in a game.
+        Defaults to 1.
+
+    Returns:
+        HeadToHeadResult: outcome of the match
+    """
+    start = time.perf_counter()
+    summary = simulate(num_games, 2, seed, workers, target_score, max_rounds,
+                       strategies=[strategy_a, strategy_b], rotate_seats=True)
+    return HeadToHeadResult(summary, time.perf_counter() - start)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point, installed as pyarcade-crazy-eights-sim.
+
+    Args:
+        argv (Optional[List[str]], optional): command line arguments. Defaults
+        to None (sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Simulate Crazy Eights games between automated players.")
+    parser.add_argument("--games", type=int, default=10000, help="number of games to play")
+    parser.add_argument("--players", type=int, default=4, choices=range(2, 8), help="seats per game")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--target-score", type=int, default=100, help="score that ends a game")
+    parser.add_argument("--max-rounds", type=int, default=50, help="maximum rounds per game")
+    parser.add_argument("--strategies", nargs="+", choices=DIFFICULTIES.keys(),
+                        help="difficulty of each seat (default: easy for all)")
+    parser.add_argument("--head-to-head", nargs=2, metavar=("A", "B"), choices=DIFFICULTIES.keys(),
+                        help="play two difficulties against each other in one-round games")
+    args = parser.parse_args(argv)
+
+    if args.head_to_head:
+        strategy_a, strategy_b = (DIFFICULTIES[name]() for name in args.head_to_head)
+        print(head_to_head(strategy_a, strategy_b, args.games, args.seed, args.workers).report())
+        return
+
+    strategies = None
+    if args.strategies:
+        strategies = [DIFFICULTIES[name]() for name in args.strategies]
+        args.players = len(strategies)
+    start = time.perf_counter()
+    summary = simulate(args.games, args.players, args.seed, args.workers,
+                       args.target_score, args.max_rounds, strategies=strategies)
+    elapsed = time.perf_counter() - start
+    print(summary.report())
+    print("{:.0f} games/sec".format(summary.games / elapsed if elapsed else 0))
+
+
+if __name__ == "__main__":
+    main()
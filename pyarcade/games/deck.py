@@ -1,8 +1,9 @@
 from __future__ import annotations
 from typing import Optional, List
 from collections import deque
+from array import array
 import random
-from pyarcade.games.card import Rank, Suit, Card
+from pyarcade.games.card import Card, Rank, CARDS, DECK_SIZE
 
 
 class Deck:
@@ -13,13 +14,8 @@ class Deck:
         use. Defaults to 1.
     """
     def __init__(self, num_decks: Optional[int] = 1):
-        # Create the deck.
-        self._cards = deque([])
-        for suit in Suit:
-            for rank in Rank:
-                new_card = Card(rank, suit)
-                for i in range(num_decks):
-                    self._cards.append(new_card)
+        # Create the deck out of the canonical cards; no cards are allocated.
+        self._cards = deque(card for card in CARDS for _ in range(num_decks))
 
     def shuffle(self) -> Deck:
         """Shuffle the deck using random.shuffle, which uses the Fisher-Yates
@@ -66,3 +62,167 @@ class Deck:
             Deck: deck after the cards are added
         """
         self._cards.extend(cards_to_add)
+
+
+class Shoe:
+    """Represent a dealing shoe holding a number of 52-card decks.
+
+    The shoe is an array of card ids that is shuffled in place and dealt from
+    with a cursor, so it can be kept and reused across hands instead of
+    building a new deck each time. Once the cursor passes the penetration
+    point, needs_reshuffle() tells the game to gather the cards back up.
+
+    Args:
+        num_decks (Optional[int], optional): number of 52-card decks to
+        use. Defaults to 1.
+        penetration (Optional[float], optional): fraction of the shoe to deal
+        before it should be reshuffled. Defaults to 0.75.
+        rng (Optional[random.Random], optional): random number generator to
+        shuffle with. Defaults to None (the random module).
+    """
+    def __init__(self, num_decks: Optional[int] = 1,
+                 penetration: Optional[float] = 0.75,
+                 rng: Optional[random.Random] = None):
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.rng = rng
+        self._all_ids = array('B', [card_id for card_id in range(DECK_SIZE)
+                                    for _ in range(num_decks)])
+        self._ids = array('B', self._all_ids)
+        self._pos = 0
+        # Cursor position at which the shoe has been dealt to its
+        # penetration; moved back along with the cursor when the dealt cards
+        # are dropped.
+        self._cut = int(len(self._all_ids) * penetration)
+
+    def copy(self, rng: Optional[random.Random] = None) -> Shoe:
+        """Copy the shoe, keeping its order and position.
+
+        Args:
+            rng (Optional[random.Random], optional): random number generator
+            for the copy to shuffle with. Defaults to None (this shoe's).
+
+        Returns:
+            Shoe: copy of the shoe
+        """
+        shoe = Shoe.__new__(Shoe)
+        shoe.__dict__.update(self.__dict__)
+        shoe.rng = rng if rng is not None else self.rng
+        shoe._ids = self._ids[self._pos:]
+        shoe._cut = self._cut - self._pos
+        shoe._pos = 0
+        return shoe
+
+    def reshuffle(self, in_play: Optional[List[Card]] = None) -> Shoe:
+        """Gather every card back into the shoe and shuffle it.
+
+        Args:
+            in_play (Optional[List[Card]], optional): cards still in play,
+            which stay out of the shoe. Defaults to None.
+
+        Returns:
+            Shoe: shoe after reshuffling
+        """
+        self._ids = array('B', self._all_ids)
+        for card in in_play or []:
+            self._ids.remove(card.get_id())
+        self._pos = 0
+        self._cut = int(len(self._all_ids) * self.penetration)
+        (self.rng or random).shuffle(self._ids)
+        return self
+
+    def shuffle(self) -> Shoe:
+        """Shuffle the cards that have not been dealt yet.
+
+        Returns:
+            Shoe: shoe after shuffling
+        """
+        if self._pos:
+            del self._ids[:self._pos]
+            self._cut -= self._pos
+            self._pos = 0
+        (self.rng or random).shuffle(self._ids)
+        return self
+
+    def needs_reshuffle(self) -> bool:
+        """Determine whether the shoe has been dealt past its penetration.
+
+        Returns:
+            bool: whether the shoe should be reshuffled before the next hand
+        """
+        return self._pos >= self._cut
+
+    def draw(self) -> Card:
+        """Deal the next card from the shoe.
+
+        Returns:
+            Card: card drawn
+        """
+        if self._pos >= len(self._ids):
+            raise IndexError('draw from an empty shoe')
+        card_id = self._ids[self._pos]
+        self._pos += 1
+        return CARDS[card_id]
+
+    def get_undealt(self) -> List[Card]:
+        """Get the cards left to deal, in dealing order.
+
+        Returns:
+            List[Card]: cards in the shoe
+        """
+        return [CARDS[card_id] for card_id in self._ids[self._pos:]]
+
+    def get_rank_counts(self) -> List[int]:
+        """Count the cards left to deal by rank.
+
+        Returns:
+            List[int]: number of cards of each rank, indexed by rank value - 1
+        """
+        num_ranks = len(Rank)
+        counts = [0] * num_ranks
+        for card_id in self._ids[self._pos:]:
+            counts[card_id % num_ranks] += 1
+        return counts
+
+    def set_undealt(self, cards: List[Card]) -> Shoe:
+        """Replace the cards left to deal.
+
+        Args:
+            cards (List[Card]): cards to deal from now on, in dealing order
+
+        Returns:
+            Shoe: shoe after its cards are replaced
+        """
+        self._ids = array('B', [card.get_id() for card in cards])
+        self._cut -= self._pos
+        self._pos = 0
+        return self
+
+    def size(self) -> int:
+        """Get the number of cards left to deal.
+
+        Returns:
+            int: number of cards in the shoe
+        """
+        return len(self._ids) - self._pos
+
+    def is_empty(self) -> bool:
+        """Determine whether the shoe has no cards left to deal.
+
+        Returns:
+            bool: whether the shoe is empty or not
+        """
+        return self.size() == 0
+
+    def add_cards(self, cards_to_add: List[Card]) -> Shoe:
+        """Add cards to the bottom of the shoe.
+
+        Args:
+            cards_to_add (List[Card]): cards to be added to the bottom of the
+            shoe
+
+        Returns:
+            Shoe: shoe after the cards are added
+        """
+        self._ids.extend(card.get_id() for card in cards_to_add)
+        return self
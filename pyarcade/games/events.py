@@ -0,0 +1,8 @@
+from typing import NamedTuple, Tuple
+
+
+class GameOver(NamedTuple):
+    """A finished game and the scores it ended with. Games leave it in their
+    game_over attribute for whoever is playing them to pick up."""
+    game: str  # subdirectory of the game
+    scores: Tuple[int, ...]  # final score of each player, player 1 first
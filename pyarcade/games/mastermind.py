@@ -1,8 +1,132 @@
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+from typing import Optional, List, Dict
+from collections import OrderedDict, deque
 import random
+import threading
+from pyarcade.games.undo import UndoLog, UNDO_DEPTH
 
-total_history: Dict[int, Dict[tuple, int]] = {}
-total_games = 0
+# Number of winning game histories each MastermindStats keeps around.
+RECENT_HISTORIES = 10
+
+# Most users whose statistics are kept; the least recently used are dropped.
+MAX_USER_STATS = 1000
+
+# Statistics per user, shared by every Mastermind game that user plays,
+# least recently used first.
+_user_stats: OrderedDict[str, MastermindStats] = OrderedDict()
+_user_stats_lock = threading.Lock()
+
+
+class MastermindStats:
+    """Thread-safe, size-capped statistics over a player's Mastermind games.
+
+    Keeps rolling counters, a histogram of how many guesses each win took,
+    and the histories of the most recent wins in a ring buffer, so memory
+    stays constant no matter how many games are played.
+
+    Args:
+        max_recent (Optional[int], optional): number of recent winning game
+        histories to keep. Defaults to RECENT_HISTORIES.
+    """
+    def __init__(self, max_recent: Optional[int] = RECENT_HISTORIES):
+        self._lock = threading.Lock()
+        self.games = 0
+        self.wins = 0
+        self.total_guesses = 0
+        self.guess_histogram: Dict[int, int] = {}
+        self.recent_histories = deque(maxlen=max_recent)
+
+    def __getstate__(self):
+        # Locks cannot be pickled, and game saves pickle their stats.
+        with self._lock:
+            state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record_game(self) -> None:
+        """Count a newly started game.
+        """
+        with self._lock:
+            self.games += 1
+
+    def record_win(self, history: Dict[tuple, Dict[int, List[int]]]) -> None:
+        """Record a won game.
+
+        Args:
+            history (Dict[tuple, Dict[int, List[int]]]): guesses of the game
+            and their evaluations
+        """
+        num_guesses = len(history)
+        with self._lock:
+            self.wins += 1
+            self.total_guesses += num_guesses
+            self.guess_histogram[num_guesses] = self.guess_histogram.get(num_guesses, 0) + 1
+            self.recent_histories.append(dict(history))
+
+    def get_average_guesses(self) -> float:
+        """
+        Returns:
+            float: average number of guesses per won game; 0 if none were won
+        """
+        with self._lock:
+            return self.total_guesses / self.wins if self.wins else 0.0
+
+    def merge(self, other: MastermindStats) -> MastermindStats:
+        """Fold another set of statistics, e.g. from another worker, into
+        these ones.
+
+        Args:
+            other (MastermindStats): statistics to merge in
+
+        Returns:
+            MastermindStats: these statistics after the merge
+        """
+        if other is self:
+            return self
+        other_state = other.__getstate__()
+        with self._lock:
+            self.games += other_state['games']
+            self.wins += other_state['wins']
+            self.total_guesses += other_state['total_guesses']
+            for num_guesses, count in other_state['guess_histogram'].items():
+                self.guess_histogram[num_guesses] = self.guess_histogram.get(num_guesses, 0) + count
+            self.recent_histories.extend(other_state['recent_histories'])
+        return self
+
+    def clear(self) -> None:
+        """Forget all recorded games.
+        """
+        with self._lock:
+            self.games = 0
+            self.wins = 0
+            self.total_guesses = 0
+            self.guess_histogram.clear()
+            self.recent_histories.clear()
+
+
+def get_user_stats(username: str) -> MastermindStats:
+    """Get the statistics shared by all of a user's games, creating them on
+    first use. Only the MAX_USER_STATS most recently used are kept.
+
+    Args:
+        username (str): user the statistics belong to
+
+    Returns:
+        MastermindStats: the user's statistics
+    """
+    with _user_stats_lock:
+        stats = _user_stats.get(username)
+        if stats is None:
+            stats = _user_stats[username] = MastermindStats()
+            if len(_user_stats) > MAX_USER_STATS:
+                _user_stats.popitem(last=False)
+        else:
+            _user_stats.move_to_end(username)
+        return stats
 
 
 class Mastermind:
@@ -13,23 +137,37 @@ class Mastermind:
 
             max_range (int): The range that a single digit can vary
 
+            stats (MastermindStats): statistics to record this game into. Defaults to a fresh set
+
+            rng (random.Random): random number generator for the hidden sequence. Defaults to the random module
+
+            undo_depth (int): number of guesses that can be undone
+
     """
 
-    def __init__(self, width: Optional[int] = 4, max_range: Optional[int] = 9):
+    version = 0  # bumped on every change to the game, e.g. to cache views
+    rng = None  # games saved before they took a generator use the random module
+
+    def __init__(self, width: Optional[int] = 4, max_range: Optional[int] = 9,
+                 stats: Optional[MastermindStats] = None,
+                 rng: Optional[random.Random] = None, undo_depth: Optional[int] = UNDO_DEPTH):
         self.game_state = "New game."
         self.width = width
         self.max_range = max_range
+        self.rng = rng
+        self.undo_log = UndoLog(undo_depth)
         self.hidden_sequence = self.generate_hidden_sequence()
         self.current_history = {}
-        global total_games
-        total_games += 1
+        self.stats = stats if stats is not None else MastermindStats()
+        self.stats.record_game()
 
     def generate_hidden_sequence(self) -> List[int]:
         """
         Returns:
             hidden_sequence List[int]: A sequence of integers to be guessed by the player.
         """
-        return [random.randint(0, self.max_range) for _ in range(self.width)]
+        rng = self.rng or random
+        return [rng.randint(0, self.max_range) for _ in range(self.width)]
 
     def set_hidden_sequence(self, sequence: List[int]):
         self.hidden_sequence = sequence
@@ -45,6 +183,36 @@ class Mastermind:
             0 if digit is somewhere in the hidden sequence, but not in the location it was submitted
             -1 if the digit is nowhere in the hidden sequence
         """
+        return self._evaluate(user_guess, False)
+
+    def undo(self) -> str:
+        """Take back the last guess, unless the game has been won.
+
+        Returns:
+            String: guess that was taken back
+        """
+        if not self.undo_log.undo or self.game_state == "Game over.":
+            return "Nothing to undo"
+        guess, evaluation = self.undo_log.undo.pop()
+        if evaluation is None:
+            del self.current_history[guess]
+        else:
+            self.current_history[guess] = evaluation
+        self.undo_log.redo.append(list(guess))
+        self.version += 1
+        return "Guess " + str(list(guess)) + " undone"
+
+    def redo(self) -> str:
+        """Make the last guess that was taken back again.
+
+        Returns:
+            String: evaluation of the guess
+        """
+        if not self.undo_log.redo or self.game_state == "Game over.":
+            return "Nothing to redo"
+        return self._evaluate(self.undo_log.redo.pop(), True)
+
+    def _evaluate(self, user_guess: List[int], redoing: bool) -> str:
         # Dictionary containing the user's guess and its evaluation
         evaluation = {}
         exact_match = True
@@ -69,12 +237,15 @@ class Mastermind:
             else:
                 evaluation[guess].append(eval_digit)
 
-        self.current_history[tuple(user_guess)] = evaluation
+        key = tuple(user_guess)
+        self.undo_log.record((key, self.current_history.get(key)), redoing)
+        self.current_history[key] = evaluation
+        self.version += 1
 
         if exact_match:
             str(user_guess) + ": " + str(bulls) + " bulls and " + str(cows) + " cows"
             self.game_state = "Game over."
-            total_history[total_games] = self.current_history
+            self.stats.record_win(self.current_history)
             return str(user_guess) + ": " + str(bulls) + " bulls and " + str(cows) + " cows. \n" \
                                                                                      "Congratulations, you win!"
         else:
@@ -87,10 +258,9 @@ class Mastermind:
             String: History cleared
         """
         self.current_history.clear()
-        global total_history
-        total_history.clear()
-        global total_games
-        total_games = 0
+        self.stats.clear()
+        self.undo_log.clear()
+        self.version += 1
         return "History cleared"
 
     # Resets current game history
@@ -102,6 +272,9 @@ class Mastermind:
         self.current_history.clear()
         self.hidden_sequence = self.generate_hidden_sequence()
         self.game_state = "New game."
+        self.stats.record_game()
+        self.undo_log.clear()
+        self.version += 1
         return "Game reset"
 
     @staticmethod
@@ -135,6 +308,7 @@ class Mastermind:
         return "type a 4 digit number to guess a 4 digit secret number" \
                "Each turn the game will return how close your guess was " \
                "bulls are numbers that are the correct value in the correct position" \
-               "cows are numbers that are the correct value but not in the correct position"
+               "cows are numbers that are the correct value but not in the correct position. " \
+               "Type undo to take back a guess and redo to make it again."
 
 
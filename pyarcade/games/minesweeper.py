@@ -1,6 +1,16 @@
 import random
 import time
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, NamedTuple, Tuple
+from pyarcade.games.events import GameOver
+from pyarcade.games.undo import UndoLog, UNDO_DEPTH
+
+
+class MoveDelta(NamedTuple):
+    """What a move changed, to undo it."""
+    guess: List[int]
+    revealed: List[Tuple[int, int]]  # cells the move uncovered
+    game_state: str  # game state before the move
+    score: int  # score before the move
 
 
 class Minesweeper:
@@ -10,10 +20,18 @@ class Minesweeper:
             width (int): width of the minesweeper grid
             height (int): height of minesweeper grid
             mines (int): number of mines to be placed in the grid
+            rng (random.Random): random number generator to place mines with. Defaults to the random module
+            undo_depth (int): number of moves that can be undone
     """
+    version = 0  # bumped on every change to the game, e.g. to cache views
+    rng = None  # games saved before they took a generator use the random module
+    game_over = None  # GameOver of the last win, until it is picked up
 
-    def __init__(self, width: Optional[int] = 9, height: Optional[int] = 9, mines: Optional[int] = 10):
+    def __init__(self, width: Optional[int] = 9, height: Optional[int] = 9, mines: Optional[int] = 10,
+                 rng: Optional[random.Random] = None, undo_depth: Optional[int] = UNDO_DEPTH):
         self.game_state = "New game."
+        self.rng = rng
+        self.undo_log = UndoLog(undo_depth)
         self.width = width
         self.height = height
         self.mines = mines
@@ -33,10 +51,11 @@ class Minesweeper:
         """
         temp_grid = [['-'] * self.height for _ in range(self.width)]
 
+        rng = self.rng or random
         mines_placed: int = 0
-        while mines_placed <= self.mines:
-            row = random.randint(0, self.height - 1)
-            col = random.randint(0, self.width - 1)
+        while mines_placed < self.mines:
+            row = rng.randint(0, self.height - 1)
+            col = rng.randint(0, self.width - 1)
 
             if temp_grid[row][col] != '*':
                 temp_grid[row][col] = '*'
@@ -54,6 +73,8 @@ class Minesweeper:
         for row in mine_locations:
             for col in mine_locations[row]:
                 self.hidden_grid[row][col] = '*'
+        self.undo_log.clear()
+        self.version += 1
 
     def draw_board(self) -> str:
         """
@@ -83,7 +104,7 @@ class Minesweeper:
         Calculates the threebv of the hidden grid. (threebv is the minimum number of clicks
         to uncover all of the mines.)
         """
-
+        self.threebv = 0
         solution = [row[:] for row in self.hidden_grid]
         row = 0
         col = 0
@@ -144,13 +165,48 @@ class Minesweeper:
            minesweeper_board: string representation of the current state of the minesweeper board
 
         """
-        self.game_state = "Ongoing"
+        return self._move(guess, False)
+
+    def undo(self) -> str:
+        """Take back the last move, unless the game is over.
+
+        Returns:
+            minesweeper_board: string representation of the board after the undo
+        """
+        if not self.undo_log.undo or self.game_state == "Game over.":
+            return "Nothing to undo\n" + self.draw_board()
+        delta = self.undo_log.undo.pop()
+        for row, col in delta.revealed:
+            self.hidden_grid[row][col] = '-'
+        self.total_hidden_squares += len(delta.revealed)
+        self.game_history.pop()
+        self.game_state = delta.game_state
+        self.score = delta.score
+        self.undo_log.redo.append(delta.guess)
+        self.version += 1
+        return "Move undone\n" + self.draw_board()
+
+    def redo(self) -> str:
+        """Make the last undone move again, unless the game is over.
+
+        Returns:
+            minesweeper_board: string representation of the board after the move
+        """
+        if not self.undo_log.redo or self.game_state == "Game over.":
+            return "Nothing to redo\n" + self.draw_board()
+        return self._move(self.undo_log.redo.pop(), True)
+
+    def _move(self, guess: List[int], redoing: bool) -> str:
         row_guess = guess[0]
         col_guess = guess[1]
 
         if row_guess < 0 or row_guess > self.height or col_guess < 0 or col_guess > self.width:
             raise IndexError
 
+        revealed = []
+        self.undo_log.record(MoveDelta(guess, revealed, self.game_state, self.score), redoing)
+        self.game_state = "Ongoing"
+        self.version += 1
         self.game_history.append(guess)
 
         if self.hidden_grid[row_guess][col_guess] == '*':
@@ -160,17 +216,19 @@ class Minesweeper:
         if self.hidden_grid[row_guess][col_guess] == ' ' or self.hidden_grid[row_guess][col_guess].isdigit():
             return "Location already uncovered\n" + self.draw_board()
 
-        self.bfs(self.hidden_grid, row_guess, col_guess, False)
+        self.bfs(self.hidden_grid, row_guess, col_guess, False, revealed)
 
         if self.total_hidden_squares == self.mines:
             self.game_state = "Game over."
             self.end_time = time.time()
             self.set_score()
+            self.game_over = GameOver('minesweeper', (self.score,))
             return "Congratulations! You win!\n" + self.draw_board()
 
         return "Minesweeper\n" + self.draw_board()
 
-    def bfs(self, grid: [[str]], row_idx: int, col_idx: int, reveal_board: bool):
+    def bfs(self, grid: [[str]], row_idx: int, col_idx: int, reveal_board: bool,
+            revealed: Optional[List[Tuple[int, int]]] = None):
         """
         Perform bfs to uncover of the surrounding cells that do not contain mines
         Args:
@@ -178,9 +236,13 @@ class Minesweeper:
             row_idx: starting row index
             col_idx: starting column index
             reveal_board: option to either reveal the entire board including the mines (True) or not (False)
+            revealed: list that each uncovered cell is added to, if given
         """
+        if revealed is None:
+            revealed = []
         queue = [(row_idx, col_idx)]
         grid[row_idx][col_idx] = self.check_adjacent_mines(row_idx, col_idx)
+        revealed.append((row_idx, col_idx))
         if not reveal_board:
             self.total_hidden_squares -= 1
         while queue:
@@ -190,6 +252,7 @@ class Minesweeper:
                 nxt_row, nxt_col = row_idx + d[0], col_idx + d[1]
                 if self.is_valid(nxt_row, nxt_col) and grid[nxt_row][nxt_col] == '-':
                     grid[nxt_row][nxt_col] = self.check_adjacent_mines(nxt_row, nxt_col)
+                    revealed.append((nxt_row, nxt_col))
                     if not reveal_board:
                         self.total_hidden_squares -= 1
                         if grid[nxt_row][nxt_col] == " ":
@@ -228,10 +291,15 @@ class Minesweeper:
         self.hidden_grid = self.generate_hidden_grid()
         self.total_hidden_squares = self.width * self.height
         self.game_history.clear()
+        self.undo_log.clear()
+        self.start_time = time.time()
+        self.version += 1
         return "Game reset"
 
     def clear_game_history(self) -> str:
         self.game_history.clear()
+        self.undo_log.clear()
+        self.version += 1
         return "History Cleared"
 
     """Define methods that all games are required to implement.
@@ -251,4 +319,5 @@ class Minesweeper:
                "and revealing the number of mines in the area." \
                "To click on that coordinate in the minesweeper board" \
                "enter coordinates in the format number,number i.e: 4,5" \
-               "dashes represent remaining spaces that are available"
+               "dashes represent remaining spaces that are available. " \
+               "Type undo to take back a move and redo to make it again."
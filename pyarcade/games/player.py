@@ -1,18 +1,43 @@
 from __future__ import annotations
-from pyarcade.games.card import Rank, Card
+from pyarcade.games.card import Rank, Card, CARDS, DECK_SIZE, SUIT_MASKS, \
+    RANK_MASKS
 from typing import Optional, List
 
+# Blackjack value of each card id with aces counted as 1.
+_HARD_VALUES = [min(card.get_rank().value, 10) for card in CARDS]
+
 
 class Player:
     """Represent a card game player.
 
+    Besides the hand itself, the player keeps a count per card id and a bitset
+    of the card ids they hold, so membership and rank/suit queries are bit
+    operations instead of scans over the hand. A running blackjack total,
+    counting aces as 1, and the number of aces make hand totals O(1).
+
     Args:
         cards (Optional[List[Card]], optional): cards to add to the player's
-        hand. Defaults to [] (empty hand).
+        hand. Defaults to None (empty hand).
     """
-    def __init__(self, cards: Optional[List[Card]] = []):
-        self.hand = cards
+    def __init__(self, cards: Optional[List[Card]] = None):
+        self.hand = []
+        self._counts = [0] * DECK_SIZE
+        self._mask = 0
+        self._hard_total = 0
+        self._aces = 0
         self.score = 0
+        for card in cards or []:
+            self.add_to_hand(card)
+
+    def copy(self) -> Player:
+        """Copy the player, with their own hand.
+
+        Returns:
+            Player: copy of the player
+        """
+        player = Player(self.hand)
+        player.score = self.score
+        return player
 
     def add_to_hand(self, card: Card) -> Player:
         """Add a card to the player's hand.
@@ -24,6 +49,12 @@ class Player:
             Player: player with card added to their hand
         """
         self.hand.append(card)
+        card_id = card.get_id()
+        self._counts[card_id] += 1
+        self._mask |= 1 << card_id
+        self._hard_total += _HARD_VALUES[card_id]
+        if card.get_rank() == Rank.ACE:
+            self._aces += 1
         return self
 
     def remove_from_hand(self, card: Card) -> Player:
@@ -35,10 +66,15 @@ class Player:
         Returns:
             Player: player with card removed from their hand
         """
-        for card_idx in range(len(self.hand)):
-            if self.hand[card_idx] == card:
-                self.hand.pop(card_idx)
-                break
+        card_id = card.get_id()
+        if self._counts[card_id]:
+            self.hand.remove(card)
+            self._counts[card_id] -= 1
+            if not self._counts[card_id]:
+                self._mask &= ~(1 << card_id)
+            self._hard_total -= _HARD_VALUES[card_id]
+            if card.get_rank() == Rank.ACE:
+                self._aces -= 1
         return self
 
     def has(self, card: Card) -> bool:
@@ -50,7 +86,7 @@ class Player:
         Returns:
             bool: whether the card is present in the player's hand or not
         """
-        return card in self.hand
+        return bool(self._mask >> card.get_id() & 1)
 
     def has_cards(self) -> bool:
         """Checks whether the player has any cards.
@@ -71,17 +107,30 @@ class Player:
             List[Card]: cards in the player's hand, with the requested rank
             or suit if it was supplied
         """
-        cards = []
         if rank_or_suit and isinstance(rank_or_suit, Rank):
-            for card in self.hand:
-                if card.get_rank() == rank_or_suit:
-                    cards.append(card)
+            return self.get_cards_in(RANK_MASKS[rank_or_suit])
         elif rank_or_suit:  # isinstance(rank_or_suit, Suit) (we hope)
-            for card in self.hand:
-                if card.get_suit() == rank_or_suit:
-                    cards.append(card)
-        else:
-            cards = self.hand
+            return self.get_cards_in(SUIT_MASKS[rank_or_suit])
+        return self.hand
+
+    def get_cards_in(self, mask: int) -> List[Card]:
+        """Get the cards in the player's hand whose ids are set in a bitmask,
+        such as an OR of SUIT_MASKS and RANK_MASKS entries.
+
+        Args:
+            mask (int): bitmask of card ids to match against
+
+        Returns:
+            List[Card]: matching cards in the player's hand, ordered by id,
+            each appearing as many times as the player holds it
+        """
+        cards = []
+        bits = self._mask & mask
+        while bits:
+            low_bit = bits & -bits
+            card_id = low_bit.bit_length() - 1
+            cards.extend([CARDS[card_id]] * self._counts[card_id])
+            bits ^= low_bit
         return cards
 
     def show_hand(self) -> str:
@@ -104,6 +153,39 @@ class Player:
             Player: player after their hand has been emptied
         """
         self.hand.clear()
+        self._counts = [0] * DECK_SIZE
+        self._mask = 0
+        self._hard_total = 0
+        self._aces = 0
+        return self
+
+    def get_hard_total(self) -> int:
+        """Get the blackjack total of the player's hand counting aces as 1.
+
+        Returns:
+            int: hard total of the hand
+        """
+        return self._hard_total
+
+    def is_soft(self) -> bool:
+        """Check whether the player's hand is soft, i.e. an ace can count as
+        11 without going over 21.
+
+        Returns:
+            bool: whether the hand is soft or not
+        """
+        return self._aces > 0 and self._hard_total <= 11
+
+    def get_hand_total(self) -> int:
+        """Get the best blackjack total of the player's hand, counting one ace
+        as 11 if that doesn't go over 21.
+
+        Returns:
+            int: total of the hand
+        """
+        if self._aces and self._hard_total <= 11:
+            return self._hard_total + 10
+        return self._hard_total
 
     def get_score(self) -> int:
         """Get the player's score.
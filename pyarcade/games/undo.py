@@ -0,0 +1,38 @@
+from collections import deque
+from typing import Optional
+
+# Moves a game can undo by default.
+UNDO_DEPTH = 50
+
+
+class UndoLog:
+    """Bounded undo and redo stacks of moves. Each undo entry holds only what
+    the move changed, so undoing costs as much as the move did, and memory is
+    bounded by the depth however large the game is.
+
+    Args:
+        depth (Optional[int], optional): most moves kept for undoing and for
+        redoing. Defaults to UNDO_DEPTH.
+    """
+    def __init__(self, depth: Optional[int] = UNDO_DEPTH):
+        self.undo = deque(maxlen=depth)
+        self.redo = deque(maxlen=depth)
+
+    def record(self, delta, redoing: Optional[bool] = False):
+        """Record a move. A new move, rather than one being redone, discards
+        the moves that could be redone.
+
+        Args:
+            delta: what the move changed, to reverse it with
+            redoing (Optional[bool], optional): whether the move is being
+            redone. Defaults to False.
+        """
+        if not redoing:
+            self.redo.clear()
+        self.undo.append(delta)
+
+    def clear(self):
+        """Forget every move, e.g. when the game is reset.
+        """
+        self.undo.clear()
+        self.redo.clear()
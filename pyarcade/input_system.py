@@ -1,8 +1,10 @@
-from pyarcade.games.mastermind import Mastermind
-from pyarcade.games.minesweeper import Minesweeper
-from pyarcade.games.card import Rank, Suit, Card
-from pyarcade.games.crazy_eights import CrazyEights
-from pyarcade.games.blackjack import Blackjack
+from importlib import import_module, metadata
+from pyarcade.games.mastermind import MastermindStats
+from pyarcade.games.card import parse_card
+from pyarcade.views import ViewCache
+from typing import Optional, Callable, Dict, List, Tuple, Pattern, Match, Union
+import pickle
+import random
 import re
 
 _SUPPORTED_GAMES = {
@@ -15,24 +17,341 @@ _SUPPORTED_GAMES = {
 MASTERMIND_WIDTH = 4
 CRAZY_EIGHTS_NUM_PLAYERS = 4
 CRAZY_EIGHTS_PLAYER_NUM = 1
+CRAZY_EIGHTS_AI_DIFFICULTY = 'medium'
+
+# Number of the user among the players of each game; 1 if not listed.
+_USER_PLAYER_NUMS = {'crazy_eights': CRAZY_EIGHTS_PLAYER_NUM}
+
+# Factory of each game by subdirectory, given as "module:attribute" so a
+# game's module is only imported once it is played. Installed packages can
+# add games under the GAME_ENTRY_POINTS entry point group.
+_GAME_FACTORIES = {
+    'blackjack': 'pyarcade.games.blackjack:Blackjack',
+    'crazy_eights': 'pyarcade.games.crazy_eights:CrazyEights',
+    'mastermind': 'pyarcade.games.mastermind:Mastermind',
+    'minesweeper': 'pyarcade.games.minesweeper:Minesweeper'
+}
+GAME_ENTRY_POINTS = 'pyarcade.games'
+
+# Most inputs applied in one batch of moves.
+MAX_BATCH_MOVES = 100
+
+# Commands that cannot be part of a batch of moves.
+_UNBATCHED = ('save', 'load')
+
+# Move syntax, matched against normalized input.
+MASTERMIND_GUESS = re.compile(r"^(?:\D*(\d)){%d}\D*$" % MASTERMIND_WIDTH)
+MINESWEEPER_MOVE = re.compile(r"^(\d),(\d)$")
+
+
+def normalize(user_input: str) -> str:
+    """Normalize input once, so commands can be looked up directly.
+
+    Args:
+        user_input (str): raw input from the user
+
+    Returns:
+        str: input without surrounding whitespace, in lower case
+    """
+    return user_input.strip().lower()
+
+
+# Subdirectory of each game by normalized display name.
+_SUBDIRS = {normalize(name): subdir for subdir, name in _SUPPORTED_GAMES.items()}
+
+
+class Rejected(str):
+    """Reply to an input that was not applied, e.g. a malformed or illegal
+    move. It reads as the plain reply wherever replies are shown, while
+    handle_moves can tell it apart from a move that was made.
+    """
+
+
+class CommandRegistry:
+    """Commands of one game: a dictionary from normalized command to handler,
+    then move patterns tried in order, then a fallback for anything else.
+
+    Args:
+        fallback (Callable[[str], str]): handler called with the raw input
+        when no command or pattern matches
+        before (Optional[Callable[[], None]], optional): called before every
+        dispatch. Defaults to None.
+    """
+    def __init__(self, fallback: Callable[[str], str],
+                 before: Optional[Callable[[], None]] = None):
+        self.commands = {}  # type: Dict[str, Callable[[], str]]
+        self.patterns = []  # type: List[Tuple[Pattern, Callable[[Match], str]]]
+        self.fallback = fallback
+        self.before = before
+
+    def register(self, token: str, handler: Callable[[], str]) -> "CommandRegistry":
+        """Register a command, replacing any with the same name.
+
+        Args:
+            token (str): command, in any case
+            handler (Callable[[], str]): called when the command is given
+
+        Returns:
+            CommandRegistry: the registry, for chaining
+        """
+        self.commands[normalize(token)] = handler
+        return self
+
+    def register_pattern(self, pattern: Pattern, handler: Callable[[Match], str]) -> "CommandRegistry":
+        """Register a move syntax.
+
+        Args:
+            pattern (Pattern): compiled regular expression, matched against
+            normalized input
+            handler (Callable[[Match], str]): called with the match
+
+        Returns:
+            CommandRegistry: the registry, for chaining
+        """
+        self.patterns.append((pattern, handler))
+        return self
+
+    def dispatch(self, user_input: str):
+        """Run the handler for some input.
+
+        Args:
+            user_input (str): raw input from the user
+
+        Returns:
+            output of the handler
+        """
+        if self.before:
+            self.before()
+        token = normalize(user_input)
+        handler = self.commands.get(token)
+        if handler:
+            return handler()
+        for pattern, handler in self.patterns:
+            match = pattern.match(token)
+            if match:
+                return handler(match)
+        return self.fallback(user_input)
+
+
+def load_factory(spec: str) -> Callable:
+    """Import a factory given as "module:attribute".
+
+    Args:
+        spec (str): module and attribute of the factory
+
+    Returns:
+        Callable: the factory
+    """
+    module_name, _, attribute = spec.partition(':')
+    return getattr(import_module(module_name), attribute)
+
+
+class GameRegistry:
+    """Factories of games by subdirectory. Factories given as "module:attribute"
+    are only imported when a game is first created, and games from entry points
+    are only looked up when a game is not registered.
+
+    Args:
+        factories (Dict[str, Union[str, Callable]]): factory of each game
+    """
+    def __init__(self, factories: Dict[str, Union[str, Callable]]):
+        self._factories = dict(factories)
+        self._entry_points_loaded = False
+
+    def register(self, subdir: str, factory: Union[str, Callable]):
+        """Add a game, or replace the factory of one.
+
+        Args:
+            subdir (str): subdirectory of the game
+            factory (Union[str, Callable]): factory, or its "module:attribute"
+        """
+        self._factories[subdir] = factory
+
+    def get_factory(self, subdir: str) -> Callable:
+        """
+        Args:
+            subdir (str): subdirectory of the game
+
+        Returns:
+            Callable: factory of the game
+        """
+        if subdir not in self._factories and not self._entry_points_loaded:
+            self._load_entry_points()
+        factory = self._factories.get(subdir)
+        if factory is None:
+            raise ValueError('No game {}'.format(subdir))
+        if isinstance(factory, str):
+            factory = self._factories[subdir] = load_factory(factory)
+        return factory
+
+    def create(self, subdir: str, **options):
+        """Build a new game.
+
+        Args:
+            subdir (str): subdirectory of the game
+            **options: arguments of the factory
+
+        Returns:
+            the new game
+        """
+        return self.get_factory(subdir)(**options)
+
+    def _load_entry_points(self):
+        self._entry_points_loaded = True
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, 'select'):
+            entry_points = entry_points.select(group=GAME_ENTRY_POINTS)
+        else:
+            entry_points = entry_points.get(GAME_ENTRY_POINTS, ())
+        for entry_point in entry_points:
+            self._factories.setdefault(entry_point.name, entry_point.value)
+
+
+game_registry = GameRegistry(_GAME_FACTORIES)
+
+
+def _game_property(subdir: str) -> property:
+    """Attribute holding a game, which is built when it is first read."""
+    return property(lambda self: self.get_game(subdir),
+                    lambda self, game: self.games.__setitem__(subdir, game))
 
 
 class InputSystem:
     """Class that handles input for all games 
+
+    Args:
+        seed (Optional[int], optional): seed of the games, which makes a
+        session reproducible: each game gets its own generator seeded from it,
+        and the computer players of Crazy Eights never think ahead in the
+        background. Defaults to None (unseeded).
+        recorder (Optional[Recorder], optional): recorder from pyarcade.replay
+        that every input and reply of a seeded session is passed to, through
+        a handle of the session's own. Defaults to None.
+        on_game_over (Optional[Callable[[str, int], None]], optional): called
+        with the subdirectory of a game and the user's score whenever a game
+        ends with a score. Defaults to None.
     """
 
-    def __init__(self):
-        self.mastermind_game = Mastermind()
-        self.minesweeper_game = Minesweeper()
-        self.crazy_eights_game = CrazyEights(CRAZY_EIGHTS_NUM_PLAYERS)
-        self.blackjack_game = Blackjack()
+    mastermind_game = _game_property('mastermind')
+    minesweeper_game = _game_property('minesweeper')
+    crazy_eights_game = _game_property('crazy_eights')
+    blackjack_game = _game_property('blackjack')
+
+    def __init__(self, seed: Optional[int] = None, recorder=None,
+                 on_game_over: Optional[Callable[[str, int], None]] = None):
+        self.seed = seed
+        self.recorder = recorder.session(seed) if recorder is not None and seed is not None else None
+        self.on_game_over = on_game_over
+        self._rngs = {}  # type: Dict[str, random.Random]
+        self.mastermind_stats = MastermindStats()
+        # Games are only built once they are played.
+        self.games = {}  # type: Dict[str, object]
+        self._game_options = {
+            'mastermind': lambda: {'stats': self.mastermind_stats},
+            'crazy_eights': lambda: {'num_players': CRAZY_EIGHTS_NUM_PLAYERS}
+        }
+        self.views = ViewCache()
+        self._crazy_eights_turns = None
         self.game_to_load = None
         self.current_game = None
+        # Keyed by the normalized display name of each game.
+        self.registries = {
+            'mastermind': self._mastermind_commands(),
+            'minesweeper': self._minesweeper_commands(),
+            'crazy eights': self._crazy_eights_commands(),
+            'blackjack': self._blackjack_commands()
+        }  # type: Dict[str, CommandRegistry]
+
+    def register_game(self, game_name: str, registry: CommandRegistry):
+        """Add a game, or replace the commands of one.
+
+        Args:
+            game_name (str): display name of the game, in any case
+            registry (CommandRegistry): commands of the game
+        """
+        self.registries[normalize(game_name)] = registry
+
+    def register_command(self, game_name: str, token: str, handler: Callable[[], str]):
+        """Add a command to a game, or replace one.
+
+        Args:
+            game_name (str): display name of the game, in any case
+            token (str): command, in any case
+            handler (Callable[[], str]): called when the command is given
+        """
+        self.registries[normalize(game_name)].register(token, handler)
 
     @staticmethod
     def get_supported_games():
         return _SUPPORTED_GAMES
 
+    def get_game(self, subdir: str):
+        """Get the game being played, building it if it has not been played yet.
+
+        Args:
+            subdir (str): subdirectory of the game
+
+        Returns:
+            the game
+        """
+        game = self.games.get(subdir)
+        if game is None:
+            game = self.new_game(subdir)
+        return game
+
+    def new_game(self, subdir: str):
+        """Build a new game, replacing the one being played.
+
+        Args:
+            subdir (str): subdirectory of the game
+
+        Returns:
+            the new game
+        """
+        options = self._game_options.get(subdir)
+        options = options() if options else {}
+        if self.seed is not None:
+            # Every game of a subdirectory draws from one generator, so games
+            # replay the same way whatever else the session played.
+            if subdir not in self._rngs:
+                self._rngs[subdir] = random.Random('{}:{}'.format(self.seed, subdir))
+            options['rng'] = self._rngs[subdir]
+        game = self.games[subdir] = game_registry.create(subdir, **options)
+        return game
+
+    def render(self, subdir: str, fmt: str = 'text') -> str:
+        """Render a game, reusing the last rendering while the game is unchanged.
+
+        Args:
+            subdir (str): subdirectory of the game
+            fmt (str, optional): 'text', 'html' or 'json'. Defaults to 'text'.
+
+        Returns:
+            str: rendering of the game
+        """
+        return self.views.render(subdir, self.get_game(subdir), fmt)
+
+    @property
+    def crazy_eights_turns(self):
+        """Scheduler of the computer players of Crazy Eights, who take their
+        turns after each of the user's moves.
+        """
+        if self._crazy_eights_turns is None:
+            from pyarcade.games.crazy_eights_ai import TurnScheduler, get_strategy
+            self._crazy_eights_turns = TurnScheduler((CRAZY_EIGHTS_PLAYER_NUM,),
+                                                     get_strategy(CRAZY_EIGHTS_AI_DIFFICULTY),
+                                                     background=self.seed is None)
+        return self._crazy_eights_turns
+
+    def shutdown(self):
+        """Stop the background work of the session and write its recordings,
+        e.g. once its user leaves.
+        """
+        if self._crazy_eights_turns:
+            self._crazy_eights_turns.shutdown()
+        if self.recorder:
+            self.recorder.close()
+
     def get_current_game(self):
         """getter for current game
 
@@ -70,48 +389,97 @@ class InputSystem:
         Returns:
             
         """
-        if game_name.lower() == "mastermind":
-            if user_input.lower() == "new game":
-                self.mastermind_game = Mastermind()
-                self.current_game = self.mastermind_game
-                return "\nMastermind\n"
-            elif user_input.lower() == "continue":
-                return "\nMastermind\n"
-            return self.handle_mastermind_input(user_input)
-        elif game_name.lower() == "minesweeper":
-            if user_input.lower() == "new game":
-                self.minesweeper_game = Minesweeper()
-                self.current_game = self.minesweeper_game
-                return "Minesweeper\n" + self.minesweeper_game.draw_board()
-            elif user_input.lower() == "continue":
-                return "Minesweeper\n" + self.minesweeper_game.draw_board()
-            return self.handle_minesweeper_input(user_input)
-        elif game_name.lower() == "crazy eights":
-            if user_input.lower() == "new game":
-                self.crazy_eights_game = CrazyEights(CRAZY_EIGHTS_NUM_PLAYERS)
-                self.current_game = self.crazy_eights_game
-                return "\nCrazy Eights\n\n" + self.crazy_eights_game.game_state + "\nTop Card: " \
-                       + self.crazy_eights_game.show_top_card() + " \n\nPlayer Hand: \n" \
-                       + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM) + "\n"
-            elif user_input.lower() == "continue":
-                return "\nCrazy Eights\n\n" + self.crazy_eights_game.game_state + "\nTop Card: " \
-                       + self.crazy_eights_game.show_top_card() + " \n\nPlayer Hand: \n" \
-                       + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM) + "\n"
-            return self.handle_crazy_eights_input(user_input)
-        elif game_name.lower() == "blackjack":
-            if user_input.lower() == "new game":
-                self.blackjack_game = Blackjack()
-                self.current_game = self.blackjack_game
-                return "\n Blackjack\n" + "\nHouse's revealed card: " \
-                       + str(self.blackjack_game.house.get_cards()[0].get_rank().value) + " \n\nPlayer Hand: \n" \
-                       + str(self.blackjack_game.user.get_cards()[0].get_rank().value) + ", " \
-                       + str(self.blackjack_game.user.get_cards()[1].get_rank().value) + "\n"
-            elif user_input.lower() == "continue":
-                win_status = self.blackjack_game.win_condition()
-                return self.blackjack_game.display_state(win_status)
-            return self.handle_blackjack_input(user_input)
-        else:
+        registry = self.registries.get(normalize(game_name))
+        if not registry:
             return "Invalid game provided."
+        output = registry.dispatch(user_input)
+        if self.recorder:
+            self.recorder.record(game_name, user_input, output)
+        subdir = _SUBDIRS.get(normalize(game_name))
+        if subdir:
+            self._report_game_over(subdir)
+        return output
+
+    def handle_moves(self, subdir: str, inputs: List[str]) -> List[str]:
+        """Apply a batch of inputs to a game, all or nothing. If any input is
+        rejected or fails, the game is restored to how it was before the batch.
+
+        Args:
+            subdir (str): subdirectory of the game
+            inputs (List[str]): inputs in the order they are played
+
+        Returns:
+            List[str]: reply to each input
+        """
+        if subdir not in _SUPPORTED_GAMES:
+            raise ValueError('No game {}'.format(subdir))
+        if len(inputs) > MAX_BATCH_MOVES:
+            raise ValueError('At most {} moves can be made at once'.format(MAX_BATCH_MOVES))
+        for user_input in inputs:
+            if type(user_input) != str or normalize(user_input) in _UNBATCHED:
+                raise ValueError('{!r} cannot be part of a batch'.format(user_input))
+
+        registry = self.registries[normalize(_SUPPORTED_GAMES[subdir])]
+        if registry.before:
+            registry.before()
+        # The game is not built just to be snapshot, so a seeded session
+        # deals the same games as when the inputs are given one at a time.
+        game = self.games.get(subdir)
+        current_game = self.current_game
+        snapshot = pickle.dumps((game, self._rngs.get(subdir)))
+
+        outputs = []
+        try:
+            for step, user_input in enumerate(inputs):
+                output = registry.dispatch(user_input)
+                if isinstance(output, Rejected):
+                    raise ValueError('Move {} ({}) was rejected: {}'.format(step + 1, user_input, output))
+                outputs.append(str(output))
+        except Exception:
+            if registry.before:
+                registry.before()
+            self.current_game = current_game
+            self._restore(subdir, game, snapshot)
+            raise
+        if self.recorder:
+            # Only batches that were applied are recorded, so replays match.
+            for user_input, output in zip(inputs, outputs):
+                self.recorder.record(_SUPPORTED_GAMES[subdir], user_input, output)
+        self._report_game_over(subdir)
+        return outputs
+
+    def _report_game_over(self, subdir: str):
+        # Pick up a game that ended during the last input and pass its score on.
+        game = self.games.get(subdir)
+        event = getattr(game, 'game_over', None)
+        if event is None:
+            return
+        game.game_over = None
+        if self.on_game_over:
+            player_num = _USER_PLAYER_NUMS.get(event.game, 1)
+            self.on_game_over(event.game, event.scores[player_num - 1])
+
+    def _restore(self, subdir: str, game, snapshot: bytes):
+        restored, rng = pickle.loads(snapshot)
+        # The game and the generator were pickled together, so the restored
+        # game still draws from the session's generator.
+        if rng is None:
+            self._rngs.pop(subdir, None)
+        else:
+            self._rngs[subdir] = rng
+        if game is None:
+            self.games.pop(subdir, None)
+            return
+        self.games[subdir] = game
+        version = game.version
+        stats = getattr(game, 'stats', None)
+        game.__dict__.update(restored.__dict__)
+        if stats is not None:
+            # Statistics are shared between games, so they are rolled back in place.
+            stats.__setstate__(restored.stats.__getstate__())
+            game.stats = stats
+        # Renderings made during the batch must not be mistaken for this state.
+        game.version = version + 1
 
     def handle_mastermind_input(self, guess_input):
         """ Accesses the mastermind game and runs mastermind logic based on user input and returns result for
@@ -123,31 +491,9 @@ class InputSystem:
         Returns:
             hidden_sequence List[int]: A sequence of integers to be guessed by the player.
         """
-        if type(guess_input) == str:
-            if guess_input.lower() == "clear":
-                return self.mastermind_game.clear()
-            if guess_input.lower() == "reset":
-                return self.mastermind_game.reset()
-            if guess_input.lower() == "help":
-                return self.mastermind_game.get_help()
-            if guess_input.lower() == "state":
-                return self.mastermind_game.game_state
-            if guess_input.lower() == "save":
-                output = self.mastermind_game
-                return output
-            if guess_input.lower() == "load":
-                self.mastermind_game = self.game_to_load
-                return self.mastermind_game.game_state
-
-            guess = list(guess_input)
-            guess_output = []
-            for idx in range(0, len(guess)):
-                if guess[idx].isdigit():
-                    guess_output.append(int(guess[idx]))
-
-            if len(guess_output) == MASTERMIND_WIDTH:
-                return self.mastermind_game.evaluate(guess_output)
-        return "Invalid input. Input should be of the form \"####\""
+        if type(guess_input) != str:
+            return self._invalid_mastermind_input(guess_input)
+        return self.registries['mastermind'].dispatch(guess_input)
 
     def handle_minesweeper_input(self, location_input: str):
         """ Accesses the minesweeper game and runs minesweeper logic based on user input and returns result for
@@ -159,58 +505,9 @@ class InputSystem:
         Returns:
             board_str (str): a string representation of the minesweeper board 
         """
-        if type(location_input) == str:
-            two_comma_separated_digits_regex = r"^\d,\d$"
-            if re.search(two_comma_separated_digits_regex, location_input):
-                location_guess = location_input.split(',')
-                if self.minesweeper_game.is_valid(int(location_guess[0]), int(location_guess[1])):
-                    return self.minesweeper_game.make_move([int(location_guess[0]), int(location_guess[1])])
-                else:
-                    return "Guess is out of bounds. Please provide input within the bounds of the grid."
-            elif location_input.lower() == "reset":
-                output = self.minesweeper_game.reset_game() + "\n"
-                return output + self.minesweeper_game.draw_board()
-
-            elif location_input.lower() == "save":
-                output = self.minesweeper_game
-                return output
-
-            elif location_input.lower() == "load":
-                self.minesweeper_game = self.game_to_load
-                return self.minesweeper_game.draw_board()
-
-            elif location_input.lower() == "clear":
-                return self.minesweeper_game.clear_game_history() + "\n" + self.minesweeper_game.draw_board()
-            elif location_input.lower() == "state":
-                return self.minesweeper_game.game_state
-            elif location_input.lower() == "help":
-                return self.minesweeper_game.get_help()
-
-        return "Invalid input. User should specify an x and y coordinate: \"<row>,<col>\""
-
-    @staticmethod
-    def handle_card(user_card: str):
-        """ Finds a corresponding card based on user input and returns that card of type card. If none exist
-        it returns None
-        Args: 
-            user_card (str): string representation of Users card played
-
-        Return:
-            Card: card with rank and suit specified
-            None
-        """
-        user_card = user_card.split(",")
-        if len(user_card) != 2:
-            return None
-
-        for rank in Rank:
-            card_rank = "rank.{}".format(user_card[0].lower())
-            for suit in Suit:
-                card_suit = "suit.{}".format(user_card[1].lower())
-
-                if str(rank).lower() == card_rank and str(suit).lower() == card_suit:
-                    return Card(rank, suit)
-        return None
+        if type(location_input) != str:
+            return self._invalid_minesweeper_input(location_input)
+        return self.registries['minesweeper'].dispatch(location_input)
 
     def handle_crazy_eights_input(self, card_input: str) -> str:
         """Handles input varying from game menu options such as help, save, clear and game options such as draw
@@ -222,46 +519,7 @@ class InputSystem:
         Returns:
             String: returns what the last card played was in the form of a string 
         """
-        if card_input.lower() == "help":
-            return self.crazy_eights_game.get_help()
-        if card_input.lower() == "clear":
-            return self.crazy_eights_game.clear()
-        if card_input.lower() == "state":
-            return self.crazy_eights_game.game_state
-        if card_input.lower() == "save":
-            output = self.crazy_eights_game
-            return output
-        if card_input.lower() == "load":
-            self.crazy_eights_game = self.game_to_load
-            return self.crazy_eights_game.game_state
-        if card_input.lower() == "reset":
-            output = self.crazy_eights_game.reset(CRAZY_EIGHTS_NUM_PLAYERS) + "\n" + self.crazy_eights_game.game_state
-            return output + "\n\nTop Card: " + self.crazy_eights_game.show_top_card() + "\n\nPlayer Hand: \n" \
-                   + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM)
-        curr_state = self.crazy_eights_game.game_state
-
-        if card_input == 'draw':
-            self.crazy_eights_game.draw(CRAZY_EIGHTS_PLAYER_NUM)
-            return "\nTop Card: " + self.crazy_eights_game.show_top_card() + "\n\nPlayer Hand: \n" \
-                   + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM)
-
-        card = self.handle_card(card_input)
-
-        if card:
-            not_str = 'not ' if not self.crazy_eights_game.play(CRAZY_EIGHTS_PLAYER_NUM, card) else ''
-            game_output = 'card {} was '.format(str(card)) + not_str + 'played \nTop Card: ' \
-                          + self.crazy_eights_game.show_top_card() + "\n\nPlayer Hand: \n" \
-                          + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM)
-            if curr_state != self.crazy_eights_game.game_state:
-                score = self.crazy_eights_game.players.get(CRAZY_EIGHTS_PLAYER_NUM).get_score()
-                return self.crazy_eights_game.game_state + "\nScore: " + str(score) + "\n" + game_output
-            else:
-                return game_output
-        else:
-            invalid_str = "Invalid input. User should specify either to draw or which card to place (Ex: Eight," \
-                          "Spades)\n "
-            return invalid_str + "\nTop Card: " + self.crazy_eights_game.show_top_card() \
-                   + "\n\nPlayer Hand: \n" + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM)
+        return self.registries['crazy eights'].dispatch(card_input)
 
     def handle_blackjack_input(self, user_input: str) -> str:
         """ This Accesses the blackjack game and runs blackjack logic based on user input and returns result for
@@ -274,24 +532,188 @@ class InputSystem:
         Returns:
             String: returns current state of user and house hands 
         """
+        return self.registries['blackjack'].dispatch(user_input)
 
-        if user_input.lower() == "help":
-            return self.blackjack_game.get_help()
-        if user_input.lower() == "reset":
-            return self.blackjack_game.reset()
-        if user_input.lower() == "clear":
-            return self.blackjack_game.clear()
-        if user_input.lower() == "state":
-            return self.blackjack_game.game_state
-        if user_input.lower() == "save":
-            output = self.blackjack_game
-            return output
-
-        if user_input.lower() == "load":
-            self.blackjack_game = self.game_to_load
-            win_status = self.blackjack_game.win_condition()
-            return self.blackjack_game.display_state(win_status)
-        if user_input.lower() == "hit" or user_input.lower() == "stand":
-            return self.blackjack_game.start_game(user_input)
-        else:
-            return "Invalid input. User should specify hit or stand."
+    @staticmethod
+    def handle_card(user_card: str):
+        """ Finds a corresponding card based on user input and returns that card of type card. If none exist
+        it returns None
+        Args: 
+            user_card (str): string representation of Users card played
+
+        Return:
+            Card: card with rank and suit specified
+            None
+        """
+        return parse_card(user_card)
+
+    @staticmethod
+    def show_ai_moves(moves) -> str:
+        """Describe the turns the computer players took.
+
+        Args:
+            moves (Optional[List[Tuple[int, Optional[Card]]]]): seat and card
+            played for each turn, as returned by TurnScheduler
+
+        Returns:
+            str: one line per turn
+        """
+        output = ""
+        for seat, card in moves or []:
+            if card:
+                output += "Player {} played {}\n".format(seat, card)
+            else:
+                output += "Player {} drew until the cards ran out\n".format(seat)
+        return output
+
+    def _mastermind_commands(self) -> CommandRegistry:
+        return CommandRegistry(self._invalid_mastermind_input) \
+            .register("new game", self._new_mastermind) \
+            .register("continue", lambda: self.render('mastermind')) \
+            .register("clear", lambda: self.mastermind_game.clear()) \
+            .register("reset", lambda: self.mastermind_game.reset()) \
+            .register("help", lambda: self.mastermind_game.get_help()) \
+            .register("undo", lambda: self.mastermind_game.undo()) \
+            .register("redo", lambda: self.mastermind_game.redo()) \
+            .register("state", lambda: self.mastermind_game.game_state) \
+            .register("save", lambda: self.mastermind_game) \
+            .register("load", self._load_mastermind) \
+            .register_pattern(MASTERMIND_GUESS, self._guess_mastermind)
+
+    def _new_mastermind(self) -> str:
+        self.current_game = self.new_game('mastermind')
+        return "\nMastermind\n"
+
+    def _load_mastermind(self) -> str:
+        self.mastermind_game = self.game_to_load
+        return self.mastermind_game.game_state
+
+    def _guess_mastermind(self, match: Match) -> str:
+        guess = [int(char) for char in match.string if char.isdigit()]
+        return self.mastermind_game.evaluate(guess)
+
+    @staticmethod
+    def _invalid_mastermind_input(guess_input) -> str:
+        return Rejected("Invalid input. Input should be of the form \"####\"")
+
+    def _minesweeper_commands(self) -> CommandRegistry:
+        return CommandRegistry(self._invalid_minesweeper_input) \
+            .register("new game", self._new_minesweeper) \
+            .register("continue", lambda: self.render('minesweeper')) \
+            .register("reset", lambda: self.minesweeper_game.reset_game() + "\n" + self.minesweeper_game.draw_board()) \
+            .register("save", lambda: self.minesweeper_game) \
+            .register("load", self._load_minesweeper) \
+            .register("clear", lambda: self.minesweeper_game.clear_game_history() + "\n"
+                      + self.minesweeper_game.draw_board()) \
+            .register("state", lambda: self.minesweeper_game.game_state) \
+            .register("help", lambda: self.minesweeper_game.get_help()) \
+            .register("undo", lambda: self.minesweeper_game.undo()) \
+            .register("redo", lambda: self.minesweeper_game.redo()) \
+            .register_pattern(MINESWEEPER_MOVE, self._move_minesweeper)
+
+    def _new_minesweeper(self) -> str:
+        self.current_game = self.new_game('minesweeper')
+        return "Minesweeper\n" + self.minesweeper_game.draw_board()
+
+    def _load_minesweeper(self) -> str:
+        self.minesweeper_game = self.game_to_load
+        return self.minesweeper_game.draw_board()
+
+    def _move_minesweeper(self, match: Match) -> str:
+        location = [int(match.group(1)), int(match.group(2))]
+        if self.minesweeper_game.is_valid(*location):
+            return self.minesweeper_game.make_move(location)
+        return Rejected("Guess is out of bounds. Please provide input within the bounds of the grid.")
+
+    @staticmethod
+    def _invalid_minesweeper_input(location_input) -> str:
+        return Rejected("Invalid input. User should specify an x and y coordinate: \"<row>,<col>\"")
+
+    def _crazy_eights_commands(self) -> CommandRegistry:
+        return CommandRegistry(self._play_crazy_eights_card) \
+            .register("new game", self._new_crazy_eights) \
+            .register("continue", lambda: self.render('crazy_eights')) \
+            .register("help", lambda: self.crazy_eights_game.get_help()) \
+            .register("clear", lambda: self.crazy_eights_game.clear()) \
+            .register("state", lambda: self.crazy_eights_game.game_state) \
+            .register("save", lambda: self.crazy_eights_game) \
+            .register("load", self._load_crazy_eights) \
+            .register("reset", self._reset_crazy_eights) \
+            .register("draw", self._draw_crazy_eights)
+
+    def _think_ahead(self):
+        # Let computer players that search work out their replies while the user decides.
+        self.crazy_eights_turns.think_ahead(self.crazy_eights_game, CRAZY_EIGHTS_PLAYER_NUM)
+
+    def _new_crazy_eights(self) -> str:
+        self.current_game = self.new_game('crazy_eights')
+        self._think_ahead()
+        return self.render('crazy_eights')
+
+    def _load_crazy_eights(self) -> str:
+        self.crazy_eights_game = self.game_to_load
+        self._think_ahead()
+        return self.crazy_eights_game.game_state
+
+    def _reset_crazy_eights(self) -> str:
+        output = self.crazy_eights_game.reset(CRAZY_EIGHTS_NUM_PLAYERS) + "\n" + self.crazy_eights_game.game_state
+        self._think_ahead()
+        return output + "\n\nTop Card: " + self.crazy_eights_game.show_top_card() + "\n\nPlayer Hand: \n" \
+               + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM)
+
+    def _draw_crazy_eights(self) -> str:
+        self.crazy_eights_game.draw(CRAZY_EIGHTS_PLAYER_NUM)
+        self._think_ahead()
+        return "\nTop Card: " + self.crazy_eights_game.show_top_card() + "\n\nPlayer Hand: \n" \
+               + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM)
+
+    def _play_crazy_eights_card(self, card_input: str) -> str:
+        card = self.handle_card(card_input)
+        if not card:
+            invalid_str = "Invalid input. User should specify either to draw or which card to place (Ex: Eight," \
+                          "Spades)\n "
+            return Rejected(invalid_str + "\nTop Card: " + self.crazy_eights_game.show_top_card()
+                            + "\n\nPlayer Hand: \n" + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM))
+
+        curr_state = self.crazy_eights_game.game_state
+        played = self.crazy_eights_game.play(CRAZY_EIGHTS_PLAYER_NUM, card)
+        not_str = 'not ' if not played else ''
+        table_str = 'Top Card: ' + self.crazy_eights_game.show_top_card()
+        # Let the computer players respond, unless the user ended the round.
+        if played and curr_state == self.crazy_eights_game.game_state:
+            ai_moves = self.crazy_eights_turns.advance(self.crazy_eights_game, CRAZY_EIGHTS_PLAYER_NUM)
+            table_str = self.show_ai_moves(ai_moves) + 'Top Card: ' + self.crazy_eights_game.show_top_card()
+        game_output = 'card {} was '.format(str(card)) + not_str + 'played \n' + table_str \
+                      + "\n\nPlayer Hand: \n" \
+                      + self.crazy_eights_game.show_player_hand(CRAZY_EIGHTS_PLAYER_NUM)
+        if not played:
+            return Rejected(game_output)
+        if curr_state != self.crazy_eights_game.game_state:
+            score = self.crazy_eights_game.players.get(CRAZY_EIGHTS_PLAYER_NUM).get_score()
+            return self.crazy_eights_game.game_state + "\nScore: " + str(score) + "\n" + game_output
+        return game_output
+
+    def _blackjack_commands(self) -> CommandRegistry:
+        return CommandRegistry(lambda user_input: Rejected("Invalid input. User should specify hit or stand.")) \
+            .register("new game", self._new_blackjack) \
+            .register("continue", lambda: self.render('blackjack')) \
+            .register("help", lambda: self.blackjack_game.get_help()) \
+            .register("reset", lambda: self.blackjack_game.reset()) \
+            .register("clear", lambda: self.blackjack_game.clear()) \
+            .register("state", lambda: self.blackjack_game.game_state) \
+            .register("save", lambda: self.blackjack_game) \
+            .register("load", self._load_blackjack) \
+            .register("hit", lambda: self.blackjack_game.start_game("hit")) \
+            .register("stand", lambda: self.blackjack_game.start_game("stand"))
+
+    def _new_blackjack(self) -> str:
+        self.current_game = self.new_game('blackjack')
+        return "\n Blackjack\n" + "\nHouse's revealed card: " \
+               + str(self.blackjack_game.house.get_cards()[0].get_rank().value) + " \n\nPlayer Hand: \n" \
+               + str(self.blackjack_game.user.get_cards()[0].get_rank().value) + ", " \
+               + str(self.blackjack_game.user.get_cards()[1].get_rank().value) + "\n"
+
+    def _load_blackjack(self) -> str:
+        self.blackjack_game = self.game_to_load
+        win_status = self.blackjack_game.win_condition()
+        return self.blackjack_game.display_state(win_status)
@@ -0,0 +1,265 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Callable, Dict, Iterable, List, NamedTuple, Tuple
+import queue
+import threading
+import time
+
+# Scores shown on each game's leaderboard.
+LEADERBOARD_SIZE = 10
+
+# Periods a leaderboard can cover, each counting from the start of its UTC
+# day, week or time.
+DAILY = 'daily'
+WEEKLY = 'weekly'
+ALL_TIME = 'all_time'
+PERIODS = (DAILY, WEEKLY, ALL_TIME)
+
+# Most scores written to the database in one batch.
+WRITE_BATCH_SIZE = 100
+
+# Seconds a score waits for others to be written along with it.
+FLUSH_INTERVAL = 0.5
+
+# Most scores waiting to be written; more are dropped.
+MAX_QUEUED = 10000
+
+_STOP = object()
+
+
+class ScoreRecord(NamedTuple):
+    """Score of a finished game, waiting to be written or on a leaderboard."""
+    game: str  # subdirectory of the game
+    user_id: int
+    score: int
+    created_at: Optional[datetime] = None  # UTC time the game ended; None for now
+
+
+def utc_now() -> datetime:
+    """
+    Returns:
+        datetime: current UTC time, without a time zone as the database stores it
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def window_start(period: str, when: datetime) -> datetime:
+    """
+    Args:
+        period (str): one of PERIODS
+        when (datetime): UTC time in the window
+
+    Returns:
+        datetime: start of the window of the period that the time falls in:
+        midnight for daily, midnight on Monday for weekly, and datetime.min
+        for all-time
+    """
+    if period == ALL_TIME:
+        return datetime.min
+    day = datetime(when.year, when.month, when.day)
+    if period == DAILY:
+        return day
+    if period == WEEKLY:
+        return day - timedelta(days=day.weekday())
+    raise ValueError('No period {}'.format(period))
+
+
+class Leaderboard:
+    """Best scores of each game in each period, kept in memory so showing a
+    leaderboard does not query the database. A leaderboard is loaded from the
+    database the first time it is shown, and kept up to date as scores are
+    written. Daily and weekly leaderboards start over empty once their window
+    ends.
+
+    Args:
+        size (Optional[int], optional): scores kept on each leaderboard.
+        Defaults to LEADERBOARD_SIZE.
+    """
+    def __init__(self, size: Optional[int] = LEADERBOARD_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        # (game, period) -> (start of the window, best scores in it)
+        self._boards = {}  # type: Dict[Tuple[str, str], Tuple[datetime, List[ScoreRecord]]]
+
+    def load(self, game: str, records: Iterable[ScoreRecord], period: Optional[str] = ALL_TIME,
+             now: Optional[datetime] = None):
+        """Fill in a leaderboard from the database.
+
+        Args:
+            game (str): subdirectory of the game
+            records (Iterable[ScoreRecord]): best scores of the game in the
+            current window of the period
+            period (Optional[str], optional): one of PERIODS. Defaults to
+            ALL_TIME.
+            now (Optional[datetime], optional): current UTC time. Defaults to
+            None (utc_now()).
+        """
+        top = sorted(records, key=lambda record: record.score, reverse=True)
+        start = window_start(period, now or utc_now())
+        with self._lock:
+            self._boards[(game, period)] = (start, top[:self.size])
+
+    def add(self, records: Iterable[ScoreRecord]):
+        """Add written scores to the leaderboards that have been loaded. The
+        others will include them once they are loaded.
+
+        Args:
+            records (Iterable[ScoreRecord]): scores written to the database
+        """
+        with self._lock:
+            for record in records:
+                created_at = record.created_at or utc_now()
+                for period in PERIODS:
+                    board = self._boards.get((record.game, period))
+                    if board is None:
+                        continue
+                    start, top = board
+                    record_start = window_start(period, created_at)
+                    if record_start < start:
+                        continue  # the score's window is over
+                    if record_start > start:
+                        top = []  # the first score of a new window
+                        self._boards[(record.game, period)] = (record_start, top)
+                    top.append(record)
+                    top.sort(key=lambda entry: entry.score, reverse=True)
+                    del top[self.size:]
+
+    def top(self, game: str, period: Optional[str] = ALL_TIME,
+            now: Optional[datetime] = None) -> Optional[List[ScoreRecord]]:
+        """
+        Args:
+            game (str): subdirectory of the game
+            period (Optional[str], optional): one of PERIODS. Defaults to
+            ALL_TIME.
+            now (Optional[datetime], optional): current UTC time. Defaults to
+            None (utc_now()).
+
+        Returns:
+            Optional[List[ScoreRecord]]: best scores of the game in the
+            current window of the period, best first; None if they have not
+            been loaded
+        """
+        start = window_start(period, now or utc_now())
+        with self._lock:
+            board = self._boards.get((game, period))
+            if board is None:
+                return None
+            if board[0] < start:
+                # No score has been written since the window ended.
+                board = self._boards[(game, period)] = (start, [])
+            return list(board[1])
+
+    def forget(self, game: str):
+        """Drop the leaderboards of a game, e.g. after a high score was changed
+        or deleted, so they are loaded again.
+
+        Args:
+            game (str): subdirectory of the game
+        """
+        with self._lock:
+            for period in PERIODS:
+                self._boards.pop((game, period), None)
+
+
+class ScoreWriter:
+    """Write the scores of finished games behind the games: scores are queued
+    and a background thread writes them in batches, so finishing a game never
+    waits on the database.
+
+    Args:
+        store (Callable[[List[ScoreRecord]], None]): writes a batch of scores
+        to the database at once, on the writer thread
+        leaderboard (Optional[Leaderboard], optional): updated with each batch
+        once it is written. Defaults to None.
+        batch_size (Optional[int], optional): most scores written at once.
+        Defaults to WRITE_BATCH_SIZE.
+        flush_interval (Optional[float], optional): seconds a score waits for
+        others to be written with it. Defaults to FLUSH_INTERVAL.
+        max_queued (Optional[int], optional): most scores waiting to be
+        written. Defaults to MAX_QUEUED.
+    """
+    def __init__(self, store: Callable[[List[ScoreRecord]], None],
+                 leaderboard: Optional[Leaderboard] = None,
+                 batch_size: Optional[int] = WRITE_BATCH_SIZE,
+                 flush_interval: Optional[float] = FLUSH_INTERVAL,
+                 max_queued: Optional[int] = MAX_QUEUED):
+        self.store = store
+        self.leaderboard = leaderboard
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.failed = 0  # scores lost because their batch could not be written
+        self._queue = queue.Queue(max_queued)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def record(self, user_id: int, game: str, score: int) -> bool:
+        """Queue the score of a finished game to be written.
+
+        Args:
+            user_id (int): id of the user who played the game
+            game (str): subdirectory of the game
+            score (int): score the game ended with
+
+        Returns:
+            bool: whether the score was queued; False if too many are waiting
+        """
+        self._start()
+        try:
+            self._queue.put_nowait(ScoreRecord(game, user_id, score, utc_now()))
+        except queue.Full:
+            return False
+        return True
+
+    def flush(self):
+        """Wait until every queued score has been written.
+        """
+        self._queue.join()
+
+    def stop(self):
+        """Write the queued scores and stop the writer thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            self._write(batch)
+            for _ in range(len(batch) + stopping):
+                self._queue.task_done()
+
+    def _write(self, batch: List[ScoreRecord]):
+        if not batch:
+            return
+        try:
+            self.store(batch)
+        except Exception:  # the database is unavailable; the batch is lost
+            self.failed += len(batch)
+            return
+        self.written += len(batch)
+        if self.leaderboard:
+            self.leaderboard.add(batch)
@@ -0,0 +1,293 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent import futures
+from typing import Optional, Dict, List, NamedTuple, Callable
+import asyncio
+import threading
+import time
+from pyarcade.tables import Table, TableService
+
+# Rating of players who have not been rated yet.
+DEFAULT_RATING = 1000
+
+# Players a Crazy Eights table can seat; the CrazyEights constructor supports
+# from 2 to 7.
+MIN_TABLE_SIZE = 2
+MAX_TABLE_SIZE = 7
+
+# Number of recent wait times the wait-time metrics are taken over.
+RECENT_WAITS = 1000
+
+
+class Match(NamedTuple):
+    """Table a queued player was seated at."""
+    table_id: int
+    seat: int
+    waited: float  # seconds spent in the queue
+
+
+class Ticket:
+    """A player waiting in the matchmaking queue.
+
+    Args:
+        username (str): name of the player
+        game (str): subdirectory of the game the player wants to play
+        rating (int): rating of the player
+        enqueued_at (float): clock time the player joined the queue
+        future (asyncio.Future): resolved to the player's Match
+    """
+    __slots__ = ('username', 'game', 'rating', 'enqueued_at', 'future')
+
+    def __init__(self, username: str, game: str, rating: int, enqueued_at: float,
+                 future: asyncio.Future):
+        self.username = username
+        self.game = game
+        self.rating = rating
+        self.enqueued_at = enqueued_at
+        self.future = future
+
+
+class Matchmaker:
+    """Group queued players into multiplayer tables.
+
+    Players queue for a game with a rating. Every interval the matchmaker
+    makes one pass over each game's queue, oldest player first, and seats
+    that player with the closest-rated players whose ratings are within both
+    players' windows. Each window starts at rating_window and widens by
+    window_growth for every second a player waits. A table is opened once
+    target_size players fit together, or once the oldest of at least two has
+    waited fill_time seconds.
+
+    The matchmaker runs on its own asyncio event loop. Coroutines such as
+    find_table() must run on that loop; other threads use submit(), cancel()
+    and get_metrics().
+
+    Args:
+        table_service (TableService): service that opens the tables
+        target_size (Optional[int], optional): players per table from [2, 7].
+        Defaults to 4.
+        fill_time (Optional[float], optional): seconds before a smaller table
+        is opened. Defaults to 10.
+        rating_window (Optional[int], optional): rating difference allowed
+        when a player joins the queue. Defaults to 100.
+        window_growth (Optional[int], optional): rating difference added per
+        second of waiting. Defaults to 20.
+        interval (Optional[float], optional): seconds between matching passes.
+        Defaults to 0.25.
+        clock (Optional[Callable[[], float]], optional): clock wait times are
+        measured with. Defaults to time.monotonic.
+    """
+    games = ('crazy_eights',)
+
+    def __init__(self, table_service: TableService,
+                 target_size: Optional[int] = 4,
+                 fill_time: Optional[float] = 10.0,
+                 rating_window: Optional[int] = 100,
+                 window_growth: Optional[int] = 20,
+                 interval: Optional[float] = 0.25,
+                 clock: Optional[Callable[[], float]] = time.monotonic):
+        if target_size < MIN_TABLE_SIZE or target_size > MAX_TABLE_SIZE:
+            raise ValueError('Tables seat {} to {} players'.format(MIN_TABLE_SIZE, MAX_TABLE_SIZE))
+        self.table_service = table_service
+        self.target_size = target_size
+        self.fill_time = fill_time
+        self.rating_window = rating_window
+        self.window_growth = window_growth
+        self.interval = interval
+        self.clock = clock
+
+        self._queues = {game: [] for game in self.games}  # type: Dict[str, List[Ticket]]
+        self._tickets = {}  # type: Dict[str, Ticket]
+        self._lock = threading.Lock()  # guards the queues against other threads
+        self._waits = deque(maxlen=RECENT_WAITS)
+        self.players_matched = 0
+        self.tables_opened = 0
+
+        self._loop = None
+        self._thread = None
+
+    async def find_table(self, username: str, game: Optional[str] = 'crazy_eights',
+                         rating: Optional[int] = DEFAULT_RATING) -> Match:
+        """Queue a player and wait until they are seated. A player already in
+        the queue keeps their place.
+
+        Args:
+            username (str): name of the player
+            game (Optional[str], optional): game to play. Defaults to
+            'crazy_eights'.
+            rating (Optional[int], optional): rating of the player. Defaults to
+            DEFAULT_RATING.
+
+        Returns:
+            Match: table and seat of the player
+        """
+        if game not in self._queues:
+            raise ValueError('No matchmaking for {}'.format(game))
+
+        ticket = self._tickets.get(username)
+        if not ticket:
+            ticket = Ticket(username, game, rating, self.clock(),
+                            asyncio.get_running_loop().create_future())
+            with self._lock:
+                self._tickets[username] = ticket
+                self._queues[game].append(ticket)
+        return await asyncio.shield(ticket.future)
+
+    def match(self) -> List[Table]:
+        """Make one matching pass over every queue, opening all the tables
+        that can be filled.
+
+        Returns:
+            List[Table]: tables opened
+        """
+        now = self.clock()
+        groups = []
+        with self._lock:
+            for game, tickets in self._queues.items():
+                game_groups = self._group(tickets, now)
+                if not game_groups:
+                    continue
+                # Rebuild the queue once rather than removing each player.
+                matched = set(t.username for group in game_groups for t in group)
+                self._queues[game] = [t for t in tickets if t.username not in matched]
+                for username in matched:
+                    ticket = self._tickets.pop(username)
+                    self._waits.append(now - ticket.enqueued_at)
+                groups.extend(game_groups)
+        return [self._open_table(group, now) for group in groups]
+
+    def cancel(self, username: str) -> bool:
+        """Take a player out of the queue. Safe to call from any thread.
+
+        Args:
+            username (str): name of the player
+
+        Returns:
+            bool: whether the player was queued
+        """
+        with self._lock:
+            ticket = self._tickets.pop(username, None)
+            if ticket:
+                self._queues[ticket.game].remove(ticket)
+        if ticket:
+            self._call(ticket.future.cancel)
+        return ticket is not None
+
+    def get_metrics(self) -> dict:
+        """Get the queue depths and wait times. Safe to call from any thread.
+
+        Returns:
+            dict: players queued per game, the longest current wait, the mean
+            and 95th percentile of recent waits, and players matched and
+            tables opened so far
+        """
+        now = self.clock()
+        with self._lock:
+            depths = {game: len(tickets) for game, tickets in self._queues.items()}
+            oldest = min((t.enqueued_at for t in self._tickets.values()), default=now)
+            waits = sorted(self._waits)
+        return {
+            'queue_depth': depths,
+            'longest_wait': now - oldest,
+            'mean_wait': sum(waits) / len(waits) if waits else 0.0,
+            'p95_wait': waits[int(0.95 * (len(waits) - 1))] if waits else 0.0,
+            'players_matched': self.players_matched,
+            'tables_opened': self.tables_opened
+        }
+
+    async def run(self):
+        """Match players every interval until cancelled.
+        """
+        while True:
+            self.match()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> Matchmaker:
+        """Run the matchmaker on an event loop in a background thread.
+
+        Returns:
+            Matchmaker: the started matchmaker
+        """
+        with self._lock:
+            if not self._thread:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run_loop, daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background event loop.
+        """
+        if self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, username: str, game: Optional[str] = 'crazy_eights',
+               rating: Optional[int] = DEFAULT_RATING) -> futures.Future:
+        """Queue a player from another thread. The matchmaker must be started.
+
+        Args:
+            username (str): name of the player
+            game (Optional[str], optional): game to play. Defaults to
+            'crazy_eights'.
+            rating (Optional[int], optional): rating of the player. Defaults to
+            DEFAULT_RATING.
+
+        Returns:
+            futures.Future: resolves to the player's Match
+        """
+        if game not in self._queues:
+            raise ValueError('No matchmaking for {}'.format(game))
+        return asyncio.run_coroutine_threadsafe(self.find_table(username, game, rating), self._loop)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        task = self._loop.create_task(self.run())
+        self._loop.run_forever()
+        task.cancel()
+        self._loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        self._loop.close()
+
+    def _call(self, callback: Callable):
+        if self._loop and self._loop.is_running() and self._thread is not threading.current_thread():
+            self._loop.call_soon_threadsafe(callback)
+        else:
+            callback()
+
+    def _window(self, ticket: Ticket, now: float) -> float:
+        return self.rating_window + self.window_growth * (now - ticket.enqueued_at)
+
+    def _group(self, tickets: List[Ticket], now: float) -> List[List[Ticket]]:
+        by_rating = sorted(tickets, key=lambda t: t.rating)
+        ratings = [t.rating for t in by_rating]
+        taken = set()
+        groups = []
+        for anchor in sorted(tickets, key=lambda t: t.enqueued_at):
+            if anchor.username in taken:
+                continue
+            # Only players within the anchor's window can be grouped with it.
+            window = self._window(anchor, now)
+            low = bisect_left(ratings, anchor.rating - window)
+            high = bisect_right(ratings, anchor.rating + window)
+            nearby = [t for t in by_rating[low:high]
+                      if t is not anchor and t.username not in taken and
+                      abs(t.rating - anchor.rating) <= self._window(t, now)]
+            nearby.sort(key=lambda t: abs(t.rating - anchor.rating))
+            group = [anchor] + nearby[:self.target_size - 1]
+            if len(group) == self.target_size or (
+                    len(group) >= MIN_TABLE_SIZE and now - anchor.enqueued_at >= self.fill_time):
+                taken.update(t.username for t in group)
+                groups.append(group)
+        return groups
+
+    def _open_table(self, group: List[Ticket], now: float) -> Table:
+        table = self.table_service.create_table(len(group))
+        for ticket in group:
+            match = Match(table.table_id, table.join(ticket.username), now - ticket.enqueued_at)
+            if not ticket.future.done():
+                ticket.future.set_result(match)
+        self.players_matched += len(group)
+        self.tables_opened += 1
+        return table
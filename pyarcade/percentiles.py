@@ -0,0 +1,285 @@
+from __future__ import annotations
+from typing import Optional, Dict, Iterable, List, Tuple
+import json
+import math
+import os
+import threading
+
+# Each bucket holds scores up to this many times larger than the last one's,
+# so estimates are off by at most 10% of the score.
+BUCKET_GROWTH = 1.1
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+# Seconds between saves of the histograms.
+SAVE_INTERVAL = 60.0
+
+# Version of the file the histograms are saved to.
+_FILE_VERSION = 1
+
+
+def bucket_of(score: int) -> int:
+    """
+    Args:
+        score (int): score to place
+
+    Returns:
+        int: bucket of the score; 0 holds every score below 1
+    """
+    if score < 1:
+        return 0
+    return 1 + int(math.log(score) / _LOG_GROWTH)
+
+
+def bucket_bounds(bucket: int) -> Tuple[float, float]:
+    """
+    Args:
+        bucket (int): bucket to get the bounds of
+
+    Returns:
+        Tuple[float, float]: lowest score of the bucket and the lowest of the next
+    """
+    if bucket == 0:
+        return 0.0, 1.0
+    return BUCKET_GROWTH ** (bucket - 1), BUCKET_GROWTH ** bucket
+
+
+class ScoreHistogram:
+    """Number of scores of a game in buckets that grow by BUCKET_GROWTH, so
+    any range of scores takes few buckets and every query is O(buckets).
+
+    Args:
+        counts (Optional[List[int]], optional): number of scores in each
+        bucket. Defaults to None (no scores).
+    """
+    def __init__(self, counts: Optional[List[int]] = None):
+        self.counts = list(counts or [])
+        self.total = sum(self.counts)
+
+    def add(self, score: int, count: Optional[int] = 1):
+        """
+        Args:
+            score (int): score to add
+            count (Optional[int], optional): times to add it. Defaults to 1.
+        """
+        bucket = bucket_of(score)
+        if bucket >= len(self.counts):
+            self.counts.extend([0] * (bucket + 1 - len(self.counts)))
+        self.counts[bucket] += count
+        self.total += count
+
+    def remove(self, score: int, count: Optional[int] = 1):
+        """
+        Args:
+            score (int): score to remove, e.g. of a deleted high score
+            count (Optional[int], optional): times to remove it. Defaults to 1.
+        """
+        bucket = bucket_of(score)
+        if bucket < len(self.counts):
+            count = min(count, self.counts[bucket])
+            self.counts[bucket] -= count
+            self.total -= count
+
+    def count_below(self, score: int) -> float:
+        """Estimate how many scores are lower than a score, assuming the scores
+        in its bucket are spread evenly.
+
+        Args:
+            score (int): score to compare with
+
+        Returns:
+            float: estimated number of lower scores
+        """
+        bucket = bucket_of(score)
+        if bucket >= len(self.counts):
+            return float(self.total)
+        lower, upper = bucket_bounds(bucket)
+        fraction = min(max((score - lower) / (upper - lower), 0.0), 1.0)
+        return sum(self.counts[:bucket]) + self.counts[bucket] * fraction
+
+    def percentile(self, score: int) -> float:
+        """
+        Args:
+            score (int): score to compare with
+
+        Returns:
+            float: estimated percentage of scores lower than the score; 100.0
+            if there are none yet
+        """
+        if not self.total:
+            return 100.0
+        return 100.0 * self.count_below(score) / self.total
+
+    def rank(self, score: int) -> int:
+        """
+        Args:
+            score (int): score to compare with
+
+        Returns:
+            int: estimated place the score would take, 1 being the best
+        """
+        return int(round(self.total - self.count_below(score))) + 1
+
+
+class ScoreHistograms:
+    """Histogram of the high scores of each game, kept up to date as scores are
+    added so percentiles and ranks never query the database. They are seeded
+    from the database once, and saved to a file along with the id of the last
+    high score they include, so only newer scores are read on the next start.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}  # type: Dict[str, ScoreHistogram]
+        self.last_id = 0  # highest id of the high scores included
+        self._changed = False
+        self._stop_saving = None
+
+    def add(self, game: str, score: int, count: Optional[int] = 1,
+            high_score_id: Optional[int] = None):
+        """
+        Args:
+            game (str): subdirectory of the game
+            score (int): score to add
+            count (Optional[int], optional): times to add it. Defaults to 1.
+            high_score_id (Optional[int], optional): highest id of the high
+            scores added. Defaults to None.
+        """
+        with self._lock:
+            self._histograms.setdefault(game, ScoreHistogram()).add(score, count)
+            if high_score_id is not None:
+                self.last_id = max(self.last_id, high_score_id)
+            self._changed = True
+
+    def add_records(self, records: Iterable, high_score_id: Optional[int] = None):
+        """Add written scores.
+
+        Args:
+            records (Iterable[ScoreRecord]): scores written to the database
+            high_score_id (Optional[int], optional): highest id of the high
+            scores written. Defaults to None.
+        """
+        with self._lock:
+            for record in records:
+                self._histograms.setdefault(record.game, ScoreHistogram()).add(record.score)
+            if high_score_id is not None:
+                self.last_id = max(self.last_id, high_score_id)
+            self._changed = True
+
+    def remove(self, game: str, score: int):
+        """Take out a score that was changed or deleted.
+
+        Args:
+            game (str): subdirectory of the game
+            score (int): score to remove
+        """
+        with self._lock:
+            histogram = self._histograms.get(game)
+            if histogram:
+                histogram.remove(score)
+                self._changed = True
+
+    def get_histogram(self, game: str) -> ScoreHistogram:
+        """
+        Args:
+            game (str): subdirectory of the game
+
+        Returns:
+            ScoreHistogram: copy of the histogram of the game
+        """
+        with self._lock:
+            histogram = self._histograms.get(game)
+            return ScoreHistogram(histogram.counts if histogram else None)
+
+    def percentile(self, game: str, score: int) -> float:
+        """
+        Args:
+            game (str): subdirectory of the game
+            score (int): score to compare with
+
+        Returns:
+            float: estimated percentage of the game's scores lower than the score
+        """
+        return self.get_histogram(game).percentile(score)
+
+    def rank(self, game: str, score: int) -> int:
+        """
+        Args:
+            game (str): subdirectory of the game
+            score (int): score to compare with
+
+        Returns:
+            int: estimated place the score would take among the game's scores
+        """
+        return self.get_histogram(game).rank(score)
+
+    def save(self, path: str) -> bool:
+        """Save the histograms if they changed since they were last saved. The
+        file is replaced at once, so it is never left half written.
+
+        Args:
+            path (str): file to save to
+
+        Returns:
+            bool: whether the histograms were saved
+        """
+        with self._lock:
+            if not self._changed:
+                return False
+            data = {
+                'version': _FILE_VERSION,
+                'growth': BUCKET_GROWTH,
+                'last_id': self.last_id,
+                'games': {game: list(histogram.counts) for game, histogram in self._histograms.items()}
+            }
+            self._changed = False
+        with open(path + '.tmp', 'w') as file:
+            json.dump(data, file)
+        os.replace(path + '.tmp', path)
+        return True
+
+    def load(self, path: str) -> bool:
+        """Load histograms saved by save(), replacing these.
+
+        Args:
+            path (str): file to load from
+
+        Returns:
+            bool: whether the file could be loaded; a missing file, or one
+            saved with different buckets, cannot
+        """
+        try:
+            with open(path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != _FILE_VERSION or data.get('growth') != BUCKET_GROWTH:
+            return False
+        with self._lock:
+            self._histograms = {game: ScoreHistogram(counts) for game, counts in data['games'].items()}
+            self.last_id = data['last_id']
+            self._changed = False
+        return True
+
+    def start_saving(self, path: str, interval: Optional[float] = SAVE_INTERVAL):
+        """Save the histograms every so often on a background thread.
+
+        Args:
+            path (str): file to save to
+            interval (Optional[float], optional): seconds between saves.
+            Defaults to SAVE_INTERVAL.
+        """
+        self.stop_saving()
+        stop = self._stop_saving = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.save(path)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def stop_saving(self):
+        """Stop saving the histograms in the background.
+        """
+        if self._stop_saving:
+            self._stop_saving.set()
+            self._stop_saving = None
+
@@ -0,0 +1,320 @@
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Iterable, Iterator, List, NamedTuple, TextIO, Tuple
+import argparse
+import hashlib
+import itertools
+import json
+import sys
+import threading
+import time
+from pyarcade.input_system import InputSystem, normalize
+
+# Recordings each worker task replays before reporting back.
+CHUNK_SIZE = 16
+
+# Inputs whose replies depend on state outside the recording.
+_UNREPLAYABLE = ('load',)
+
+# Most games recorded in memory at once. Once there are more, the oldest is
+# written to the recorder's log, or dropped if it has none.
+MAX_RECORDED_GAMES = 10000
+
+
+class Recording(NamedTuple):
+    """Inputs given to one game of a seeded session, and a hash of the
+    replies they got."""
+    game: str  # name of the game, as given to handle_game_input
+    seed: int
+    inputs: Tuple[str, ...]
+    output_hash: str
+
+
+class ReplayResult(NamedTuple):
+    """Outcome of replaying one recording."""
+    game: str
+    moves: int
+    seconds: float
+    output_hash: str
+    diverged: bool  # whether the replies differed from the recorded ones
+
+
+def _output_bytes(output) -> bytes:
+    # Saves reply with the game itself, which only hashes by type.
+    return (output if isinstance(output, str) else type(output).__name__).encode()
+
+
+def hash_outputs(outputs: Iterable) -> str:
+    """Hash replies in order.
+
+    Args:
+        outputs (Iterable): replies of handle_game_input
+
+    Returns:
+        str: hex digest of the replies
+    """
+    digest = hashlib.sha1()
+    for output in outputs:
+        digest.update(_output_bytes(output))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class Recorder:
+    """Record the inputs and a running hash of the replies of every game
+    played in seeded sessions, to replay them later. Pass it to each
+    InputSystem as its recorder: each session records through its own
+    handle from session(), so sessions that share a seed are kept apart,
+    and the sessions may run on different threads.
+
+    Games that load a save cannot be replayed, so their recordings are
+    dropped from the load onwards. A session's games are written to the log
+    when it is closed, and the oldest game is written early once more than
+    max_games are being recorded.
+
+    Args:
+        log (Optional[TextIO], optional): file finished recordings are
+        written to, as by write(). Defaults to None (they are dropped).
+        max_games (Optional[int], optional): most games kept in memory.
+        Defaults to MAX_RECORDED_GAMES.
+    """
+    def __init__(self, log: Optional[TextIO] = None,
+                 max_games: Optional[int] = MAX_RECORDED_GAMES):
+        self.log = log
+        self.max_games = max_games
+        self._lock = threading.Lock()
+        self._session_ids = itertools.count(1)
+        # (session id, game) -> (session, name of the game, inputs, hash of the replies)
+        self._games = OrderedDict()  # type: OrderedDict[Tuple[int, str], tuple]
+
+    def session(self, seed: int) -> SessionRecorder:
+        """Start recording a session.
+
+        Args:
+            seed (int): seed of the session
+
+        Returns:
+            SessionRecorder: handle the session records its games through
+        """
+        return SessionRecorder(self, next(self._session_ids), seed)
+
+    def get_recordings(self) -> List[Recording]:
+        """
+        Returns:
+            List[Recording]: recording of every game still in memory
+        """
+        with self._lock:
+            return [self._recording(game) for game in self._games.values()]
+
+    def write(self, log: TextIO) -> int:
+        """Write the recordings in memory to a log, one JSON array per line.
+
+        Args:
+            log (TextIO): file to write to
+
+        Returns:
+            int: number of recordings written
+        """
+        recordings = self.get_recordings()
+        for recording in recordings:
+            _write_recording(log, recording)
+        return len(recordings)
+
+    def _record(self, session: SessionRecorder, game_name: str, user_input: str, output):
+        game = normalize(game_name)
+        key = (session.session_id, game)
+        with self._lock:
+            if game in session.stopped:
+                return
+            if normalize(user_input) in _UNREPLAYABLE:
+                session.stopped.add(game)
+                session.recording.discard(game)
+                self._games.pop(key, None)
+                return
+            if key not in self._games:
+                self._games[key] = (session, game_name, [], hashlib.sha1())
+                session.recording.add(game)
+                if len(self._games) > self.max_games:
+                    (_, oldest_game), oldest = self._games.popitem(last=False)
+                    oldest[0].recording.discard(oldest_game)
+                    oldest[0].stopped.add(oldest_game)
+                    self._flush(oldest)
+            _, _, inputs, digest = self._games[key]
+            inputs.append(user_input)
+            digest.update(_output_bytes(output))
+            digest.update(b'\0')
+
+    def _get_inputs(self, session: SessionRecorder, game_name: str) -> Optional[Tuple[str, ...]]:
+        with self._lock:
+            game = self._games.get((session.session_id, normalize(game_name)))
+            return tuple(game[2]) if game else None
+
+    def _close(self, session: SessionRecorder):
+        with self._lock:
+            for game in session.recording:
+                self._flush(self._games.pop((session.session_id, game)))
+            session.stopped.update(session.recording)
+            session.recording.clear()
+
+    def _flush(self, game: tuple):
+        if self.log:
+            _write_recording(self.log, self._recording(game))
+            self.log.flush()
+
+    @staticmethod
+    def _recording(game: tuple) -> Recording:
+        session, game_name, inputs, digest = game
+        return Recording(game_name, session.seed, tuple(inputs), digest.copy().hexdigest())
+
+
+class SessionRecorder:
+    """Handle one session records its games through, from Recorder.session.
+
+    Args:
+        recorder (Recorder): recorder the games are kept in
+        session_id (int): id of the session within the recorder
+        seed (int): seed of the session
+    """
+    def __init__(self, recorder: Recorder, session_id: int, seed: int):
+        self.recorder = recorder
+        self.session_id = session_id
+        self.seed = seed
+        self.recording = set()  # normalized names of the games being recorded
+        self.stopped = set()  # normalized names of the games no longer recorded
+
+    def record(self, game_name: str, user_input: str, output):
+        """Record an input and its reply.
+
+        Args:
+            game_name (str): name of the game
+            user_input (str): input to the game
+            output: reply of handle_game_input
+        """
+        self.recorder._record(self, game_name, user_input, output)
+
+    def get_inputs(self, game_name: str) -> Optional[Tuple[str, ...]]:
+        """
+        Args:
+            game_name (str): name of the game
+
+        Returns:
+            Optional[Tuple[str, ...]]: every input given to the game in the
+            session so far; None if it is not being recorded
+        """
+        return self.recorder._get_inputs(self, game_name)
+
+    def close(self):
+        """Stop recording the session and write its games to the log.
+        """
+        self.recorder._close(self)
+
+
+def _write_recording(log: TextIO, recording: Recording):
+    log.write(json.dumps([recording.game, recording.seed, list(recording.inputs),
+                          recording.output_hash], separators=(',', ':')) + '\n')
+
+
+def read_log(log: TextIO) -> Iterator[Recording]:
+    """Read recordings written by Recorder.write.
+
+    Args:
+        log (TextIO): file to read from
+
+    Returns:
+        Iterator[Recording]: recordings in the order they were written
+    """
+    for line in log:
+        if line.strip():
+            game, seed, inputs, output_hash = json.loads(line)
+            yield Recording(game, seed, tuple(inputs), output_hash)
+
+
+def replay(recording: Recording) -> ReplayResult:
+    """Replay a recording in a fresh session.
+
+    Args:
+        recording (Recording): recording to replay
+
+    Returns:
+        ReplayResult: time taken and whether the replies matched
+    """
+    input_system = InputSystem(seed=recording.seed)
+    handle = input_system.handle_game_input
+    start = time.perf_counter()
+    outputs = [handle(recording.game, user_input) for user_input in recording.inputs]
+    seconds = time.perf_counter() - start
+    output_hash = hash_outputs(outputs)
+    return ReplayResult(recording.game, len(recording.inputs), seconds, output_hash,
+                        output_hash != recording.output_hash)
+
+
+def replay_all(recordings: Iterable[Recording], workers: Optional[int] = None,
+               chunk_size: Optional[int] = CHUNK_SIZE) -> List[ReplayResult]:
+    """Replay recordings across worker processes.
+
+    Args:
+        recordings (Iterable[Recording]): recordings to replay
+        workers (Optional[int], optional): number of worker processes; 1
+        replays in this process. Defaults to None (one per CPU).
+        chunk_size (Optional[int], optional): recordings per worker task.
+        Defaults to CHUNK_SIZE.
+
+    Returns:
+        List[ReplayResult]: result of each recording, in order
+    """
+    if workers == 1:
+        return [replay(recording) for recording in recordings]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(replay, recordings, chunksize=chunk_size))
+
+
+def summarize(results: Iterable[ReplayResult]) -> Dict[str, dict]:
+    """Total up replay results by game.
+
+    Args:
+        results (Iterable[ReplayResult]): results to total
+
+    Returns:
+        Dict[str, dict]: recordings, moves, moves per second of replay time
+        and diverged recordings of each game
+    """
+    totals = {}
+    for result in results:
+        game = totals.setdefault(normalize(result.game), {
+            'recordings': 0, 'moves': 0, 'seconds': 0.0, 'diverged': 0})
+        game['recordings'] += 1
+        game['moves'] += result.moves
+        game['seconds'] += result.seconds
+        game['diverged'] += result.diverged
+    for game in totals.values():
+        game['moves_per_sec'] = game['moves'] / game['seconds'] if game['seconds'] else 0.0
+    return totals
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point, installed as pyarcade-replay. Exits with
+    status 1 if any recording diverged.
+
+    Args:
+        argv (Optional[List[str]], optional): command line arguments. Defaults
+        to None (sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Replay recorded PyArcade sessions and check their replies.")
+    parser.add_argument("log", help="log written by Recorder.write")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    with open(args.log) as log:
+        recordings = list(read_log(log))
+    results = replay_all(recordings, args.workers)
+    totals = summarize(results)
+    for name, game in sorted(totals.items()):
+        print("{}: {} recordings, {} moves, {:.0f} moves/sec, {} diverged".format(
+            name, game['recordings'], game['moves'], game['moves_per_sec'], game['diverged']))
+    if any(game['diverged'] for game in totals.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Optional, Callable, Dict, List, NamedTuple, Tuple
+import itertools
+import secrets
+import threading
+from pyarcade.input_system import InputSystem
+
+# Worker processes replaying submitted games.
+VERIFY_WORKERS = 2
+
+# Most submissions waiting to be verified; more are turned away.
+MAX_PENDING = 64
+
+# Most inputs a submitted game may have.
+MAX_SCORE_MOVES = 10000
+
+# Number of finished verifications whose outcome can still be looked up.
+RECENT_RESULTS = 1000
+
+# Most play sessions whose seeds and finished games are kept; the least
+# recently used are dropped.
+MAX_SESSIONS = 10000
+
+# Most finished games kept per play session; the oldest are dropped.
+MAX_SESSION_GAMES = 100
+
+# Seconds a claimed game time may differ from the one the server measured.
+TIME_TOLERANCE = 1.0
+
+PENDING = 'pending'
+ACCEPTED = 'accepted'
+REJECTED = 'rejected'
+
+
+class ScoreClaim(NamedTuple):
+    """A score submitted along with the seeded game that earned it."""
+    game: str  # subdirectory of the game
+    user_id: int
+    score: int
+    seed: int  # seed of the session the game was played in
+    inputs: Tuple[str, ...]  # every input given to the game, in order
+    seconds: float = 0.0  # time the game took, for games scored by speed
+
+
+class FinishedGame(NamedTuple):
+    """A game finished in a play session, as seen by the server."""
+    game: str  # subdirectory of the game
+    score: int
+    seconds: float  # from the start of the game to its last move, by the server's clock
+
+
+class PlaySessions:
+    """Seeds handed to users' play sessions by the server, and the games
+    finished in each. A submitted score is only verified if the server saw
+    the game finish in a session of the same user, and it is timed with the
+    server's clock rather than the time the client claims.
+
+    Args:
+        max_sessions (Optional[int], optional): sessions kept. Defaults to
+        MAX_SESSIONS.
+    """
+    def __init__(self, max_sessions: Optional[int] = MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        # seed -> (id of the user, games finished in the session)
+        self._sessions = OrderedDict()  # type: OrderedDict[int, Tuple[int, List[FinishedGame]]]
+
+    def start(self, user_id: int) -> int:
+        """Start a play session.
+
+        Args:
+            user_id (int): id of the user playing
+
+        Returns:
+            int: seed of the session's games
+        """
+        with self._lock:
+            seed = secrets.randbits(32)
+            while seed in self._sessions:
+                seed = secrets.randbits(32)
+            self._sessions[seed] = (user_id, [])
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return seed
+
+    def finish_game(self, seed: int, game: str, score: int, seconds: Optional[float] = 0.0):
+        """Note a game finished in a session.
+
+        Args:
+            seed (int): seed of the session
+            game (str): subdirectory of the game
+            score (int): score the game ended with
+            seconds (Optional[float], optional): time the game took by the
+            server's clock. Defaults to 0.
+        """
+        with self._lock:
+            session = self._sessions.get(seed)
+            if session is None:
+                return
+            self._sessions.move_to_end(seed)
+            finished = session[1]
+            finished.append(FinishedGame(game, score, seconds))
+            del finished[:-MAX_SESSION_GAMES]
+
+    def check_claim(self, claim: ScoreClaim) -> ScoreClaim:
+        """Match a claim to a game the server saw finish with its score in a
+        session of the user. Each finished game can only be claimed once.
+
+        Args:
+            claim (ScoreClaim): submitted game
+
+        Returns:
+            ScoreClaim: the claim, timed by the server's clock
+
+        Raises:
+            ValueError: if no such game finished, or the claimed time is off
+        """
+        with self._lock:
+            session = self._sessions.get(claim.seed)
+            if session is None or session[0] != claim.user_id:
+                raise ValueError('No play session of the user has seed {}'.format(claim.seed))
+            finished = session[1]
+            for index, game in enumerate(finished):
+                if game.game == claim.game and game.score == claim.score:
+                    break
+            else:
+                raise ValueError('No {} game of the session ended with a score of {}'.format(
+                    claim.game, claim.score))
+            if claim.seconds and abs(claim.seconds - game.seconds) > TIME_TOLERANCE:
+                raise ValueError('The game took {:.1f} seconds'.format(game.seconds))
+            del finished[index]
+        return claim._replace(seconds=game.seconds)
+
+
+def _minesweeper_score(input_system: InputSystem, claim: ScoreClaim, finished: List[int]) -> int:
+    game = input_system.minesweeper_game
+    if game.game_state != "Game over." or game.total_hidden_squares != game.mines:
+        raise ValueError('The game was not won')
+    if claim.seconds <= 0:
+        raise ValueError('The time the game took is needed')
+    game.start_time, game.end_time = 0.0, claim.seconds
+    game.set_score()
+    return game.score
+
+
+def _crazy_eights_score(input_system: InputSystem, claim: ScoreClaim, finished: List[int]) -> int:
+    # The players are reset along with the game, so its score is the one it ended with.
+    if not finished:
+        raise ValueError('The game did not end')
+    return finished[-1]
+
+
+# How the score of each game is worked out once it has been replayed, given
+# the scores of the games that ended during the replay.
+SCORERS = {
+    'minesweeper': _minesweeper_score,
+    'crazy_eights': _crazy_eights_score
+}  # type: Dict[str, Callable[[InputSystem, ScoreClaim, List[int]], int]]
+
+
+def replay_score(claim: ScoreClaim) -> int:
+    """Replay a submitted game headlessly and work out the score it earned.
+
+    Args:
+        claim (ScoreClaim): submitted game
+
+    Returns:
+        int: score the game earned
+    """
+    if claim.game not in SCORERS:
+        raise ValueError('Scores of {} cannot be verified'.format(claim.game))
+    finished = []  # scores of the games of the claim that ended, in order
+
+    def on_game_over(game: str, score: int):
+        if game == claim.game:
+            finished.append(score)
+
+    input_system = InputSystem(seed=claim.seed, on_game_over=on_game_over)
+    game_name = input_system.get_supported_games()[claim.game]
+    for user_input in claim.inputs:
+        input_system.handle_game_input(game_name, user_input)
+    return SCORERS[claim.game](input_system, claim, finished)
+
+
+def verify_score(claim: ScoreClaim) -> Optional[str]:
+    """Check a submitted score by replaying its game.
+
+    Args:
+        claim (ScoreClaim): submitted game
+
+    Returns:
+        Optional[str]: why the score was rejected; None if it was earned
+    """
+    try:
+        score = replay_score(claim)
+    except (ValueError, IndexError) as error:
+        return str(error) or 'The game could not be replayed'
+    if score != claim.score:
+        return 'The game earned a score of {}'.format(score)
+    return None
+
+
+class ScoreVerifier:
+    """Verify submitted scores in a bounded pool of worker processes, so
+    replaying games never holds up a request.
+
+    Args:
+        on_verified (Callable[[ScoreClaim], Optional[int]]): called with each
+        accepted claim, on a pool thread; returns the id of the stored score
+        workers (Optional[int], optional): worker processes. Defaults to
+        VERIFY_WORKERS.
+        max_pending (Optional[int], optional): most claims waiting to be
+        verified. Defaults to MAX_PENDING.
+        executor (Optional[Executor], optional): pool to verify in. Defaults
+        to None (a process pool of workers, started on first use).
+    """
+    def __init__(self, on_verified: Callable[[ScoreClaim], Optional[int]],
+                 workers: Optional[int] = VERIFY_WORKERS,
+                 max_pending: Optional[int] = MAX_PENDING,
+                 executor: Optional[Executor] = None):
+        self.on_verified = on_verified
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending = 0
+        self._results = OrderedDict()  # type: OrderedDict[int, dict]
+
+    def submit(self, claim: ScoreClaim) -> Optional[int]:
+        """Queue a claim to be verified.
+
+        Args:
+            claim (ScoreClaim): submitted game
+
+        Returns:
+            Optional[int]: id to look the verification up by; None if too
+            many claims are waiting
+        """
+        if len(claim.inputs) > MAX_SCORE_MOVES:
+            raise ValueError('At most {} moves can be verified'.format(MAX_SCORE_MOVES))
+        with self._lock:
+            if self._pending >= self.max_pending:
+                return None
+            if not self._executor:
+                self._executor = ProcessPoolExecutor(self.workers)
+            self._pending += 1
+            verification_id = next(self._ids)
+            self._results[verification_id] = {"status": PENDING}
+            self._trim()
+        future = self._executor.submit(verify_score, claim)
+        future.add_done_callback(lambda done: self._finish(verification_id, claim, done))
+        return verification_id
+
+    def get_status(self, verification_id: int) -> Optional[dict]:
+        """
+        Args:
+            verification_id (int): id returned by submit()
+
+        Returns:
+            Optional[dict]: status of the verification, with the reason for a
+            rejection or the id of an accepted high score; None if unknown
+        """
+        with self._lock:
+            result = self._results.get(verification_id)
+            return dict(result) if result else None
+
+    def shutdown(self):
+        """Stop the worker processes once the queued claims are verified.
+        """
+        if self._executor:
+            self._executor.shutdown()
+
+    def _finish(self, verification_id: int, claim: ScoreClaim, future: Future):
+        try:
+            reason = future.result()
+            if reason:
+                result = {"status": REJECTED, "reason": reason}
+            else:
+                result = {"status": ACCEPTED, "high_score_id": self.on_verified(claim)}
+        except Exception as error:  # the worker or the store failed
+            result = {"status": REJECTED, "reason": str(error)}
+        with self._lock:
+            self._pending -= 1
+            if verification_id in self._results:
+                self._results[verification_id] = result
+
+    def _trim(self):
+        while len(self._results) > RECENT_RESULTS:
+            self._results.popitem(last=False)
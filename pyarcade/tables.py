@@ -0,0 +1,424 @@
+from __future__ import annotations
+from concurrent.futures import Future
+from typing import Optional, Dict, List, Iterator
+import itertools
+import json
+import queue
+import random
+import threading
+import time
+from pyarcade.games.card import Card, Suit
+from pyarcade.games.crazy_eights import CrazyEights
+
+# Events a subscriber can fall behind by before it is resynced with a full
+# state snapshot instead of the events it missed.
+SUBSCRIBER_BUFFER = 64
+
+# Seconds an event stream waits for an event before sending a keep-alive.
+KEEP_ALIVE = 15
+
+# Seconds a table can go without a join, move or watcher before it is closed.
+TABLE_IDLE_TIMEOUT = 30 * 60
+
+# Event queued in place of a subscriber's backlog when it falls behind.
+_RESYNC = ('resync', None)
+
+
+class Subscriber:
+    """Bounded buffer of events for one client watching a table.
+
+    A slow client never holds up the table: when its buffer is full, the
+    events it has not read are dropped and it is sent the full table state
+    instead.
+
+    Args:
+        seat (Optional[int], optional): seat the client plays, whose hand it
+        is shown. Defaults to None (a spectator).
+        max_events (Optional[int], optional): events buffered before
+        resyncing. Defaults to SUBSCRIBER_BUFFER.
+    """
+    def __init__(self, seat: Optional[int] = None,
+                 max_events: Optional[int] = SUBSCRIBER_BUFFER):
+        self.seat = seat
+        self.events = queue.Queue(max_events)
+        self.dropped = 0
+        self._resync = False
+        self._lock = threading.Lock()
+
+    def put(self, event: str, data: Optional[dict]):
+        """Buffer an event, resyncing the subscriber if it has fallen behind.
+        Events are dropped while a resync is pending, since the state it is
+        sent covers them.
+
+        Args:
+            event (str): event type
+            data (Optional[dict]): event data
+        """
+        with self._lock:
+            if self._resync:
+                self.dropped += 1
+                return
+            try:
+                self.events.put_nowait((event, data))
+            except queue.Full:
+                self.dropped += 1 + self._drain()
+                self._resync = True
+                self.events.put_nowait(_RESYNC)
+
+    def close(self):
+        """Drop the buffered events and end the subscriber's stream.
+        """
+        with self._lock:
+            self._drain()
+            self._resync = False
+            self.events.put_nowait(('close', None))
+
+    def get(self, timeout: Optional[float] = None) -> Optional[tuple]:
+        """Take the next event.
+
+        Args:
+            timeout (Optional[float], optional): seconds to wait for one.
+            Defaults to None (wait until there is one).
+
+        Returns:
+            Optional[tuple]: event type and data; None if none came in time
+        """
+        try:
+            item = self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if item is _RESYNC:
+            with self._lock:
+                self._resync = False
+        return item
+
+    def _drain(self) -> int:
+        drained = 0
+        while True:
+            try:
+                self.events.get_nowait()
+                drained += 1
+            except queue.Empty:
+                return drained
+
+
+class Table:
+    """One multiplayer Crazy Eights game.
+
+    Moves are queued and applied one at a time by the table's worker thread,
+    so players can submit them from any request thread. After each move the
+    table pushes what changed to its subscribers: the move to everyone and
+    the new hand only to the seat that holds it.
+
+    Args:
+        table_id (int): id of the table
+        num_players (int): number of seats from [2, 7]
+        rng (Optional[random.Random], optional): random number generator to
+        shuffle with. Defaults to None (the random module).
+    """
+    def __init__(self, table_id: int, num_players: int,
+                 rng: Optional[random.Random] = None):
+        self.table_id = table_id
+        self.game = CrazyEights(num_players, rng)
+        self.seats = {}  # seat number to username
+        self.turn = 1  # seat whose turn it is
+        self.version = 0  # number of moves applied
+        self.last_active = time.monotonic()  # last join, move or watcher
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._moves = queue.Queue()
+        self._worker = None
+
+    def join(self, username: str) -> int:
+        """Seat a player at the first free seat. Players already seated keep
+        their seat.
+
+        Args:
+            username (str): name of the player
+
+        Returns:
+            int: seat of the player; 0 if the table is full
+        """
+        with self._lock:
+            self.last_active = time.monotonic()
+            for seat, name in self.seats.items():
+                if name == username:
+                    return seat
+            for seat in self.game.players:
+                if seat not in self.seats:
+                    self.seats[seat] = username
+                    self._publish('join', {'seat': seat, 'username': username})
+                    return seat
+        return 0
+
+    def is_full(self) -> bool:
+        """
+        Returns:
+            bool: whether every seat is taken
+        """
+        return len(self.seats) == len(self.game.players)
+
+    def submit(self, seat: int, card: Optional[Card] = None,
+               set_suit: Optional[Suit] = Suit.SPADES) -> Future:
+        """Queue a move for the table's worker.
+
+        Args:
+            seat (int): seat making the move
+            card (Optional[Card], optional): card to play. Defaults to None
+            (draw a card).
+            set_suit (Optional[Suit], optional): suit to change the play to if
+            the card is an eight. Defaults to spades.
+
+        Returns:
+            Future: resolves to the move event's data once the move is
+            applied, or raises ValueError if it is not allowed
+        """
+        future = Future()
+        with self._lock:
+            self.last_active = time.monotonic()
+            if not self._worker:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+        self._moves.put((future, seat, card, set_suit))
+        return future
+
+    def close(self):
+        """Stop the table's worker once the queued moves are applied, and end
+        every subscriber's event stream.
+        """
+        self._moves.put(None)
+        with self._lock:
+            for subscriber in self._subscribers:
+                subscriber.close()
+            self._subscribers.clear()
+            worker = self._worker
+        if worker and worker is not threading.current_thread():
+            worker.join()
+
+    def is_idle(self, max_idle: Optional[float] = TABLE_IDLE_TIMEOUT) -> bool:
+        """
+        Args:
+            max_idle (Optional[float], optional): seconds without a join, move
+            or new watcher. Defaults to TABLE_IDLE_TIMEOUT.
+
+        Returns:
+            bool: whether the table has been idle that long
+        """
+        return time.monotonic() - self.last_active >= max_idle
+
+    def subscribe(self, seat: Optional[int] = None,
+                  max_events: Optional[int] = SUBSCRIBER_BUFFER) -> Subscriber:
+        """Start watching the table. The first event is the full table state.
+
+        Args:
+            seat (Optional[int], optional): seat whose hand to show. Defaults
+            to None (a spectator).
+            max_events (Optional[int], optional): events buffered before
+            resyncing. Defaults to SUBSCRIBER_BUFFER.
+
+        Returns:
+            Subscriber: buffer the table's events are pushed to
+        """
+        subscriber = Subscriber(seat, max_events)
+        with self._lock:
+            self.last_active = time.monotonic()
+            subscriber.put('state', self._state(seat))
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        """Stop pushing events to a subscriber.
+
+        Args:
+            subscriber (Subscriber): subscriber returned by subscribe()
+        """
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def state(self, seat: Optional[int] = None) -> dict:
+        """
+        Args:
+            seat (Optional[int], optional): seat whose hand to include.
+            Defaults to None (no hand).
+
+        Returns:
+            dict: full state of the table as seen from a seat
+        """
+        with self._lock:
+            return self._state(seat)
+
+    def stream(self, subscriber: Subscriber,
+               keep_alive: Optional[float] = KEEP_ALIVE) -> Iterator[str]:
+        """Format a subscriber's events as a Server-Sent Events stream. The
+        subscriber is removed when the stream is closed.
+
+        Args:
+            subscriber (Subscriber): subscriber returned by subscribe()
+            keep_alive (Optional[float], optional): seconds between keep-alive
+            comments when there are no events. Defaults to KEEP_ALIVE.
+
+        Returns:
+            Iterator[str]: SSE messages
+        """
+        try:
+            while True:
+                item = subscriber.get(keep_alive)
+                if item is None:
+                    yield ': keep-alive\n\n'
+                    continue
+                event, data = item
+                if event == 'close':
+                    return
+                if item is _RESYNC:
+                    event, data = 'state', self.state(subscriber.seat)
+                yield 'event: {}\ndata: {}\n\n'.format(event, json.dumps(data))
+        finally:
+            self.unsubscribe(subscriber)
+
+    def _run(self):
+        while True:
+            item = self._moves.get()
+            if item is None:
+                return
+            future, seat, card, set_suit = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with self._lock:
+                    future.set_result(self._apply(seat, card, set_suit))
+            except Exception as error:
+                future.set_exception(error)
+
+    def _apply(self, seat: int, card: Optional[Card], set_suit: Suit) -> dict:
+        if not self.is_full():
+            raise ValueError('Waiting for players')
+        if seat != self.turn:
+            raise ValueError("It is seat {}'s turn".format(self.turn))
+
+        game = self.game
+        round_num = game.round_num
+        if card is None:
+            game.draw(seat)
+        elif not game.play(seat, card, set_suit):
+            raise ValueError('{} cannot be played'.format(card))
+        elif game.round_num == round_num:
+            self.turn = seat % len(game.players) + 1
+
+        self.version += 1
+        data = {
+            'version': self.version,
+            'seat': seat,
+            'card': str(card) if card else None,
+            'top_card': game.show_top_card(),
+            'suit': game.get_top_card_suit().name.lower(),
+            'hand_sizes': self._hand_sizes(),
+            'turn': self.turn
+        }
+        self._publish('move', data)
+        if game.round_num != round_num:
+            self._publish('round', dict(game.round_hist[-1]._asdict(), round=game.round_num))
+            for other in game.players:
+                self._publish('hand', {'cards': self._hand(other)}, other)
+        else:
+            self._publish('hand', {'cards': self._hand(seat)}, seat)
+        return data
+
+    def _publish(self, event: str, data: Optional[dict], seat: Optional[int] = None):
+        for subscriber in self._subscribers:
+            if seat is None or subscriber.seat == seat:
+                subscriber.put(event, data)
+
+    def _state(self, seat: Optional[int]) -> dict:
+        state = {
+            'table_id': self.table_id,
+            'version': self.version,
+            'seats': {str(n): name for n, name in self.seats.items()},
+            'round': self.game.round_num + 1,
+            'top_card': self.game.show_top_card(),
+            'suit': self.game.get_top_card_suit().name.lower(),
+            'hand_sizes': self._hand_sizes(),
+            'scores': [player.get_score() for player in self.game.players.values()],
+            'turn': self.turn
+        }
+        if seat in self.game.players:
+            state['hand'] = self._hand(seat)
+        return state
+
+    def _hand(self, seat: int) -> List[str]:
+        return [str(card) for card in self.game.players.get(seat).get_cards()]
+
+    def _hand_sizes(self) -> List[int]:
+        return [len(player.get_cards()) for player in self.game.players.values()]
+
+
+class TableService:
+    """Hold the open multiplayer tables. Tables left idle are closed whenever
+    a new one is opened, so abandoned tables do not keep their worker threads.
+
+    Args:
+        max_idle (Optional[float], optional): seconds a table can be idle
+        before it is closed. Defaults to TABLE_IDLE_TIMEOUT.
+    """
+    def __init__(self, max_idle: Optional[float] = TABLE_IDLE_TIMEOUT):
+        self.max_idle = max_idle
+        self.tables = {}  # type: Dict[int, Table]
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create_table(self, num_players: int,
+                     rng: Optional[random.Random] = None) -> Table:
+        """Open a new table.
+
+        Args:
+            num_players (int): number of seats from [2, 7]
+            rng (Optional[random.Random], optional): random number generator
+            to shuffle with. Defaults to None (the random module).
+
+        Returns:
+            Table: table that was opened
+        """
+        self.close_idle_tables()
+        with self._lock:
+            table = Table(next(self._ids), num_players, rng)
+            self.tables[table.table_id] = table
+        return table
+
+    def get_table(self, table_id: int) -> Optional[Table]:
+        """
+        Args:
+            table_id (int): id of the table
+
+        Returns:
+            Optional[Table]: the table; None if it is not open
+        """
+        return self.tables.get(table_id)
+
+    def close_table(self, table_id: int) -> bool:
+        """Close a table and end its event streams.
+
+        Args:
+            table_id (int): id of the table
+
+        Returns:
+            bool: whether the table was open
+        """
+        with self._lock:
+            table = self.tables.pop(table_id, None)
+        if table:
+            table.close()
+        return table is not None
+
+    def close_idle_tables(self) -> int:
+        """Close every table that has been idle for max_idle seconds.
+
+        Returns:
+            int: number of tables closed
+        """
+        with self._lock:
+            idle = [table for table in self.tables.values() if table.is_idle(self.max_idle)]
+            for table in idle:
+                del self.tables[table.table_id]
+        for table in idle:
+            table.close()
+        return len(idle)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+from html import escape
+from typing import Callable, Dict, NamedTuple, Tuple
+import json
+
+
+class Section(NamedTuple):
+    """Titled part of a game view, e.g. the board or a hand."""
+    title: str
+    lines: Tuple[str, ...]
+
+
+class GameView(NamedTuple):
+    """Snapshot of what a game shows the user, independent of how it is
+    rendered."""
+    game: str  # display name of the game
+    state: str  # game_state of the game
+    version: int  # version of the game the view was taken at
+    sections: Tuple[Section, ...]
+
+
+def mastermind_view(game) -> GameView:
+    """
+    Args:
+        game (Mastermind): game to show
+
+    Returns:
+        GameView: state and guesses so far
+    """
+    guesses = []
+    for guess, evaluation in game.current_history.items():
+        marks = [mark for digit_marks in evaluation.values() for mark in digit_marks]
+        guesses.append("{}: {} bulls and {} cows".format(list(guess), marks.count(1), marks.count(0)))
+    return GameView('Mastermind', game.game_state, game.version,
+                    (Section('Guesses', tuple(guesses)),))
+
+
+def minesweeper_view(game) -> GameView:
+    """
+    Args:
+        game (Minesweeper): game to show
+
+    Returns:
+        GameView: state and board
+    """
+    return GameView('Minesweeper', game.game_state, game.version,
+                    (Section('Board', tuple(game.draw_board().splitlines())),))
+
+
+def crazy_eights_view(game, player_num: int = 1) -> GameView:
+    """
+    Args:
+        game (CrazyEights): game to show
+        player_num (int, optional): number of the player whose hand is shown.
+        Defaults to 1, the user.
+
+    Returns:
+        GameView: state, top card and the player's hand
+    """
+    return GameView('Crazy Eights', game.game_state, game.version,
+                    (Section('Top Card', (game.show_top_card(),)),
+                     Section('Player Hand', tuple(game.show_player_hand(player_num).splitlines()))))
+
+
+def blackjack_view(game) -> GameView:
+    """
+    Args:
+        game (Blackjack): game to show
+
+    Returns:
+        GameView: state and the totals of both hands
+    """
+    return GameView('Blackjack', game.game_state, game.version,
+                    (Section('Current Hand', (str(game.calculate_current_sum(game.user)),)),
+                     Section('House Hand', (str(game.calculate_current_sum(game.house)),))))
+
+
+def render_text(view: GameView) -> str:
+    """
+    Args:
+        view (GameView): view to render
+
+    Returns:
+        str: view as CLI text
+    """
+    output = "\n" + view.game + "\n\n" + view.state + "\n"
+    for section in view.sections:
+        output += "\n" + section.title + ": \n" + "".join(line + "\n" for line in section.lines)
+    return output
+
+
+def render_html(view: GameView) -> str:
+    """
+    Args:
+        view (GameView): view to render
+
+    Returns:
+        str: view as an HTML fragment
+    """
+    output = '<div class="game-view"><h3>{}</h3><p class="game-state">{}</p>'.format(
+        escape(view.game), escape(view.state))
+    for section in view.sections:
+        output += '<h4>{}</h4><pre>{}</pre>'.format(
+            escape(section.title), escape("\n".join(section.lines)))
+    return output + '</div>'
+
+
+def render_json(view: GameView) -> str:
+    """
+    Args:
+        view (GameView): view to render
+
+    Returns:
+        str: view as a JSON object
+    """
+    return json.dumps({
+        'game': view.game,
+        'state': view.state,
+        'version': view.version,
+        'sections': {section.title: list(section.lines) for section in view.sections}
+    })
+
+
+# How to view each game, by subdirectory.
+VIEW_BUILDERS = {
+    'blackjack': blackjack_view,
+    'crazy_eights': crazy_eights_view,
+    'mastermind': mastermind_view,
+    'minesweeper': minesweeper_view
+}  # type: Dict[str, Callable[[object], GameView]]
+
+# Renderers by format.
+RENDERERS = {
+    'text': render_text,
+    'html': render_html,
+    'json': render_json
+}  # type: Dict[str, Callable[[GameView], str]]
+
+
+class ViewCache:
+    """Views of games and their renderings, kept until the game changes.
+
+    Games bump their version on every change, so a view or rendering is
+    reused for as long as it was made from the same game at the same version.
+
+    Args:
+        builders (Dict[str, Callable[[object], GameView]], optional): how to
+        view each game. Defaults to VIEW_BUILDERS.
+        renderers (Dict[str, Callable[[GameView], str]], optional): renderers
+        by format. Defaults to RENDERERS.
+    """
+    def __init__(self, builders: Dict[str, Callable[[object], GameView]] = None,
+                 renderers: Dict[str, Callable[[GameView], str]] = None):
+        self.builders = dict(builders or VIEW_BUILDERS)
+        self.renderers = dict(renderers or RENDERERS)
+        self._views = {}  # subdir -> (game, version, view)
+        self._rendered = {}  # (subdir, format) -> (game, version, output)
+
+    def get_view(self, subdir: str, game) -> GameView:
+        """
+        Args:
+            subdir (str): subdirectory of the game
+            game: game to view
+
+        Returns:
+            GameView: view of the game at its current version
+        """
+        cached = self._views.get(subdir)
+        if cached and cached[0] is game and cached[1] == game.version:
+            return cached[2]
+        view = self.builders[subdir](game)
+        self._views[subdir] = (game, view.version, view)
+        return view
+
+    def render(self, subdir: str, game, fmt: str = 'text') -> str:
+        """
+        Args:
+            subdir (str): subdirectory of the game
+            game: game to render
+            fmt (str, optional): 'text', 'html' or 'json'. Defaults to 'text'.
+
+        Returns:
+            str: rendering of the game at its current version
+        """
+        if fmt not in self.renderers:
+            raise ValueError('No renderer for {}'.format(fmt))
+        key = (subdir, fmt)
+        cached = self._rendered.get(key)
+        if cached and cached[0] is game and cached[1] == game.version:
+            return cached[2]
+        view = self.get_view(subdir, game)
+        output = self.renderers[fmt](view)
+        self._rendered[key] = (game, view.version, output)
+        return output
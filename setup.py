@@ -2,12 +2,18 @@ from setuptools import setup
 
 # This script informs pip/conda/python how to install our package when requested.
 # The important part is the entry_point. This informs the installer to make the run_pyarcade
-# function of the start.py file in the pyarcade package to be callable via "pyarcade"
+# function of the start.py file in the pyarcade package to be callable via "pyarcade".
+# The simulators and the session replayer are installed next to it for offline analysis.
 setup(
     name='pyarcade',
     version='0.0.1',
     description='',
     packages=["pyarcade", "pyarcade.games"],
-    entry_points={"console_scripts": ["pyarcade = pyarcade.start:run_pyarcade"]},
+    entry_points={"console_scripts": [
+        "pyarcade = pyarcade.start:run_pyarcade",
+        "pyarcade-crazy-eights-sim = pyarcade.games.crazy_eights_sim:main",
+        "pyarcade-blackjack-sim = pyarcade.games.blackjack_sim:main",
+        "pyarcade-replay = pyarcade.replay:main"
+    ]},
     test_suite="tests"
 )
\ No newline at end of file
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+import pytest
+from pyarcade.games.blackjack import Blackjack
+from pyarcade.games.blackjack_odds import add_card, dealer_outcomes, stand_ev, hit_ev, get_tables, \
+    hand_odds, table_odds, shoe_counts, compute_tables
+
+# A shoe of only ten-valued cards, and one of only twos.
+TENS = (0, 0, 0, 0, 0, 0, 0, 0, 0, 16)
+TWOS = (0, 4, 0, 0, 0, 0, 0, 0, 0, 0)
+
+
+@pytest.mark.local
+class BlackjackOddsTestCase(unittest.TestCase):
+    def test_add_card(self):
+        self.assertEqual((12, True), add_card((11, True), 1))
+        self.assertEqual((12, False), add_card((12, True), 10))
+        self.assertEqual((21, True), add_card((10, False), 1))
+        self.assertEqual((13, False), add_card((12, False), 1))
+
+    def test_dealer_outcomes(self):
+        for house_total in range(4, 22):
+            self.assertAlmostEqual(1.0, sum(dealer_outcomes((house_total, False))))
+        self.assertEqual((0, 0, 0, 1, 0, 0), dealer_outcomes((20, False)))
+        self.assertEqual((1, 0, 0, 0, 0, 0), dealer_outcomes((17, True)))
+        self.assertEqual((0, 0, 0, 0, 0, 1), dealer_outcomes((12, False), TENS))
+        self.assertEqual((0, 0, 0, 1, 0, 0), dealer_outcomes((10, False), TENS))
+        # A soft 16 takes a ten to a hard 16, then busts on the next.
+        self.assertEqual((0, 0, 0, 0, 0, 1), dealer_outcomes((16, True), TENS))
+
+    def test_stand_ev(self):
+        self.assertEqual(1, stand_ev(18, (12, False), TENS))
+        self.assertEqual(-1, stand_ev(20, (10, False), TENS))  # ties go to the house
+
+    def test_hit_ev(self):
+        self.assertEqual(-1, hit_ev((12, False), (20, False), TENS))
+        self.assertEqual(1, hit_ev((11, False), (20, False), TENS))  # 21 wins outright
+        self.assertEqual(1, hit_ev((12, False), (22, False), TWOS))  # house is already bust
+        # Hit 15 to 17 then 19, and stand to beat the house's 18.
+        self.assertEqual(1, hit_ev((15, False), (18, False), TWOS))
+        # A soft 20 can't bust on a ten: it becomes a hard 20 and stands.
+        self.assertEqual(1, hit_ev((20, True), (19, False), TENS))
+
+    def test_tables(self):
+        path = os.path.join(tempfile.mkdtemp(), 'odds', 'blackjack_odds.json')
+        tables = get_tables(path)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(compute_tables(), tables)
+        self.assertAlmostEqual(stand_ev(16, (10, False)), tables['stand'][16][10][0])
+        self.assertEqual('hit', table_odds((12, False), (10, False), path).best())
+        self.assertEqual('hit', table_odds((17, True), (20, False), path).best())
+        self.assertEqual('stand', table_odds((20, False), (16, False), path).best())
+
+    def test_hand_odds(self):
+        path = os.path.join(tempfile.mkdtemp(), 'blackjack_odds.json')
+        game = Blackjack()
+        counts = shoe_counts(game.shoe.get_rank_counts())
+        self.assertEqual(48, sum(counts))
+        odds = hand_odds(game, exact=True)
+        user = game.calculate_current_sum(game.user), game.user.is_soft()
+        house = game.calculate_current_sum(game.house), game.house.is_soft()
+        self.assertEqual(stand_ev(user[0], house, counts), odds.stand)
+        self.assertEqual(table_odds(user, house, path), hand_odds(game, path=path))
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pytest
+from pyarcade.games.blackjack_sim import simulate, cross_check, play_hands, ShoeBatch, \
+    StandOnPolicy, BasicStrategyPolicy, BlackjackSummary
+
+
+def stacked_batch(values):
+    """Make a batch of one shoe that deals the given card values in order."""
+    batch = ShoeBatch(1, 1, 0.75, np.random.default_rng(0))
+    batch.values[0, :len(values)] = values
+    return batch
+
+
+@pytest.mark.local
+class BlackjackSimTestCase(unittest.TestCase):
+    def test_play_hands(self):
+        # User 10 + 10 and house 10 + 10 stand; ties go to the house.
+        self.assertEqual([-1], list(play_hands(stacked_batch([10, 10, 10, 10]), StandOnPolicy(17))))
+        # User hits 12 to 21 and wins outright.
+        self.assertEqual([1], list(play_hands(stacked_batch([6, 10, 6, 10, 9]), StandOnPolicy(17))))
+        # User hits 12 and busts.
+        self.assertEqual([-1], list(play_hands(stacked_batch([6, 10, 6, 10, 10]), StandOnPolicy(17))))
+        # User stands on 18, house hits 16 and busts.
+        self.assertEqual([1], list(play_hands(stacked_batch([9, 10, 9, 6, 10]), StandOnPolicy(17))))
+        # User stands on a soft 21 against the house's 20.
+        self.assertEqual([1], list(play_hands(stacked_batch([1, 10, 10, 10]), StandOnPolicy(17))))
+        # Two aces are a soft 12, which hits to 21.
+        self.assertEqual([1], list(play_hands(stacked_batch([1, 10, 1, 10, 9]), StandOnPolicy(17))))
+        # A soft 17 hits a ten to a hard 17, then hits 4 to 21.
+        self.assertEqual([1], list(play_hands(stacked_batch([1, 10, 6, 9, 10, 4]), StandOnPolicy(18))))
+        # The house stands on a soft 17.
+        self.assertEqual([1], list(play_hands(stacked_batch([9, 1, 9, 6]), StandOnPolicy(17))))
+
+    def test_simulate_seeded(self):
+        summary1 = simulate(20000, StandOnPolicy(15), seed=3, workers=1, chunk_size=5000, batch_size=1000)
+        summary2 = simulate(20000, StandOnPolicy(15), seed=3, workers=2, chunk_size=5000, batch_size=1000)
+        self.assertEqual(20000, summary1.hands)
+        self.assertEqual((summary1.wins, summary1.losses, summary1.ties),
+                         (summary2.wins, summary2.losses, summary2.ties))
+
+    def test_cross_check(self):
+        policy = BasicStrategyPolicy(os.path.join(tempfile.mkdtemp(), 'blackjack_odds.json'))
+        fast = simulate(100000, policy, seed=1, workers=1)
+        game = cross_check(5000, policy, seed=1)
+        # Five standard errors of the game's smaller sample.
+        self.assertLess(abs(fast.get_house_edge() - game.get_house_edge()), 5 / np.sqrt(5000))
+
+    def test_summary(self):
+        summary = BlackjackSummary(payout=1.5).add(np.array([1, -1, -1, 0]))
+        self.assertEqual((1, 2, 1), (summary.wins, summary.losses, summary.ties))
+        self.assertAlmostEqual(0.125, summary.get_house_edge())
+        summary.merge(BlackjackSummary().add(np.array([1])))
+        self.assertEqual(5, summary.hands)
@@ -0,0 +1,63 @@
+import random
+import unittest
+
+import pytest
+from pyarcade.games.blackjack_table import BlackjackTable, PLAYING, STOOD
+from pyarcade.games.card import Rank, Suit, Card
+
+
+def stack(table, ranks):
+    """Make the table's shoe deal cards of the given ranks next, in order."""
+    table.shoe.set_undealt([Card(rank, Suit.CLUBS) for rank in ranks])
+
+
+@pytest.mark.local
+class BlackjackTableTestCase(unittest.TestCase):
+    def test_deal(self):
+        table = BlackjackTable(7, 2, random.Random(1))
+        self.assertTrue(all(len(player.get_cards()) == 2 for player in table.seats))
+        self.assertEqual(2, len(table.house.get_cards()))
+        self.assertEqual(2 * 52 - 16, table.shoe.size())
+        self.assertEqual([PLAYING] * 7, table.states)
+        with self.assertRaises(ValueError):
+            BlackjackTable(8)
+
+    def test_round(self):
+        table = BlackjackTable(3, rng=random.Random(2))
+        # Seats get 10+7, 10+6 and 9+2; the house gets 10+6 and draws a 5.
+        stack(table, [Rank.TEN, Rank.TEN, Rank.NINE, Rank.TEN,
+                      Rank.SEVEN, Rank.SIX, Rank.TWO, Rank.SIX,
+                      Rank.TEN, Rank.KING, Rank.FIVE])
+        table.deal()
+        table.stand(0)
+        self.assertEqual([STOOD, PLAYING, PLAYING], table.states)
+        self.assertEqual(1, table.hit(2))  # 11 + 10 makes 21
+        self.assertEqual(-1, table.hit(1))  # 16 + 10 busts
+        # The last seat to act settles the table: the house draws to 21.
+        self.assertTrue(table.is_round_over())
+        self.assertEqual(21, table.house.get_hand_total())
+        self.assertEqual([-1, -1, 1], table.outcomes)
+
+    def test_resolve(self):
+        table = BlackjackTable(2, rng=random.Random(3))
+        # Seats get 10+9 and 10+8; the house gets 10+8 and stands.
+        stack(table, [Rank.TEN, Rank.TEN, Rank.TEN, Rank.NINE, Rank.EIGHT, Rank.EIGHT])
+        table.deal()
+        table.stand(0)
+        table.stand(1)
+        self.assertTrue(table.is_round_over())
+        self.assertEqual([1, -1], table.outcomes)  # ties go to the house
+        self.assertEqual([1, -1], table.balances)
+        self.assertEqual(2, len(table.house.get_cards()))
+        self.assertIn("SEAT 1: 19 WIN (balance 1)", table.render())
+        self.assertIn("SEAT 2: 18 LOSE (balance -1)", table.render())
+
+    def test_house_draws_once(self):
+        table = BlackjackTable(4, rng=random.Random(4))
+        for seat in range(4):
+            table.stand(seat)
+        self.assertTrue(table.is_round_over())
+        self.assertGreaterEqual(table.house.get_hand_total(), 17)
+        self.assertTrue(all(outcome in (1, 0, -1) for outcome in table.outcomes))
+        table.deal()
+        self.assertFalse(table.is_round_over())
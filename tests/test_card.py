@@ -1,6 +1,7 @@
 import pytest
-from pyarcade.games.card import Rank, Suit, Card
+from pyarcade.games.card import Rank, Suit, Card, CARDS, DECK_SIZE, parse_card, parse_suit
 import unittest
+import pickle
 
 
 @pytest.mark.local
@@ -23,3 +24,33 @@ class CardTestCase(unittest.TestCase):
     def test_get_suit(self):
         card1 = Card(Rank.ACE, Suit.SPADES)
         self.assertEqual(card1.get_suit(), Suit.SPADES)
+
+    def test_interned(self):
+        card1 = Card(Rank.KING, Suit.HEARTS)
+        self.assertIs(card1, Card(Rank.KING, Suit.HEARTS))
+        self.assertIs(card1, Card.from_id(card1.get_id()))
+        self.assertEqual(hash(card1), card1.get_id())
+
+    def test_ids(self):
+        self.assertEqual(len(CARDS), DECK_SIZE)
+        self.assertEqual(Card(Rank.ACE, Suit.SPADES).get_id(), 0)
+        self.assertEqual(Card(Rank.KING, Suit.DIAMONDS).get_id(), DECK_SIZE - 1)
+        self.assertEqual([card.get_id() for card in CARDS], list(range(DECK_SIZE)))
+
+    def test_pickle(self):
+        card1 = Card(Rank.TEN, Suit.CLUBS)
+        self.assertIs(pickle.loads(pickle.dumps(card1)), card1)
+
+    def test_parse_card(self):
+        eight = Card(Rank.EIGHT, Suit.SPADES)
+        for text in ("Eight,Spades", " eight , spade ", "8,s", "8,\u2660", "8s", "8\u2660"):
+            self.assertIs(eight, parse_card(text))
+        self.assertIs(Card(Rank.TEN, Suit.HEARTS), parse_card("10h"))
+        self.assertIs(Card(Rank.JACK, Suit.DIAMONDS), parse_card("J,Diamonds"))
+        for text in ("draw", "", "eight", "eight,spades,hearts", "eleven,spades", "8,x"):
+            self.assertIsNone(parse_card(text))
+
+    def test_parse_suit(self):
+        self.assertEqual(Suit.HEARTS, parse_suit("Hearts"))
+        self.assertEqual(Suit.CLUBS, parse_suit("\u2663"))
+        self.assertIsNone(parse_suit("stars"))
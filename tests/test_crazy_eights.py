@@ -1,8 +1,9 @@
+import pickle
 import pytest
 from pyarcade.games.card import Rank, Suit, Card
 from pyarcade.games.deck import Deck
 from pyarcade.games.player import Player
-from pyarcade.games.crazy_eights import CrazyEights
+from pyarcade.games.crazy_eights import CrazyEights, MAX_ROUND_HIST
 import unittest
 
 
@@ -87,6 +88,19 @@ class CrazyEightsTestCase(unittest.TestCase):
         self.assertEqual(len(card_ops), 2)
         self.assertTrue(all(card in p1.get_cards() for card in card_ops))
 
+    def test_play_options_order(self):
+        game = CrazyEights(2)
+        p1 = game.players.get(1)
+
+        p1.clear_hand()
+        cards = [Card(Rank.EIGHT, Suit.CLUBS), Card(Rank.KING, Suit.SPADES),
+                 Card(Rank.TEN, Suit.HEARTS), Card(Rank.TWO, Suit.SPADES)]
+        [p1.add_to_hand(card) for card in cards]
+
+        # Same rank first, then same suit, then eights, each ordered by id.
+        game.discard.append(Card(Rank.TEN, Suit.SPADES))
+        self.assertEqual([cards[2], cards[3], cards[1], cards[0]], game.play_options(1))
+
     def test_turn(self):
         game = CrazyEights(4)
         [p.clear_hand() for p in game.players.values()]  # force players to draw
@@ -110,13 +124,45 @@ class CrazyEightsTestCase(unittest.TestCase):
         game = CrazyEights(4)
         game.reset()
 
-        score_hist = False
-        if game.game_hist:
-            for p in game.game_hist[0][0].values():
-                if p.get_score() > 0:
-                    score_exists = True
-                    break
-        self.assertTrue(score_exists)
+        self.assertEqual(1, len(game.game_hist))
+        self.assertTrue(any(score > 0 for score in game.game_hist[0].scores))
+        self.assertEqual(0, game.round_num)
+        self.assertEqual("Round 1", game.game_state)
+        self.assertIsNone(game.game_over)  # no round was played out
+
+        game.reset_round()
+        scores = game.round_hist[-1].scores
+        game.reset()
+        self.assertEqual(scores, game.game_over.scores)
+
+    def test_round_hist(self):
+        game = CrazyEights(2)
+        p1 = game.players.get(1)
+        p2 = game.players.get(2)
+        p1.clear_hand()
+        p2.clear_hand()
+        p1.add_to_hand(Card(Rank.ACE, Suit.CLUBS))
+        p2.add_to_hand(Card(Rank.EIGHT, Suit.DIAMONDS))
+        game.reset_round()
+
+        self.assertEqual(1, game.round_num)
+        self.assertEqual("Round 2", game.game_state)
+        self.assertEqual((1, 50), game.round_hist[0].points)
+        self.assertEqual((1,), game.round_hist[0].winners)
+        self.assertEqual((1, 1), game.round_hist[0].hand_sizes)
+        self.assertEqual((49, 0), game.round_hist[0].scores)
+
+        # Past rounds are snapshots and don't change with the players.
+        p1.increase_score(10)
+        self.assertEqual((49, 0), game.round_hist[0].scores)
+
+    def test_round_hist_capped(self):
+        game = CrazyEights(2)
+        for _ in range(MAX_ROUND_HIST + 5):
+            game.reset_round()
+        self.assertEqual(MAX_ROUND_HIST, len(game.round_hist))
+        self.assertEqual(MAX_ROUND_HIST + 5, game.round_num)
+        self.assertEqual(game.round_hist, pickle.loads(pickle.dumps(game)).round_hist)
 
     def test_clear(self):
         game = CrazyEights(4)
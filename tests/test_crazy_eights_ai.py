@@ -0,0 +1,105 @@
+import random
+import unittest
+
+import pytest
+from pyarcade.games.card import Rank, Suit, Card
+from pyarcade.games.crazy_eights import CrazyEights
+from pyarcade.games.crazy_eights_ai import FirstCardStrategy, HeuristicStrategy, MonteCarloStrategy, \
+    TurnScheduler, get_strategy
+
+
+def _set_hand(game, player_num, cards):
+    player = game.players.get(player_num)
+    player.clear_hand()
+    [player.add_to_hand(card) for card in cards]
+
+
+@pytest.mark.local
+class CrazyEightsAITestCase(unittest.TestCase):
+    def test_first_card(self):
+        game = CrazyEights(2)
+        _set_hand(game, 1, [Card(Rank.EIGHT, Suit.CLUBS)])
+        game.discard.append(Card(Rank.TWO, Suit.HEARTS))
+        self.assertEqual(FirstCardStrategy().choose(game, 1), (Card(Rank.EIGHT, Suit.CLUBS), Suit.SPADES))
+
+    def test_heuristic_holds_eights(self):
+        game = CrazyEights(2)
+        _set_hand(game, 1, [Card(Rank.EIGHT, Suit.CLUBS), Card(Rank.TWO, Suit.SPADES),
+                            Card(Rank.KING, Suit.HEARTS)])
+        game.discard.append(Card(Rank.TWO, Suit.HEARTS))
+        card, _ = HeuristicStrategy().choose(game, 1)
+        self.assertEqual(card, Card(Rank.KING, Suit.HEARTS))
+
+    def test_heuristic_sets_best_suit(self):
+        game = CrazyEights(2)
+        _set_hand(game, 1, [Card(Rank.EIGHT, Suit.CLUBS), Card(Rank.TWO, Suit.DIAMONDS),
+                            Card(Rank.FOUR, Suit.DIAMONDS), Card(Rank.KING, Suit.SPADES)])
+        game.discard.append(Card(Rank.THREE, Suit.HEARTS))
+        self.assertEqual(HeuristicStrategy().choose(game, 1), (Card(Rank.EIGHT, Suit.CLUBS), Suit.DIAMONDS))
+
+    def test_no_options(self):
+        game = CrazyEights(2)
+        _set_hand(game, 1, [Card(Rank.TWO, Suit.SPADES)])
+        game.discard.append(Card(Rank.THREE, Suit.HEARTS))
+        self.assertIsNone(HeuristicStrategy().choose(game, 1))
+        self.assertIsNone(MonteCarloStrategy().choose(game, 1))
+
+    def test_candidate_moves_distinct(self):
+        game = CrazyEights(2)
+        _set_hand(game, 1, [Card(Rank.KING, Suit.HEARTS), Card(Rank.THREE, Suit.SPADES),
+                            Card(Rank.KING, Suit.HEARTS), Card(Rank.EIGHT, Suit.CLUBS),
+                            Card(Rank.THREE, Suit.SPADES), Card(Rank.EIGHT, Suit.CLUBS)])
+        game.discard.append(Card(Rank.THREE, Suit.HEARTS))
+        moves = MonteCarloStrategy.candidate_moves(game, 1)
+        self.assertEqual([(Card(Rank.THREE, Suit.SPADES), None), (Card(Rank.KING, Suit.HEARTS), None)],
+                         moves[:2])
+        self.assertEqual(2 + len(Suit), len(moves))
+
+    def test_monte_carlo(self):
+        game = CrazyEights(3, random.Random(5))
+        game.discard.append(Card(Rank.THREE, Suit.HEARTS))
+        _set_hand(game, 1, [Card(Rank.EIGHT, Suit.CLUBS), Card(Rank.THREE, Suit.SPADES),
+                            Card(Rank.KING, Suit.HEARTS)])
+        hands = [list(game.players.get(n).get_cards()) for n in (2, 3)]
+        deck_size = game.deck.size()
+
+        strategy = MonteCarloStrategy(time_budget=0.0, max_rollouts=30, rng=random.Random(1))
+        card, suit = strategy.choose(game, 1)
+        self.assertTrue(game.playable(card))
+        # The search must not disturb the real game.
+        self.assertEqual(hands, [list(game.players.get(n).get_cards()) for n in (2, 3)])
+        self.assertEqual(deck_size, game.deck.size())
+
+    def test_turn_with_strategy(self):
+        game = CrazyEights(4)
+        [p.clear_hand() for p in game.players.values()]  # force players to draw
+        for n in (2, 3, 4):
+            game.turn(n, get_strategy('medium'))
+
+    def test_get_strategy(self):
+        self.assertIsInstance(get_strategy('Easy'), FirstCardStrategy)
+        self.assertIsInstance(get_strategy('hard'), MonteCarloStrategy)
+
+    def test_turn_scheduler(self):
+        game = CrazyEights(4, random.Random(3))
+        top = game.discard[-1]
+        _set_hand(game, 1, [top, Card(Rank.TWO, Suit.CLUBS)])
+        scheduler = TurnScheduler(strategy=MonteCarloStrategy(time_budget=0.01, max_rollouts=2))
+        scheduler.think_ahead(game, 1).result()
+
+        game.play(1, top)
+        moves = scheduler.advance(game, 1)
+        self.assertEqual([seat for seat, _ in moves], [2, 3, 4][:len(moves)])
+        self.assertGreater(scheduler.looked_up, 0)  # seat 2 was worked out ahead
+        scheduler.shutdown()
+
+    def test_turn_scheduler_cheap_strategy(self):
+        scheduler = TurnScheduler()
+        self.assertIsNone(scheduler.think_ahead(CrazyEights(4), 1))
+        self.assertEqual(0, scheduler.looked_up)
+
+    def test_turn_scheduler_foreground(self):
+        game = CrazyEights(3)
+        scheduler = TurnScheduler(human_seats=(1, 3), background=False)
+        moves = scheduler.advance(game, 1)
+        self.assertEqual([seat for seat, _ in moves], [2])
@@ -0,0 +1,47 @@
+import random
+import unittest
+
+import pytest
+from pyarcade.games.crazy_eights_ai import FirstCardStrategy, HeuristicStrategy
+from pyarcade.games.crazy_eights_sim import play_game, simulate, head_to_head, wilson_interval, \
+    SimulationSummary
+
+
+@pytest.mark.local
+class CrazyEightsSimTestCase(unittest.TestCase):
+    def test_play_game(self):
+        record = play_game([FirstCardStrategy()] * 4, random.Random(1), target_score=50)
+        self.assertEqual(len(record.scores), 4)
+        self.assertTrue(max(record.scores) >= 50 or record.rounds == 50)
+        self.assertTrue(record.turns >= record.rounds)
+
+    def test_play_game_seeded(self):
+        record1 = play_game([HeuristicStrategy()] * 3, random.Random(7))
+        record2 = play_game([HeuristicStrategy()] * 3, random.Random(7))
+        self.assertEqual(record1.scores, record2.scores)
+        self.assertEqual(record1.draws, record2.draws)
+
+    def test_simulate_independent_of_workers(self):
+        summary1 = simulate(20, 2, seed=3, workers=1, chunk_size=5)
+        summary2 = simulate(20, 2, seed=3, workers=2, chunk_size=5)
+        self.assertEqual(summary1.games, 20)
+        self.assertEqual(summary1.score_totals, summary2.score_totals)
+        self.assertEqual(summary1.wins, summary2.wins)
+        self.assertTrue(sum(summary1.wins) >= 20)
+
+    def test_merge(self):
+        summary = SimulationSummary(2).merge(simulate(5, 2, workers=1))
+        self.assertEqual(summary.games, 5)
+        self.assertIn("5 games", summary.report())
+
+    def test_head_to_head(self):
+        result = head_to_head(HeuristicStrategy(), FirstCardStrategy(), 40, workers=1)
+        self.assertEqual(result.wins + result.losses + result.ties, 40)
+        low, high = result.get_interval()
+        self.assertTrue(low <= result.get_win_rate() <= high)
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low + high, 1.0)
+        self.assertTrue(0.40 < low < 0.41)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
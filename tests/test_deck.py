@@ -2,7 +2,7 @@ import unittest
 
 import pytest
 from pyarcade.games.card import Rank, Suit, Card
-from pyarcade.games.deck import Deck
+from pyarcade.games.deck import Deck, Shoe
 
 _DECK_SZ = 52
 
@@ -40,3 +40,68 @@ class DeckTestCase(unittest.TestCase):
         card2_shuffled = deck._cards[1] is not card2
         # Extremely unlikely to fail, but can happen
         self.assertTrue(card1_shuffled or card2_shuffled)
+
+
+@pytest.mark.local
+class ShoeTestCase(unittest.TestCase):
+    def test_new_shoe(self):
+        shoe = Shoe(6)
+        self.assertEqual(shoe.size(), 6 * _DECK_SZ)
+        shoe.reshuffle()
+        drawn = [shoe.draw() for _ in range(6 * _DECK_SZ)]
+        self.assertTrue(shoe.is_empty())
+        self.assertEqual(drawn.count(Card(Rank.ACE, Suit.SPADES)), 6)
+        self.assertRaises(IndexError, shoe.draw)
+
+    def test_penetration(self):
+        shoe = Shoe(1, 0.5)
+        shoe.reshuffle()
+        for _ in range(_DECK_SZ // 2 - 1):
+            shoe.draw()
+        self.assertFalse(shoe.needs_reshuffle())
+        shoe.draw()
+        self.assertTrue(shoe.needs_reshuffle())
+        shoe.reshuffle()
+        self.assertEqual(shoe.size(), _DECK_SZ)
+        self.assertFalse(shoe.needs_reshuffle())
+
+    def test_penetration_after_shuffle_and_copy(self):
+        shoe = Shoe(1, 0.5)
+        shoe.reshuffle()
+        for _ in range(_DECK_SZ // 2 - 1):
+            shoe.draw()
+        shoe.shuffle()
+        copy = shoe.copy()
+        self.assertFalse(shoe.needs_reshuffle())
+        self.assertFalse(copy.needs_reshuffle())
+        shoe.draw()
+        copy.draw()
+        self.assertTrue(shoe.needs_reshuffle())
+        self.assertTrue(copy.needs_reshuffle())
+
+    def test_reshuffle_in_play(self):
+        shoe = Shoe()
+        in_play = [Card(Rank.ACE, Suit.SPADES), Card(Rank.TWO, Suit.HEARTS)]
+        shoe.reshuffle(in_play)
+        self.assertEqual(shoe.size(), _DECK_SZ - 2)
+        drawn = [shoe.draw() for _ in range(shoe.size())]
+        self.assertFalse(any(card in drawn for card in in_play))
+
+    def test_add_cards_and_shuffle(self):
+        shoe = Shoe()
+        shoe.reshuffle()
+        drawn = [shoe.draw() for _ in range(_DECK_SZ)]
+        shoe.add_cards(drawn[:3])
+        shoe.shuffle()
+        self.assertEqual(shoe.size(), 3)
+        self.assertEqual(sorted(c.get_id() for c in [shoe.draw() for _ in range(3)]),
+                         sorted(c.get_id() for c in drawn[:3]))
+
+    def test_rank_counts(self):
+        shoe = Shoe(2)
+        shoe.reshuffle()
+        self.assertEqual([8] * 13, shoe.get_rank_counts())
+        card = shoe.draw()
+        counts = shoe.get_rank_counts()
+        self.assertEqual(7, counts[card.get_rank().value - 1])
+        self.assertEqual(103, sum(counts))
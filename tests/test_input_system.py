@@ -1,5 +1,6 @@
 import pytest
-from pyarcade.input_system import InputSystem
+from pyarcade.input_system import InputSystem, GameRegistry, Rejected
+from pyarcade.games.mastermind import Mastermind
 import unittest
 
 
@@ -117,3 +118,95 @@ class InputSystemTestCase(unittest.TestCase):
         input_sys = InputSystem()
         result = input_sys.handle_game_input("BlackJack", "stand")
         self.assertEqual(True, "CURRENT HAND" in result)
+
+    def test_crazy_eights_ai_turns(self):
+        input_sys = InputSystem()
+        game = input_sys.crazy_eights_game
+        player = game.players.get(1)
+        player.add_to_hand(game.discard[-1])  # guarantee a playable card
+        player.add_to_hand(game.discard[-1])
+        card = game.discard[-1]
+        result = input_sys.handle_crazy_eights_input("{},{}".format(card.get_rank().name, card.get_suit().name))
+        self.assertIn("was played", result)
+        # Each computer player took a turn after the user, unless one went out.
+        self.assertTrue(len(game.discard) == 5 or game.round_hist)
+        for n in (2, 3, 4):
+            self.assertTrue(len(game.players.get(n).get_cards()) >= 4 or game.round_hist)
+
+    def test_commands_normalized(self):
+        input_sys = InputSystem()
+        self.assertIn("CURRENT HAND", input_sys.handle_game_input(" BlackJack ", " Stand "))
+        self.assertIn("Player Hand", input_sys.handle_crazy_eights_input("DRAW"))
+        self.assertIn("bulls", input_sys.handle_mastermind_input("1 2 3 4"))
+
+    def test_register_command(self):
+        input_sys = InputSystem()
+        input_sys.register_command("Blackjack", "Odds", lambda: "odds shown")
+        self.assertEqual("odds shown", input_sys.handle_game_input("blackjack", "odds"))
+        self.assertIn("Invalid input", input_sys.handle_game_input("mastermind", "odds"))
+
+    def test_games_built_on_first_use(self):
+        input_sys = InputSystem()
+        self.assertEqual({}, input_sys.games)
+        input_sys.handle_game_input("Minesweeper", "1,2")
+        self.assertEqual(["minesweeper"], list(input_sys.games))
+        game = input_sys.blackjack_game
+        self.assertIs(game, input_sys.blackjack_game)
+        input_sys.handle_game_input("Blackjack", "new game")
+        self.assertIsNot(game, input_sys.blackjack_game)
+
+    def test_game_registry(self):
+        registry = GameRegistry({"mastermind": "pyarcade.games.mastermind:Mastermind"})
+        self.assertEqual(Mastermind, registry.get_factory("mastermind"))
+        registry.register("blackjack", lambda num_decks=1: num_decks)
+        self.assertEqual(2, registry.create("blackjack", num_decks=2))
+        with self.assertRaises(ValueError):
+            registry.get_factory("go_fish")
+
+    def test_handle_moves(self):
+        input_sys = InputSystem()
+        input_sys.mastermind_game.set_hidden_sequence([1, 2, 3, 4])
+        outputs = input_sys.handle_moves("mastermind", ["5678", "1 2 3 5"])
+        self.assertEqual(["[5, 6, 7, 8]: 0 bulls and 0 cows", "[1, 2, 3, 5]: 3 bulls and 0 cows"], outputs)
+        self.assertEqual(2, len(input_sys.mastermind_game.current_history))
+
+    def test_handle_moves_atomic(self):
+        input_sys = InputSystem()
+        game = input_sys.mastermind_game
+        game.set_hidden_sequence([1, 2, 3, 4])
+        version = game.version
+        with self.assertRaises(ValueError):
+            input_sys.handle_moves("mastermind", ["5678", "1234", "12"])
+        self.assertIs(game, input_sys.mastermind_game)
+        self.assertEqual({}, game.current_history)
+        self.assertEqual(0, input_sys.mastermind_stats.wins)
+        self.assertIs(input_sys.mastermind_stats, game.stats)
+        self.assertGreater(game.version, version)
+        with self.assertRaises(ValueError):
+            input_sys.handle_moves("minesweeper", ["save"])
+
+    def test_handle_moves_seeded(self):
+        one_at_a_time = InputSystem(seed=3)
+        one_at_a_time.handle_game_input("Minesweeper", "new game")
+        batched = InputSystem(seed=3)
+        with self.assertRaises(ValueError):
+            batched.handle_moves("minesweeper", ["new game", "9,9"])
+        batched.handle_moves("minesweeper", ["new game"])
+        self.assertEqual(one_at_a_time.minesweeper_game.hidden_grid, batched.minesweeper_game.hidden_grid)
+
+    def test_rejected_moves(self):
+        input_sys = InputSystem(seed=5)
+        reply = input_sys.handle_game_input("Minesweeper", "9,9")
+        self.assertIsInstance(reply, Rejected)
+        self.assertTrue(reply.startswith("Guess is out of bounds"))
+
+        input_sys.handle_game_input("Crazy Eights", "new game")
+        hand = input_sys.crazy_eights_game.players.get(1).get_cards()
+        missing = next(card for card in input_sys.crazy_eights_game.players.get(2).get_cards() if card not in hand)
+        missing = "{},{}".format(missing.get_rank().name, missing.get_suit().name)
+        reply = input_sys.handle_game_input("Crazy Eights", missing)
+        self.assertIsInstance(reply, Rejected)
+        self.assertIn("was not played", reply)
+        self.assertIsInstance(input_sys.handle_game_input("Crazy Eights", "Jack of Spades"), Rejected)
+        with self.assertRaises(ValueError):
+            input_sys.handle_moves("crazy_eights", ["draw", missing])
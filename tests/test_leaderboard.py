@@ -0,0 +1,97 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+import pytest
+from pyarcade.input_system import InputSystem
+from pyarcade.leaderboard import Leaderboard, ScoreRecord, ScoreWriter, ALL_TIME, DAILY, PERIODS, WEEKLY, \
+    window_start
+from tests.test_scores import crazy_eights_inputs, winning_inputs
+
+
+@pytest.mark.local
+class LeaderboardTestCase(unittest.TestCase):
+    def test_leaderboard(self):
+        leaderboard = Leaderboard(size=2)
+        leaderboard.add([ScoreRecord("minesweeper", 1, 50)])
+        self.assertIsNone(leaderboard.top("minesweeper"))
+
+        leaderboard.load("minesweeper", [ScoreRecord("minesweeper", 1, 10), ScoreRecord("minesweeper", 2, 30)])
+        leaderboard.add([ScoreRecord("minesweeper", 3, 20), ScoreRecord("crazy_eights", 1, 99)])
+        self.assertEqual([30, 20], [record.score for record in leaderboard.top("minesweeper")])
+        self.assertIsNone(leaderboard.top("crazy_eights"))
+
+    def test_writer_batches(self):
+        batches = []
+        release = threading.Event()
+
+        def store(batch):
+            release.wait()
+            batches.append(batch)
+
+        leaderboard = Leaderboard()
+        leaderboard.load("minesweeper", [])
+        writer = ScoreWriter(store, leaderboard, batch_size=3, flush_interval=5.0)
+        for score in range(5):
+            self.assertTrue(writer.record(1, "minesweeper", score))
+        release.set()
+        writer.stop()
+        self.assertEqual([3, 2], [len(batch) for batch in batches])
+        self.assertEqual(5, writer.written)
+        self.assertEqual([4, 3, 2, 1, 0], [record.score for record in leaderboard.top("minesweeper")])
+
+    def test_writer_failure(self):
+        def store(batch):
+            raise ConnectionError
+
+        leaderboard = Leaderboard()
+        leaderboard.load("minesweeper", [])
+        writer = ScoreWriter(store, leaderboard, flush_interval=0)
+        writer.record(1, "minesweeper", 10)
+        writer.flush()
+        self.assertEqual(1, writer.failed)
+        self.assertEqual([], leaderboard.top("minesweeper"))
+
+    def test_game_over_reported(self):
+        finished = []
+        input_sys = InputSystem(seed=11, on_game_over=lambda game, score: finished.append((game, score)))
+        for user_input in winning_inputs(11):
+            input_sys.handle_game_input("Minesweeper", user_input)
+        self.assertEqual([("minesweeper", input_sys.minesweeper_game.score)], finished)
+        input_sys.handle_game_input("Minesweeper", "undo")
+        input_sys.handle_game_input("Minesweeper", "redo")
+        self.assertEqual(1, len(finished))
+
+        input_sys = InputSystem(seed=11, on_game_over=lambda game, score: finished.append((game, score)))
+        input_sys.handle_moves("crazy_eights", list(crazy_eights_inputs(11)))
+        self.assertEqual("crazy_eights", finished[-1][0])
+        self.assertGreater(finished[-1][1], 0)
+        self.assertIsNone(input_sys.crazy_eights_game.game_over)
+        input_sys.handle_moves("crazy_eights", ["new game", "reset"])
+        self.assertEqual(2, len(finished))  # the game ended before a round was played out
+
+    def test_periods(self):
+        monday = datetime(2026, 10, 19, 12)
+        self.assertEqual(datetime(2026, 10, 19), window_start(DAILY, monday))
+        self.assertEqual(datetime(2026, 10, 19), window_start(WEEKLY, monday + timedelta(days=6)))
+        self.assertEqual(datetime.min, window_start(ALL_TIME, monday))
+        with self.assertRaises(ValueError):
+            window_start("monthly", monday)
+
+        leaderboard = Leaderboard(size=2)
+        for period in PERIODS:
+            leaderboard.load("minesweeper", [ScoreRecord("minesweeper", 1, 30, monday)], period, monday)
+        leaderboard.add([ScoreRecord("minesweeper", 2, 10, monday + timedelta(days=1))])
+        tuesday = monday + timedelta(days=1)
+        self.assertEqual([10], [record.score for record in leaderboard.top("minesweeper", DAILY, tuesday)])
+        self.assertEqual([30, 10], [record.score for record in leaderboard.top("minesweeper", WEEKLY, tuesday)])
+
+        next_week = monday + timedelta(days=7)
+        self.assertEqual([], leaderboard.top("minesweeper", DAILY, next_week))
+        self.assertEqual([], leaderboard.top("minesweeper", WEEKLY, next_week))
+        self.assertEqual([30, 10], [record.score for record in leaderboard.top("minesweeper", ALL_TIME, next_week)])
+        leaderboard.add([ScoreRecord("minesweeper", 3, 5, monday)])  # its week is over
+        self.assertEqual([], leaderboard.top("minesweeper", WEEKLY, next_week))
+
+        leaderboard.forget("minesweeper")
+        self.assertIsNone(leaderboard.top("minesweeper"))
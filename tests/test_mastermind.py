@@ -1,7 +1,9 @@
 from unittest import TestCase
+import pickle
 
 import pytest
-from pyarcade.games.mastermind import Mastermind, total_history
+from pyarcade.games import mastermind
+from pyarcade.games.mastermind import Mastermind, MastermindStats, get_user_stats
 
 
 @pytest.mark.local
@@ -10,16 +12,19 @@ class MastermindTestCase(TestCase):
         game1 = Mastermind()
         game1.set_hidden_sequence([1, 2, 3, 4])
         game1.evaluate([1, 2, 3, 4])
-        self.assertEqual({1: {(1, 2, 3, 4): {1: [1], 2: [1], 3: [1], 4: [1]}}}, total_history)
+        self.assertEqual(1, game1.stats.wins)
+        self.assertEqual({1: 1}, game1.stats.guess_histogram)
+        self.assertEqual([{(1, 2, 3, 4): {1: [1], 2: [1], 3: [1], 4: [1]}}], list(game1.stats.recent_histories))
         game1.clear()
-        self.assertEqual({}, total_history)
+        self.assertEqual(0, game1.stats.wins)
+        self.assertEqual(0, len(game1.stats.recent_histories))
 
     def test_some_correct_digits(self):
         game = Mastermind()
         game.set_hidden_sequence([1, 2, 3, 4])
         game.evaluate([1, 8, 6, 2])
         self.assertEqual({(1, 8, 6, 2): {1: [1], 8: [-1], 6: [-1], 2: [0]}}, game.current_history)
-        self.assertEqual({}, total_history)
+        self.assertEqual(0, game.stats.wins)
         game.reset()
         self.assertEqual({}, game.current_history)
         game.clear()
@@ -29,5 +34,67 @@ class MastermindTestCase(TestCase):
         game.set_hidden_sequence([1, 2, 3, 4])
         game.evaluate([5, 6, 7, 8])
         self.assertEqual({(5, 6, 7, 8): {5: [-1], 6: [-1], 7: [-1], 8: [-1]}}, game.current_history)
-        self.assertEqual({}, total_history)
+        self.assertEqual(0, game.stats.wins)
         game.clear()
+
+    def test_stats_shared_and_capped(self):
+        stats = MastermindStats(max_recent=2)
+        for _ in range(3):
+            game = Mastermind(stats=stats)
+            game.set_hidden_sequence([1, 2, 3, 4])
+            game.evaluate([4, 3, 2, 1])
+            game.evaluate([1, 2, 3, 4])
+        self.assertEqual(3, stats.games)
+        self.assertEqual(3, stats.wins)
+        self.assertEqual({2: 3}, stats.guess_histogram)
+        self.assertEqual(2, len(stats.recent_histories))
+        self.assertEqual(2.0, stats.get_average_guesses())
+
+    def test_stats_merge(self):
+        stats1 = MastermindStats()
+        stats2 = MastermindStats()
+        stats1.record_game()
+        stats1.record_win({(1, 2, 3, 4): {}})
+        stats2.record_game()
+        stats2.record_win({(1, 2, 3, 5): {}, (1, 2, 3, 4): {}})
+        stats1.merge(stats2)
+        self.assertEqual(2, stats1.games)
+        self.assertEqual(2, stats1.wins)
+        self.assertEqual({1: 1, 2: 1}, stats1.guess_histogram)
+
+    def test_stats_pickle(self):
+        game = Mastermind()
+        game.set_hidden_sequence([1, 2, 3, 4])
+        game.evaluate([1, 2, 3, 4])
+        loaded = pickle.loads(pickle.dumps(game))
+        loaded.stats.record_game()
+        self.assertEqual(1, loaded.stats.wins)
+        self.assertEqual(2, loaded.stats.games)
+
+    def test_user_stats(self):
+        self.assertIs(get_user_stats('user1'), get_user_stats('user1'))
+        self.assertIsNot(get_user_stats('user1'), get_user_stats('user2'))
+
+    def test_user_stats_bounded(self):
+        first = get_user_stats('first')
+        for n in range(mastermind.MAX_USER_STATS - 1):
+            get_user_stats('user{}'.format(n))
+        self.assertIs(first, get_user_stats('first'))  # now the most recently used
+        for n in range(mastermind.MAX_USER_STATS):
+            get_user_stats('other{}'.format(n))
+        self.assertIsNot(first, get_user_stats('first'))
+        self.assertLessEqual(len(mastermind._user_stats), mastermind.MAX_USER_STATS)
+
+    def test_undo_redo(self):
+        game = Mastermind()
+        game.set_hidden_sequence([1, 2, 3, 4])
+        game.evaluate([5, 6, 7, 8])
+        game.evaluate([1, 2, 5, 6])
+        self.assertEqual("Guess [1, 2, 5, 6] undone", game.undo())
+        self.assertEqual([(5, 6, 7, 8)], list(game.current_history))
+        self.assertIn("2 bulls", game.redo())
+        self.assertEqual(2, len(game.current_history))
+        self.assertEqual("Nothing to redo", game.redo())
+
+        game.evaluate([1, 2, 3, 4])
+        self.assertEqual("Nothing to undo", game.undo())
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+
+import pytest
+from pyarcade.matchmaking import Matchmaker
+from pyarcade.tables import TableService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.local
+class MatchmakingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.service = TableService()
+        self.matchmaker = Matchmaker(self.service, target_size=3, fill_time=10,
+                                     rating_window=100, window_growth=20, clock=self.clock)
+
+    def queue(self, loop, ratings):
+        return {name: loop.create_task(self.matchmaker.find_table(name, rating=rating))
+                for name, rating in ratings.items()}
+
+    def test_full_table(self):
+        async def run():
+            tasks = self.queue(asyncio.get_running_loop(),
+                               {"a": 1000, "b": 1050, "c": 950, "d": 1500})
+            await asyncio.sleep(0)
+            tables = self.matchmaker.match()
+            self.assertEqual(1, len(tables))
+            self.assertEqual(3, len(tables[0].game.players))
+            matches = [await tasks[name] for name in "abc"]
+            self.assertEqual({1, 2, 3}, set(match.seat for match in matches))
+            self.assertFalse(tasks["d"].done())
+            self.assertEqual({"crazy_eights": 1}, self.matchmaker.get_metrics()["queue_depth"])
+            self.assertTrue(self.matchmaker.cancel("d"))
+            await asyncio.gather(tasks["d"], return_exceptions=True)
+            self.assertTrue(tasks["d"].cancelled())
+        asyncio.run(run())
+
+    def test_window_widens(self):
+        async def run():
+            tasks = self.queue(asyncio.get_running_loop(), {"a": 1000, "b": 1250})
+            await asyncio.sleep(0)
+            self.assertEqual([], self.matchmaker.match())
+
+            # Both windows reach 250 after 7.5 seconds, but the table only
+            # opens short-handed once the fill time has passed.
+            self.clock.now = 8
+            self.assertEqual([], self.matchmaker.match())
+            self.clock.now = 10
+            tables = self.matchmaker.match()
+            self.assertEqual(2, len(tables[0].game.players))
+            self.assertEqual(10, (await tasks["a"]).waited)
+
+            metrics = self.matchmaker.get_metrics()
+            self.assertEqual(2, metrics["players_matched"])
+            self.assertEqual(1, metrics["tables_opened"])
+            self.assertEqual(10, metrics["mean_wait"])
+        asyncio.run(run())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Matchmaker(self.service, target_size=8)
+        with self.assertRaises(ValueError):
+            asyncio.run(self.matchmaker.find_table("a", "mastermind"))
+
+    def test_background(self):
+        matchmaker = Matchmaker(self.service, target_size=2, interval=0.01).start()
+        try:
+            futures = [matchmaker.submit(name) for name in "ab"]
+            matches = [future.result(5) for future in futures]
+            self.assertEqual(matches[0].table_id, matches[1].table_id)
+        finally:
+            matchmaker.stop()
@@ -88,3 +88,35 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual([[3, 1], [4, 6]], self.game.game_history)
         self.game.clear_game_history()
         self.assertEqual([], self.game.game_history)
+
+    def test_undo_redo(self):
+        game = Minesweeper()
+        game.set_hidden_grid({0: [0]})
+        board = game.draw_board()
+        game.make_move([8, 8])
+        revealed = game.draw_board()
+        self.assertNotEqual(board, revealed)
+
+        game.undo()
+        self.assertEqual(board, game.draw_board())
+        self.assertEqual(81, game.total_hidden_squares)
+        self.assertEqual([], game.game_history)
+        self.assertEqual("New game.", game.game_state)
+
+        game.redo()
+        self.assertEqual(revealed, game.draw_board())
+        self.assertEqual([[8, 8]], game.game_history)
+        self.assertIn("Nothing to redo", game.redo())
+
+    def test_undo_mine(self):
+        game = Minesweeper(undo_depth=1)
+        game.set_hidden_grid({0: [0]})
+        game.make_move([8, 8])
+        game.make_move([8, 8])
+        self.assertIn("Move undone", game.undo())
+        self.assertIn("Nothing to undo", game.undo())  # only one move is kept
+        game.make_move([0, 0])
+        self.assertEqual("Game over.", game.game_state)
+        self.assertIn("Nothing to undo", game.undo())
+        self.assertEqual("Game over.", game.game_state)
+        self.assertIn("Nothing to redo", game.redo())
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import pytest
+from pyarcade.leaderboard import ScoreRecord
+from pyarcade.percentiles import ScoreHistogram, ScoreHistograms, bucket_bounds, bucket_of
+
+
+@pytest.mark.local
+class PercentilesTestCase(unittest.TestCase):
+    def test_buckets(self):
+        self.assertEqual(0, bucket_of(0))
+        self.assertEqual(0, bucket_of(-5))
+        for score in (1, 2, 9, 10, 11, 1000, 123456):
+            lower, upper = bucket_bounds(bucket_of(score))
+            self.assertLessEqual(lower, score + 1e-9)
+            self.assertLess(score, upper + 1e-9)
+
+    def test_percentile_and_rank(self):
+        histogram = ScoreHistogram()
+        self.assertEqual(100.0, histogram.percentile(10))
+        for score in range(1, 1001):
+            histogram.add(score)
+        self.assertEqual(1000, histogram.total)
+        self.assertAlmostEqual(50.0, histogram.percentile(500), delta=5.0)
+        self.assertAlmostEqual(90.0, histogram.percentile(900), delta=5.0)
+        self.assertAlmostEqual(100, histogram.rank(900), delta=50)
+        self.assertEqual(100.0, histogram.percentile(5000))
+        self.assertEqual(1, histogram.rank(5000))
+        self.assertEqual(0.0, histogram.percentile(0))
+        self.assertEqual(1001, histogram.rank(0))
+
+    def test_histograms(self):
+        histograms = ScoreHistograms()
+        histograms.add("minesweeper", 100, count=3, high_score_id=3)
+        histograms.add_records([ScoreRecord("minesweeper", 1, 10), ScoreRecord("crazy_eights", 1, 5)], 5)
+        self.assertEqual(5, histograms.last_id)
+        self.assertEqual(4, histograms.get_histogram("minesweeper").total)
+        self.assertEqual(25.0, histograms.percentile("minesweeper", 50))
+        self.assertEqual(4, histograms.rank("minesweeper", 50))
+        self.assertEqual(0, histograms.get_histogram("blackjack").total)
+
+        histograms.remove("minesweeper", 10)
+        histograms.add("minesweeper", 1000)  # the score was changed to 1000
+        self.assertEqual(4, histograms.get_histogram("minesweeper").total)
+        self.assertEqual(0.0, histograms.percentile("minesweeper", 50))
+        histograms.remove("blackjack", 10)
+        self.assertEqual(0, histograms.get_histogram("blackjack").total)
+
+    def test_save_and_load(self):
+        histograms = ScoreHistograms()
+        histograms.add("minesweeper", 100, high_score_id=7)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "histograms.json")
+            self.assertFalse(histograms.load(path))
+            self.assertTrue(histograms.save(path))
+            self.assertFalse(histograms.save(path))
+
+            loaded = ScoreHistograms()
+            self.assertTrue(loaded.load(path))
+            self.assertEqual(7, loaded.last_id)
+            self.assertEqual(histograms.get_histogram("minesweeper").counts,
+                             loaded.get_histogram("minesweeper").counts)
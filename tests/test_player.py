@@ -1,5 +1,5 @@
 import pytest
-from pyarcade.games.card import Rank, Suit, Card
+from pyarcade.games.card import Rank, Suit, Card, SUIT_MASKS, RANK_MASKS
 from pyarcade.games.player import Player
 import unittest
 
@@ -7,10 +7,22 @@ import unittest
 @pytest.mark.local
 class PlayerTestCase(unittest.TestCase):
     def test_remove_from_hand(self):
-        pass
+        card = Card(Rank.ACE, Suit.SPADES)
+        p1 = Player([card, card])
+        p1.remove_from_hand(card)
+        self.assertTrue(p1.has(card))
+        p1.remove_from_hand(card)
+        self.assertFalse(p1.has(card))
+        self.assertFalse(p1.has_cards())
+        p1.remove_from_hand(card)
+        self.assertFalse(p1.has_cards())
 
     def test_has(self):
-        pass
+        p1 = Player([Card(Rank.ACE, Suit.SPADES)])
+        self.assertTrue(p1.has(Card(Rank.ACE, Suit.SPADES)))
+        self.assertFalse(p1.has(Card(Rank.ACE, Suit.HEARTS)))
+        p1.clear_hand()
+        self.assertFalse(p1.has(Card(Rank.ACE, Suit.SPADES)))
 
     def test_get_cards(self):
         cards = [Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS),
@@ -21,5 +33,36 @@ class PlayerTestCase(unittest.TestCase):
         self.assertEqual(len(p1.get_cards(Suit.SPADES)), 2)
         self.assertEqual(len(p1.get_cards(Suit.CLUBS)), 0)
 
+    def test_get_cards_in(self):
+        cards = [Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS),
+                 Card(Rank.KING, Suit.SPADES), Card(Rank.KING, Suit.SPADES)]
+        p1 = Player(cards)
+        mask = RANK_MASKS[Rank.ACE] | SUIT_MASKS[Suit.SPADES]
+        self.assertEqual(p1.get_cards_in(mask), [Card(Rank.ACE, Suit.SPADES),
+                                                 Card(Rank.KING, Suit.SPADES),
+                                                 Card(Rank.KING, Suit.SPADES),
+                                                 Card(Rank.ACE, Suit.HEARTS)])
+
+    def test_no_shared_default_hand(self):
+        p1 = Player()
+        p2 = Player()
+        p1.add_to_hand(Card(Rank.TWO, Suit.CLUBS))
+        self.assertFalse(p2.has_cards())
+
+    def test_hand_total(self):
+        p1 = Player([Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS)])
+        self.assertEqual(p1.get_hand_total(), 12)
+        self.assertEqual(p1.get_hard_total(), 2)
+        self.assertTrue(p1.is_soft())
+        p1.add_to_hand(Card(Rank.KING, Suit.CLUBS))
+        self.assertEqual(p1.get_hand_total(), 12)
+        self.assertFalse(p1.is_soft())
+        p1.remove_from_hand(Card(Rank.KING, Suit.CLUBS))
+        p1.add_to_hand(Card(Rank.NINE, Suit.CLUBS))
+        self.assertEqual(p1.get_hand_total(), 21)
+        p1.clear_hand()
+        self.assertEqual(p1.get_hand_total(), 0)
+        self.assertFalse(p1.is_soft())
+
     def test_show_hand(self):
         pass
@@ -0,0 +1,106 @@
+import io
+import unittest
+
+import pytest
+from pyarcade.input_system import InputSystem
+from pyarcade.replay import Recorder, read_log, replay, replay_all, summarize
+from pyarcade.scores import ScoreClaim, verify_score
+from tests.test_scores import crazy_eights_inputs
+
+
+def record_session(recorder, seed):
+    input_sys = InputSystem(seed=seed, recorder=recorder)
+    for user_input in ("new game", "1234", "5678", "state"):
+        input_sys.handle_game_input("Mastermind", user_input)
+    for user_input in ("new game", "4,4", "0,0", "reset", "8,8"):
+        input_sys.handle_game_input("Minesweeper", user_input)
+    for user_input in ("new game", "draw", "Eight,Spades", "continue"):
+        input_sys.handle_game_input("Crazy Eights", user_input)
+    for user_input in ("new game", "hit", "stand", "reset", "stand"):
+        input_sys.handle_game_input("Blackjack", user_input)
+
+
+@pytest.mark.local
+class ReplayTestCase(unittest.TestCase):
+    def test_seeded_games_repeat(self):
+        first, second = InputSystem(seed=5), InputSystem(seed=5)
+        self.assertEqual(first.handle_game_input("Minesweeper", "new game"),
+                         second.handle_game_input("Minesweeper", "new game"))
+        self.assertEqual(first.mastermind_game.hidden_sequence, second.mastermind_game.hidden_sequence)
+
+    def test_replay_matches(self):
+        recorder = Recorder()
+        record_session(recorder, 7)
+        recordings = recorder.get_recordings()
+        self.assertEqual(4, len(recordings))
+        for recording in recordings:
+            result = replay(recording)
+            self.assertFalse(result.diverged, recording.game)
+            self.assertEqual(len(recording.inputs), result.moves)
+
+    def test_replay_detects_divergence(self):
+        recorder = Recorder()
+        record_session(recorder, 7)
+        recording = recorder.get_recordings()[0]
+        self.assertTrue(replay(recording._replace(seed=8)).diverged)
+
+    def test_log_round_trip(self):
+        recorder = Recorder()
+        record_session(recorder, 1)
+        log = io.StringIO()
+        self.assertEqual(4, recorder.write(log))
+        log.seek(0)
+        recordings = list(read_log(log))
+        self.assertEqual(recorder.get_recordings(), recordings)
+
+        totals = summarize(replay_all(recordings, workers=2))
+        self.assertEqual({"mastermind", "minesweeper", "crazy eights", "blackjack"}, set(totals))
+        self.assertEqual(4, totals["mastermind"]["moves"])
+        self.assertEqual(0, sum(game["diverged"] for game in totals.values()))
+
+    def test_unseeded_and_loaded_games_dropped(self):
+        recorder = Recorder()
+        InputSystem(recorder=recorder).handle_game_input("Mastermind", "1234")
+        input_sys = InputSystem(seed=3, recorder=recorder)
+        input_sys.handle_game_input("Mastermind", "1234")
+        input_sys.game_to_load = input_sys.mastermind_game
+        input_sys.handle_game_input("Mastermind", "load")
+        input_sys.handle_game_input("Mastermind", "5678")
+        self.assertEqual([], recorder.get_recordings())
+
+    def test_sessions_kept_apart(self):
+        recorder = Recorder()
+        first, second = InputSystem(seed=2, recorder=recorder), InputSystem(seed=2, recorder=recorder)
+        first.handle_game_input("Mastermind", "1234")
+        second.handle_game_input("Mastermind", "5678")
+        second.handle_moves("mastermind", ["1111"])
+        self.assertEqual([("1234",), ("5678", "1111")],
+                         [recording.inputs for recording in recorder.get_recordings()])
+
+    def test_recorded_inputs_verify(self):
+        finished = []
+        recorder = Recorder()
+        input_sys = InputSystem(seed=11, recorder=recorder,
+                                on_game_over=lambda game, score: finished.append(score))
+        self.assertIsNone(input_sys.recorder.get_inputs("Crazy Eights"))
+        input_sys.handle_game_input("Crazy Eights", "new game")
+        input_sys.handle_moves("crazy_eights", list(crazy_eights_inputs(11))[1:])
+        inputs = input_sys.recorder.get_inputs("Crazy Eights")
+        self.assertEqual(tuple(crazy_eights_inputs(11)), inputs)
+        self.assertIsNone(verify_score(ScoreClaim("crazy_eights", 1, finished[-1], 11, inputs)))
+
+    def test_recordings_flushed(self):
+        log = io.StringIO()
+        recorder = Recorder(log, max_games=1)
+        input_sys = InputSystem(seed=4, recorder=recorder)
+        input_sys.handle_game_input("Mastermind", "1234")
+        input_sys.handle_game_input("Minesweeper", "new game")  # writes the Mastermind game
+        input_sys.handle_game_input("Mastermind", "5678")  # no longer recorded
+        self.assertEqual(["minesweeper"], [recording.game.lower() for recording in recorder.get_recordings()])
+
+        input_sys.shutdown()
+        self.assertEqual([], recorder.get_recordings())
+        log.seek(0)
+        recordings = list(read_log(log))
+        self.assertEqual([("1234",), ("new game",)], [recording.inputs for recording in recordings])
+        self.assertFalse(any(replay(recording).diverged for recording in recordings))
@@ -0,0 +1,104 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyarcade.input_system import InputSystem
+from pyarcade.scores import PlaySessions, ScoreClaim, ScoreVerifier, replay_score, verify_score, ACCEPTED, REJECTED
+
+
+def winning_inputs(seed):
+    """Inputs that clear every safe cell of a seeded session's Minesweeper game."""
+    input_sys = InputSystem(seed=seed)
+    inputs = ["new game"]
+    input_sys.handle_game_input("Minesweeper", "new game")
+    game = input_sys.minesweeper_game
+    for row in range(game.height):
+        for col in range(game.width):
+            if game.hidden_grid[row][col] == "-":
+                move = "{},{}".format(row, col)
+                input_sys.handle_game_input("Minesweeper", move)
+                inputs.append(move)
+    return tuple(inputs)
+
+
+def card_input(card):
+    """Input that plays a card, e.g. "Jack,Spades"."""
+    return "{},{}".format(card.get_rank().name, card.get_suit().name)
+
+
+def crazy_eights_inputs(seed):
+    """Inputs that play a seeded session's Crazy Eights game until the user
+    has won a round, then reset it to end the game."""
+    input_sys = InputSystem(seed=seed)
+    inputs = ["new game"]
+    input_sys.handle_game_input("Crazy Eights", "new game")
+    game = input_sys.crazy_eights_game
+    while not game.players.get(1).get_score():
+        card_ops = game.play_options(1)
+        user_input = card_input(card_ops[0]) if card_ops else "draw"
+        input_sys.handle_game_input("Crazy Eights", user_input)
+        inputs.append(user_input)
+    return tuple(inputs) + ("reset",)
+
+
+@pytest.mark.local
+class ScoresTestCase(unittest.TestCase):
+    def setUp(self):
+        self.inputs = winning_inputs(11)
+        self.score = replay_score(ScoreClaim("minesweeper", 1, 0, 11, self.inputs, 10.0))
+
+    def test_minesweeper_score(self):
+        self.assertGreater(self.score, 0)
+        self.assertEqual(self.score // 2, replay_score(ScoreClaim("minesweeper", 1, 0, 11, self.inputs, 20.0)))
+        self.assertIsNone(verify_score(ScoreClaim("minesweeper", 1, self.score, 11, self.inputs, 10.0)))
+        self.assertIn("earned a score", verify_score(ScoreClaim("minesweeper", 1, self.score + 1, 11,
+                                                                self.inputs, 10.0)))
+        self.assertEqual("The game was not won",
+                         verify_score(ScoreClaim("minesweeper", 1, self.score, 11, self.inputs[:-1], 10.0)))
+        self.assertIsNotNone(verify_score(ScoreClaim("minesweeper", 1, self.score, 12, self.inputs, 10.0)))
+
+    def test_crazy_eights_score(self):
+        inputs = crazy_eights_inputs(4)
+        score = replay_score(ScoreClaim("crazy_eights", 1, 0, 4, inputs))
+        self.assertGreater(score, 0)
+        claim = ScoreClaim("crazy_eights", 1, score, 4, inputs)
+        self.assertIsNone(verify_score(claim))
+        self.assertIn("earned a score", verify_score(claim._replace(score=score + 1)))
+        self.assertEqual("The game did not end", verify_score(claim._replace(inputs=inputs[:-1])))
+        self.assertIsNotNone(verify_score(claim._replace(game="blackjack")))
+
+    def test_verifier(self):
+        stored = []
+        verifier = ScoreVerifier(lambda claim: stored.append(claim) or len(stored),
+                                 max_pending=1, executor=ThreadPoolExecutor(1))
+        good = ScoreClaim("minesweeper", 1, self.score, 11, self.inputs, 10.0)
+        first = verifier.submit(good)
+        verifier.shutdown()
+        self.assertEqual({"status": ACCEPTED, "high_score_id": 1}, verifier.get_status(first))
+        self.assertEqual([good], stored)
+
+        verifier = ScoreVerifier(stored.append, executor=ThreadPoolExecutor(1))
+        second = verifier.submit(good._replace(score=0))
+        verifier.shutdown()
+        self.assertEqual(REJECTED, verifier.get_status(second)["status"])
+        self.assertIsNone(verifier.get_status(99))
+
+    def test_play_sessions(self):
+        sessions = PlaySessions(max_sessions=1)
+        seed = sessions.start(1)
+        sessions.finish_game(seed, "minesweeper", self.score, 10.0)
+        claim = ScoreClaim("minesweeper", 1, self.score, seed, self.inputs)
+        with self.assertRaises(ValueError):
+            sessions.check_claim(claim._replace(user_id=2))
+        with self.assertRaises(ValueError):
+            sessions.check_claim(claim._replace(score=self.score + 1))
+        with self.assertRaises(ValueError):
+            sessions.check_claim(claim._replace(seconds=2.0))
+        self.assertEqual(10.0, sessions.check_claim(claim._replace(seconds=10.5)).seconds)
+        with self.assertRaises(ValueError):
+            sessions.check_claim(claim)  # already claimed
+
+        sessions.finish_game(seed, "minesweeper", self.score, 10.0)
+        sessions.start(2)  # drops the first session
+        with self.assertRaises(ValueError):
+            sessions.check_claim(claim)
@@ -0,0 +1,99 @@
+import random
+import unittest
+
+import pytest
+from pyarcade.tables import Subscriber, TableService
+
+
+@pytest.mark.local
+class TablesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.service = TableService()
+        self.table = self.service.create_table(2, random.Random(3))
+
+    def tearDown(self):
+        self.service.close_table(self.table.table_id)
+
+    def test_join(self):
+        self.assertEqual(1, self.table.join("alice"))
+        self.assertEqual(1, self.table.join("alice"))
+        self.assertEqual(2, self.table.join("bob"))
+        self.assertEqual(0, self.table.join("carol"))
+        self.assertTrue(self.table.is_full())
+
+    def test_move_before_full(self):
+        self.table.join("alice")
+        with self.assertRaises(ValueError):
+            self.table.submit(1).result(5)
+
+    def test_moves_in_turn(self):
+        self.table.join("alice")
+        self.table.join("bob")
+        with self.assertRaises(ValueError):
+            self.table.submit(2).result(5)
+
+        game = self.table.game
+        card_ops = game.play_options(1)
+        if not card_ops:
+            move = self.table.submit(1).result(5)
+            self.assertIsNone(move["card"])
+            self.assertEqual(1, move["turn"])
+        else:
+            move = self.table.submit(1, card_ops[0]).result(5)
+            self.assertEqual(str(card_ops[0]), move["card"])
+            self.assertEqual(2, move["turn"])
+        self.assertEqual(1, move["version"])
+
+    def test_events(self):
+        self.table.join("alice")
+        self.table.join("bob")
+        alice = self.table.subscribe(1)
+        spectator = self.table.subscribe()
+
+        event, state = alice.get(1)
+        self.assertEqual("state", event)
+        self.assertEqual(7, len(state["hand"]))
+        event, state = spectator.get(1)
+        self.assertNotIn("hand", state)
+
+        self.table.submit(1).result(5)  # draw
+        self.assertEqual("move", alice.get(1)[0])
+        event, hand = alice.get(1)
+        self.assertEqual("hand", event)
+        self.assertEqual(8, len(hand["cards"]))
+        self.assertEqual("move", spectator.get(1)[0])
+        self.assertIsNone(spectator.get(0))
+
+    def test_slow_subscriber_resyncs(self):
+        subscriber = Subscriber(max_events=2)
+        for n in range(5):
+            subscriber.put("move", {"version": n})
+        self.assertEqual(("resync", None), subscriber.get(0))
+        self.assertIsNone(subscriber.get(0))
+        self.assertEqual(5, subscriber.dropped)
+        subscriber.put("move", {"version": 5})
+        self.assertEqual(("move", {"version": 5}), subscriber.get(0))
+
+    def test_stream(self):
+        subscriber = self.table.subscribe()
+        stream = self.table.stream(subscriber, keep_alive=0.01)
+        self.assertTrue(next(stream).startswith("event: state\ndata: {"))
+        self.assertEqual(": keep-alive\n\n", next(stream))
+
+        self.service.close_table(self.table.table_id)
+        with self.assertRaises(StopIteration):
+            next(stream)
+        self.assertIsNone(self.service.get_table(self.table.table_id))
+
+    def test_close_idle_tables(self):
+        self.table.join("alice")
+        self.table.join("bob")
+        self.table.submit(1).result(5)
+        worker = self.table._worker
+        self.assertEqual(0, self.service.close_idle_tables())
+
+        self.service.max_idle = 0
+        other = self.service.create_table(2)  # closes the idle table
+        self.assertIsNone(self.service.get_table(self.table.table_id))
+        self.assertFalse(worker.is_alive())
+        self.assertIs(other, self.service.get_table(other.table_id))
@@ -0,0 +1,55 @@
+import json
+import random
+import unittest
+
+import pytest
+from pyarcade.games.blackjack import Blackjack
+from pyarcade.games.crazy_eights import CrazyEights
+from pyarcade.games.mastermind import Mastermind
+from pyarcade.input_system import InputSystem
+from pyarcade.views import ViewCache, mastermind_view, render_html, render_json, render_text
+
+
+@pytest.mark.local
+class ViewsTestCase(unittest.TestCase):
+    def test_mastermind_view(self):
+        game = Mastermind()
+        game.set_hidden_sequence([1, 2, 3, 4])
+        game.evaluate([1, 3, 5, 6])
+        view = mastermind_view(game)
+        self.assertEqual(("[1, 3, 5, 6]: 1 bulls and 1 cows",), view.sections[0].lines)
+        self.assertEqual(game.version, view.version)
+
+    def test_renderers(self):
+        view = mastermind_view(Mastermind())
+        self.assertIn("Mastermind\n\nNew game.\n", render_text(view))
+        self.assertTrue(render_html(view).startswith('<div class="game-view"><h3>Mastermind</h3>'))
+        self.assertEqual({"Guesses": []}, json.loads(render_json(view))["sections"])
+
+    def test_rendered_once_per_version(self):
+        cache = ViewCache()
+        game = CrazyEights(2, random.Random(1))
+        first = cache.render("crazy_eights", game)
+        self.assertIs(first, cache.render("crazy_eights", game))
+        self.assertIn("Top Card", first)
+
+        game.draw(1)
+        second = cache.render("crazy_eights", game)
+        self.assertIsNot(first, second)
+        self.assertIs(second, cache.render("crazy_eights", game))
+        self.assertIs(cache.get_view("crazy_eights", game), cache.get_view("crazy_eights", game))
+
+    def test_new_game_not_cached(self):
+        cache = ViewCache()
+        output = cache.render("blackjack", Blackjack(), "json")
+        self.assertIsNot(output, cache.render("blackjack", Blackjack(), "json"))
+        with self.assertRaises(ValueError):
+            cache.render("blackjack", Blackjack(), "pdf")
+
+    def test_continue(self):
+        input_sys = InputSystem()
+        input_sys.handle_game_input("Blackjack", "new game")
+        output = input_sys.handle_game_input("Blackjack", "continue")
+        self.assertIn("Current Hand", output)
+        self.assertIs(output, input_sys.handle_game_input("Blackjack", "continue"))
+        self.assertNotEqual("Game over.", input_sys.blackjack_game.game_state)